@@ -0,0 +1,174 @@
+import pytest
+from sympy import symbols
+
+from symbrim.bicycle import (
+    FlatGround,
+    KnifeEdgeWheel,
+    MasslessCranks,
+    NonHolonomicTire,
+    RigidFrontFrame,
+    RigidRearFrame,
+    StationaryBicycle,
+    WhippleBicycle,
+)
+from symbrim.brim import (
+    BicycleRider,
+    FixedSeat,
+    HolonomicHandGrips,
+    HolonomicPedals,
+    SideLeanSeat,
+)
+from symbrim.rider import (
+    FixedSacrum,
+    FlexRotLeftShoulder,
+    FlexRotRightShoulder,
+    PinElbowStickLeftArm,
+    PinElbowStickRightArm,
+    PlanarPelvis,
+    PlanarTorso,
+    Rider,
+    SphericalLeftHip,
+    SphericalRightHip,
+    TwoPinStickLeftLeg,
+    TwoPinStickRightLeg,
+)
+from symbrim.utilities.benchmarking import benchmark
+from symbrim.utilities.partitioning import find_partitions
+from symbrim.zoo import CONFIGURATIONS
+
+# Forming the equations of motion of the bicycle-rider models takes minutes, while
+# lambdifying them takes even longer. Therefore, only a single round is run and only
+# the rigid rider model is evaluated numerically. The models with hand grips or pedals
+# are marked as slow, such that they only run with the --run-slow option.
+ROUNDS = 1
+
+
+def create_whipple_bicycle():
+    bike = WhippleBicycle("bicycle")
+    bike.ground = FlatGround("ground")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    bike.front_frame = RigidFrontFrame("front_frame")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.rear_tire = NonHolonomicTire("rear_tire")
+    bike.front_tire = NonHolonomicTire("front_tire")
+    return bike
+
+
+def create_stationary_bicycle():
+    bike = StationaryBicycle("bicycle")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    bike.front_frame = RigidFrontFrame("front_frame")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.cranks = MasslessCranks("cranks")
+    return bike
+
+
+def create_rider(arms: bool = False, legs: bool = False):
+    rider = Rider("rider")
+    rider.pelvis = PlanarPelvis("pelvis")
+    rider.torso = PlanarTorso("torso")
+    rider.sacrum = FixedSacrum("sacrum")
+    if arms:
+        rider.left_arm = PinElbowStickLeftArm("left_arm")
+        rider.right_arm = PinElbowStickRightArm("right_arm")
+        rider.left_shoulder = FlexRotLeftShoulder("left_shoulder")
+        rider.right_shoulder = FlexRotRightShoulder("right_shoulder")
+    if legs:
+        rider.left_leg = TwoPinStickLeftLeg("left_leg")
+        rider.right_leg = TwoPinStickRightLeg("right_leg")
+        rider.left_hip = SphericalLeftHip("left_hip")
+        rider.right_hip = SphericalRightHip("right_hip")
+    return rider
+
+
+def configure_whipple_bicycle_rider(bicycle_rider, system):
+    bike, rider = bicycle_rider.bicycle, bicycle_rider.rider
+    system.apply_uniform_gravity(
+        -symbols("g") * bike.ground.get_normal(bike.ground.origin))
+    system.q_ind = [*bike.q[:4], *bike.q[5:]]
+    system.q_dep = [bike.q[4]]
+    system.u_ind = [bike.u[3], *bike.u[5:7]]
+    system.u_dep = [*bike.u[:3], bike.u[4], bike.u[7]]
+    if rider.left_arm is not None:
+        # The hand grips constrain the arms, such that they have no freedom left.
+        arms_q = [*rider.left_shoulder.q, *rider.right_shoulder.q, *rider.left_arm.q,
+                  *rider.right_arm.q]
+        arms_u = [*rider.left_shoulder.u, *rider.right_shoulder.u, *rider.left_arm.u,
+                  *rider.right_arm.u]
+        system.q_dep = [*system.q_dep, *arms_q]
+        system.u_dep = [*system.u_dep, *arms_u]
+
+
+def configure_stationary_bicycle_rider(bicycle_rider, system):
+    bike, rider = bicycle_rider.bicycle, bicycle_rider.rider
+    system.apply_uniform_gravity(-symbols("g") * system.frame.z)
+    # The pedals constrain the legs, such that only the hip flexion and knee
+    # flexion remain independent.
+    system.q_ind = [*bike.q, *bicycle_rider.seat.q, rider.left_hip.q[0],
+                    rider.left_leg.q[0], rider.right_hip.q[0], rider.right_leg.q[0]]
+    system.q_dep = [*rider.left_hip.q[1:], rider.left_leg.q[1], *rider.right_hip.q[1:],
+                    rider.right_leg.q[1], *rider.left_shoulder.q,
+                    *rider.right_shoulder.q, *rider.left_arm.q, *rider.right_arm.q]
+    system.u_ind = [*bike.u, *bicycle_rider.seat.u, rider.left_hip.u[0],
+                    rider.left_leg.u[0], rider.right_hip.u[0], rider.right_leg.u[0]]
+    system.u_dep = [*rider.left_hip.u[1:], rider.left_leg.u[1], *rider.right_hip.u[1:],
+                    rider.right_leg.u[1], *rider.left_shoulder.u,
+                    *rider.right_shoulder.u, *rider.left_arm.u, *rider.right_arm.u]
+
+
+@benchmark(rounds=ROUNDS, group="Bicycle-rider",
+           configure_system=configure_whipple_bicycle_rider,
+           constraint_solver="CRAMER")
+def test_whipple_bicycle_rigid_rider():
+    bicycle_rider = BicycleRider("bicycle_rider")
+    bicycle_rider.bicycle = create_whipple_bicycle()
+    bicycle_rider.rider = create_rider()
+    bicycle_rider.seat = FixedSeat("seat")
+    return bicycle_rider
+
+
+@pytest.mark.slow
+@benchmark(rounds=ROUNDS, group="Bicycle-rider", evaluate=False,
+           configure_system=configure_whipple_bicycle_rider,
+           constraint_solver="CRAMER")
+def test_whipple_bicycle_upper_body_rider():
+    bicycle_rider = BicycleRider("bicycle_rider")
+    bicycle_rider.bicycle = create_whipple_bicycle()
+    bicycle_rider.rider = create_rider(arms=True)
+    bicycle_rider.seat = FixedSeat("seat")
+    bicycle_rider.hand_grips = HolonomicHandGrips("hand_grips")
+    return bicycle_rider
+
+
+@pytest.mark.slow
+@benchmark(rounds=ROUNDS, group="Bicycle-rider", evaluate=False,
+           configure_system=configure_stationary_bicycle_rider,
+           constraint_solver="CRAMER")
+def test_stationary_bicycle_full_rider():
+    bicycle_rider = BicycleRider("bicycle_rider")
+    bicycle_rider.bicycle = create_stationary_bicycle()
+    bicycle_rider.rider = create_rider(arms=True, legs=True)
+    bicycle_rider.seat = SideLeanSeat("seat")
+    bicycle_rider.pedals = HolonomicPedals("pedals")
+    bicycle_rider.hand_grips = HolonomicHandGrips("hand_grips")
+    return bicycle_rider
+
+
+@pytest.mark.benchmark(group="Bicycle-rider partitioning")
+def test_bicycle_rider_find_partitions(benchmark):
+    system = CONFIGURATIONS["bicycle_rider"].create_system()
+    n_holonomic = len(system.holonomic_constraints)
+    n_velocity = n_holonomic + len(system.nonholonomic_constraints)
+    assert (n_holonomic, n_velocity) == (13, 17)
+    partitions = benchmark.pedantic(find_partitions, (system,), {"max_candidates": 2},
+                                    rounds=ROUNDS)
+    assert len(partitions) == 2
+    for partition in partitions:
+        assert len(partition.q_dep) == n_holonomic
+        assert len(partition.u_dep) == n_velocity
+        assert set(partition.q_ind).union(partition.q_dep) == set(system.q)
+        assert set(partition.u_ind).union(partition.u_dep) == set(system.u)
+    partitions[0].apply(system)
+    system.validate_system()
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+ROUNDS = 5
+
+
+def run_python(code: str) -> None:
+    # A subprocess is used, as the modules are cached after the first import.
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+@pytest.mark.benchmark(group="Import")
+def test_import_symbrim(benchmark) -> None:
+    benchmark.pedantic(run_python, args=("import symbrim",), rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="Import")
+def test_import_symbrim_model(benchmark) -> None:
+    benchmark.pedantic(run_python, args=("import symbrim; symbrim.WhippleBicycle",),
+                       rounds=ROUNDS)
+
+
+def test_optional_dependencies_not_imported() -> None:
+    # The optional dependencies should only be imported when they are used.
+    run_python(
+        "import sys, symbrim; symbrim.WhippleBicycle; "
+        "assert 'bicycleparameters' not in sys.modules; "
+        "assert 'symmeplot' not in sys.modules")
@@ -0,0 +1,81 @@
+import pytest
+from sympy import symbols
+from sympy.physics.mechanics import (
+    Force,
+    PinJoint,
+    RigidBody,
+    System,
+    dynamicsymbols,
+)
+
+from symbrim.core.base_classes import _merge_systems
+
+N_BODIES = 50
+ROUNDS = 10
+
+
+def create_systems(n_bodies: int = N_BODIES) -> list[System]:
+    """Create the systems of a synthetic binary tree of bodies.
+
+    Explanation
+    -----------
+    Each body is connected to its parent with a pin joint, whose system contains both
+    the parent and child body. Like the systems of models and connections, the systems
+    therefore share some of their bodies.
+    """
+    q, u = dynamicsymbols(f"q:{n_bodies}"), dynamicsymbols(f"u:{n_bodies}")
+    g = symbols("g")
+    bodies = [RigidBody(f"body{i}", mass=symbols(f"m{i}")) for i in range(n_bodies)]
+    ground = RigidBody("ground")
+    systems = [System.from_newtonian(ground)]
+    for i, body in enumerate(bodies):
+        parent = ground if i == 0 else bodies[(i - 1) // 2]
+        system = System(ground.frame, ground.masscenter)
+        system.add_bodies(*(() if i == 0 else (parent,)), body)
+        system.add_joints(PinJoint(f"joint{i}", parent, body, q[i], u[i],
+                                   parent_point=i * parent.frame.x))
+        system.add_loads(Force(body.masscenter, -body.mass * g * ground.z))
+        system.add_holonomic_constraints(q[i] - q[(i - 1) // 2])
+        systems.append(system)
+    return systems
+
+
+def merge_systems_one_by_one(*systems: System) -> System:
+    """Reference implementation, which adds the items to the system one by one."""
+    system = System(systems[0].frame, systems[0].fixed_point)
+    for s in systems:
+        attributes = [
+            ("q_ind", "q", "add_coordinates", {"independent": True}),
+            ("q_dep", "q", "add_coordinates", {"independent": False}),
+            ("u_ind", "u", "add_speeds", {"independent": True}),
+            ("u_dep", "u", "add_speeds", {"independent": False}),
+            ("u_aux", "u", "add_auxiliary_speeds", {}),
+            ("bodies", "bodies", "add_bodies", {}),
+            ("joints", "joints", "add_joints", {}),
+            ("loads", "loads", "add_loads", {}),
+            ("actuators", "actuators", "add_actuators", {}),
+            ("kdes", "kdes", "add_kdes", {}),
+            ("holonomic_constraints", "holonomic_constraints",
+             "add_holonomic_constraints", {}),
+            ("nonholonomic_constraints", "nonholonomic_constraints",
+             "add_nonholonomic_constraints", {}),
+        ]
+        for attr_to_add, attr_existing, add_method, kwargs in attributes:
+            for item in getattr(s, attr_to_add):
+                if item not in getattr(system, attr_existing):
+                    getattr(system, add_method)(item, **kwargs)
+        system.velocity_constraints = (
+            system.velocity_constraints[:] + s.velocity_constraints[:])
+    return system
+
+
+@pytest.mark.parametrize("merge", [_merge_systems, merge_systems_one_by_one],
+                         ids=["indexed", "one_by_one"])
+@pytest.mark.benchmark(group="merge_systems")
+def test_merge_systems(benchmark, merge) -> None:
+    systems = create_systems()
+    system = benchmark.pedantic(merge, args=systems, rounds=ROUNDS)
+    assert len(system.bodies) == N_BODIES + 1
+    assert len(system.joints) == N_BODIES
+    assert len(system.q) == N_BODIES
+    assert len(system.holonomic_constraints) == N_BODIES
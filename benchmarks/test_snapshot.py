@@ -0,0 +1,44 @@
+import pytest
+from sympy.core.cache import clear_cache
+
+from symbrim.bicycle import (
+    FlatGround,
+    KnifeEdgeWheel,
+    NonHolonomicTire,
+    RigidFrontFrame,
+    RigidRearFrame,
+    WhippleBicycleMoore,
+)
+
+ROUNDS = 3
+
+
+def create_whipple_bicycle():
+    bike = WhippleBicycleMoore("bike")
+    bike.ground = FlatGround("ground")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    bike.front_frame = RigidFrontFrame("front_frame")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.rear_tire = NonHolonomicTire("rear_tire")
+    bike.front_tire = NonHolonomicTire("front_tire")
+    return bike
+
+
+@pytest.mark.benchmark(group="Snapshot")
+def test_define_all(benchmark):
+    def define_all():
+        create_whipple_bicycle().define_all()
+
+    benchmark.pedantic(define_all, setup=clear_cache, rounds=ROUNDS)
+
+
+@pytest.mark.benchmark(group="Snapshot")
+def test_restore(benchmark):
+    bike = create_whipple_bicycle()
+    bike.define_all()
+    snapshot = bike.snapshot()
+    benchmark.extra_info["snapshot_size"] = len(snapshot)
+    restored = benchmark.pedantic(WhippleBicycleMoore.restore, args=(snapshot,),
+                                  setup=clear_cache, rounds=ROUNDS)
+    assert restored.to_system().q == bike.to_system().q
@@ -19,6 +19,8 @@ from symbrim.bicycle import (
     WhippleBicycleMoore,
 )
 from symbrim.utilities.benchmarking import benchmark
+from symbrim.utilities.parallel import ParallelKanesMethod
+from symbrim.utilities.partitioning import select_partition
 
 ROUNDS = 3
 
@@ -266,3 +268,28 @@ def test_whipple_bicycle_moore_full_coordinates():
 @benchmark(rounds=ROUNDS, group="Whipple bicycle Moore", constraint_solver="CRAMER")
 def test_whipple_bicycle_moore_brim():
     return create_whipple_bicycle_moore_brim()
+
+
+@benchmark(rounds=ROUNDS, group="Whipple bicycle Moore parallel", evaluate=False,
+           constraint_solver="CRAMER", eom_method=ParallelKanesMethod, processes=1)
+def test_whipple_bicycle_moore_brim_parallel_1():
+    return create_whipple_bicycle_moore_brim()
+
+
+@benchmark(rounds=ROUNDS, group="Whipple bicycle Moore parallel", evaluate=False,
+           constraint_solver="CRAMER", eom_method=ParallelKanesMethod, processes=2)
+def test_whipple_bicycle_moore_brim_parallel_2():
+    return create_whipple_bicycle_moore_brim()
+
+
+@benchmark(rounds=ROUNDS, group="Whipple bicycle Moore parallel", evaluate=False,
+           constraint_solver="CRAMER", eom_method=ParallelKanesMethod, processes=4)
+def test_whipple_bicycle_moore_brim_parallel_4():
+    return create_whipple_bicycle_moore_brim()
+
+
+@benchmark(rounds=ROUNDS, group="Whipple bicycle Moore")
+def test_whipple_bicycle_moore_brim_selected_partition():
+    system = create_whipple_bicycle_moore_brim()
+    select_partition(system)
+    return system
@@ -1,18 +1,42 @@
 """Module for simulating sympy.physics.mechanics.system.System objects."""
 from __future__ import annotations
 
-from collections.abc import Callable
+import hashlib
+import importlib.util
+import inspect
+import shutil
+import subprocess
+import sysconfig
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from pathlib import Path
 
 import numpy as np
 import numpy.typing as npt
-from scipy.integrate import solve_ivp
+import scipy.integrate
+from scipy.integrate import BDF, LSODA, OdeSolver, Radau, solve_ivp
+from scipy.linalg import lu_factor, lu_solve
+from scipy.linalg.lapack import dgetrf, dgetrs
 
 try:
     from scikits.odes import dae
 except ImportError:  # pragma: no cover
     dae: Callable | None = None
 from scipy.optimize import fsolve
-from sympy import Basic, Function, lambdify
+from sympy import (
+    Basic,
+    Dummy,
+    Function,
+    Matrix,
+    MatrixBase,
+    MatrixSymbol,
+    Symbol,
+    ccode,
+    cse,
+    lambdify,
+    srepr,
+)
 from sympy.physics.mechanics import (
     KanesMethod,
     System,
@@ -20,11 +44,393 @@ from sympy.physics.mechanics import (
     find_dynamicsymbols,
     msubs,
 )
+from sympy.utilities.iterables import iterable
+from sympy.utilities.lambdify import NUMPY_DEFAULT, NUMPY_TRANSLATIONS
 
 __all__ = ["Simulator"]
 
 
 array_type = npt.NDArray[np.float64]
+BACKENDS = ("lambdify", "c")
+IMPLICIT_METHODS = (BDF, LSODA, Radau)
+PROJECTION_UNSUPPORTED_OPTIONS = ("args", "dense_output", "events", "vectorized")
+NEWTON_TOLERANCE = 1e-12
+NEWTON_MAX_ITERATIONS = 50
+BATCH_FUNCTIONS = ("eval_configuration_newton", "eval_velocity_matrices")
+COMPILED_FUNCTIONS_CACHE_SIZE = 16
+
+# Generated functions shared by all simulators, keyed by ``_get_key``. Only the
+# functions of the ``COMPILED_FUNCTIONS_CACHE_SIZE`` most recently used keys are kept.
+_COMPILED_FUNCTIONS: OrderedDict[str, dict[str, Callable]] = OrderedDict()
+
+
+_C_MODULE_TEMPLATE = """\
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#include <numpy/arrayobject.h>
+#include <math.h>
+
+static int parse_array(PyObject *obj, npy_intp size, PyArrayObject **array) {{
+    *array = (PyArrayObject *)PyArray_FROMANY(
+        obj, NPY_DOUBLE, 0, 1, NPY_ARRAY_IN_ARRAY);
+    if (*array == NULL) {{
+        return 0;
+    }}
+    if (PyArray_SIZE(*array) != size) {{
+        PyErr_Format(PyExc_ValueError, "Expected an array of size %zd, got %zd.",
+                     (Py_ssize_t)size, (Py_ssize_t)PyArray_SIZE(*array));
+        return 0;
+    }}
+    return 1;
+}}
+
+static int parse_batch_array(PyObject *obj, npy_intp size, npy_intp *n_batch,
+                             PyArrayObject **array) {{
+    /* Parse an array of shape (n_batch, size), or (n_batch,) if size is negative. */
+    int ndim = size < 0 ? 1 : 2;
+    *array = (PyArrayObject *)PyArray_FROMANY(
+        obj, NPY_DOUBLE, ndim, ndim, NPY_ARRAY_IN_ARRAY);
+    if (*array == NULL) {{
+        return 0;
+    }}
+    if (*n_batch < 0) {{
+        *n_batch = PyArray_DIM(*array, 0);
+    }}
+    if (PyArray_DIM(*array, 0) != *n_batch || (ndim == 2 && PyArray_DIM(*array, 1) != size)) {{
+        PyErr_SetString(PyExc_ValueError, "Array has an invalid shape.");
+        return 0;
+    }}
+    return 1;
+}}
+
+static int parse_output(PyObject *obj, npy_intp size, double **data) {{
+    /* Get the data of a preallocated output array without copying it. */
+    if (!PyArray_Check(obj) || PyArray_TYPE((PyArrayObject *)obj) != NPY_DOUBLE ||
+            !PyArray_IS_C_CONTIGUOUS((PyArrayObject *)obj) ||
+            !PyArray_ISWRITEABLE((PyArrayObject *)obj)) {{
+        PyErr_SetString(PyExc_TypeError,
+                        "Output should be a writeable C-contiguous float64 array.");
+        return 0;
+    }}
+    if (PyArray_SIZE((PyArrayObject *)obj) != size) {{
+        PyErr_Format(PyExc_ValueError, "Expected an output of size %zd, got %zd.",
+                     (Py_ssize_t)size, (Py_ssize_t)PyArray_SIZE((PyArrayObject *)obj));
+        return 0;
+    }}
+    *data = (double *)PyArray_DATA((PyArrayObject *)obj);
+    return 1;
+}}
+{functions}
+static PyMethodDef methods[] = {{
+{method_defs}
+    {{NULL, NULL, 0, NULL}}
+}};
+
+static struct PyModuleDef module = {{
+    PyModuleDef_HEAD_INIT, "{module_name}", NULL, -1, methods}};
+
+PyMODINIT_FUNC PyInit_{module_name}(void) {{
+    import_array();
+    return PyModule_Create(&module);
+}}
+"""
+
+_C_WRAPPER_TEMPLATE = """
+static PyObject *py_{name}(PyObject *self, PyObject *const *args, Py_ssize_t nargs) {{
+    PyArrayObject *arrays[{n_arrays}] = {{NULL}};
+    PyObject *result = NULL;
+    if (nargs != {n_args}) {{
+        PyErr_SetString(PyExc_TypeError, "{name} takes {n_args} arguments.");
+        return NULL;
+    }}
+{parse_args}
+{create_outputs}
+    {name}({call_args});
+    result = {result};
+fail:
+    for (int i = 0; i < {n_arrays}; i++) {{
+        Py_XDECREF(arrays[i]);
+    }}
+    return result;
+}}
+"""
+
+_C_INTO_WRAPPER_TEMPLATE = """
+static PyObject *py_{name}_into(PyObject *self, PyObject *const *args,
+                                Py_ssize_t nargs) {{
+    PyArrayObject *arrays[{n_args}] = {{NULL}};
+    PyObject *result = NULL;
+    if (nargs != {n_args_outputs}) {{
+        PyErr_SetString(PyExc_TypeError, "{name}_into takes {n_args_outputs} arguments.");
+        return NULL;
+    }}
+{parse_args}
+{parse_outputs}
+    {name}({call_args});
+    result = Py_None;
+    Py_INCREF(result);
+fail:
+    for (int i = 0; i < {n_args}; i++) {{
+        Py_XDECREF(arrays[i]);
+    }}
+    return result;
+}}
+"""
+
+_C_BATCH_WRAPPER_TEMPLATE = """
+static PyObject *py_{name}_batch(PyObject *self, PyObject *const *args,
+                                 Py_ssize_t nargs) {{
+    PyArrayObject *arrays[{n_arrays}] = {{NULL}};
+    PyObject *result = NULL;
+    npy_intp n_batch = -1;
+    if (nargs != {n_args}) {{
+        PyErr_SetString(PyExc_TypeError, "{name}_batch takes {n_args} arguments.");
+        return NULL;
+    }}
+{parse_args}
+{create_outputs}
+    for (npy_intp k = 0; k < n_batch; k++) {{
+        {name}({call_args});
+    }}
+    result = {result};
+fail:
+    for (int i = 0; i < {n_arrays}; i++) {{
+        Py_XDECREF(arrays[i]);
+    }}
+    return result;
+}}
+"""
+
+
+def _generate_c_function(name: str, args: Sequence, outputs: Sequence[Sequence[Basic]]
+                         ) -> str:
+    """Generate the C code of a function including wrappers for Python.
+
+    Explanation
+    -----------
+    Besides the wrapper with the same signature as the lambdified function, a wrapper
+    with the suffix ``_batch`` is generated. This wrapper takes arrays with an
+    additional leading batch dimension, i.e. scalar arguments are arrays of shape
+    ``(n_batch,)`` and sequence arguments are arrays of shape ``(n_batch, n)``. It
+    evaluates the function for each row and returns arrays of shape
+    ``(n_batch, n_out)``. A wrapper with the suffix ``_into`` takes preallocated
+    output arrays as additional arguments, which it fills without allocating any
+    arrays, and returns None.
+    """
+    replacements, signature, parse_args, call_args = {}, [], [], []
+    parse_batch_args, batch_call_args = [], []
+    for i, arg in enumerate(args):
+        data = f"((const double *)PyArray_DATA(arrays[{i}]))"
+        if not iterable(arg):
+            replacements[arg] = Symbol(f"arg{i}")
+            signature.append(f"const double arg{i}")
+            parse_args.append(
+                f"    const double arg{i} = PyFloat_AsDouble(args[{i}]);\n"
+                f"    if (arg{i} == -1.0 && PyErr_Occurred()) goto fail;")
+            call_args.append(f"arg{i}")
+            parse_batch_args.append(
+                f"    if (!parse_batch_array(args[{i}], -1, &n_batch, &arrays[{i}]))"
+                " goto fail;")
+            batch_call_args.append(f"{data}[k]")
+        else:
+            arg_symbol = MatrixSymbol(f"arg{i}", max(len(arg), 1), 1)
+            replacements.update({xi: arg_symbol[j] for j, xi in enumerate(arg)})
+            signature.append(f"const double *arg{i}")
+            parse_args.append(
+                f"    if (!parse_array(args[{i}], {len(arg)}, &arrays[{i}])) goto fail;")
+            call_args.append(data)
+            parse_batch_args.append(
+                f"    if (!parse_batch_array(args[{i}], {len(arg)}, &n_batch, "
+                f"&arrays[{i}])) goto fail;")
+            batch_call_args.append(f"{data} + k * {len(arg)}")
+    create_outputs, create_batch_outputs, parse_outputs = [], [], []
+    for i, output in enumerate(outputs):
+        j = len(args) + i
+        signature.append(f"double *out{i}")
+        parse_outputs.append(
+            f"    double *out{i};\n"
+            f"    if (!parse_output(args[{j}], {len(output)}, &out{i})) goto fail;")
+        for create, dims in ((create_outputs, f"{len(output)}"),
+                             (create_batch_outputs, f"n_batch, {len(output)}")):
+            create.append(
+                f"    npy_intp dims{i}[] = {{{dims}}};\n"
+                f"    arrays[{j}] = (PyArrayObject *)PyArray_SimpleNew("
+                f"{dims.count(',') + 1}, dims{i}, NPY_DOUBLE);\n"
+                f"    if (arrays[{j}] == NULL) goto fail;")
+        call_args.append(f"(double *)PyArray_DATA(arrays[{j}])")
+        batch_call_args.append(f"(double *)PyArray_DATA(arrays[{j}]) + k * {len(output)}")
+    common, reduced = cse([expr.xreplace(replacements)
+                           for output in outputs for expr in output])
+    reduced_iter = iter(reduced)
+    body = [
+        *(f"    const double {ccode(sym)} = {ccode(expr)};" for sym, expr in common),
+        *(f"    out{i}[{j}] = {ccode(next(reduced_iter))};"
+          for i, output in enumerate(outputs) for j in range(len(output)))]
+    outs = [f"(PyObject *)arrays[{len(args) + i}]" for i in range(len(outputs))]
+    if len(outs) == 1:
+        result = f"{outs[0]};\n    Py_INCREF(result)"
+    else:
+        result = f"PyTuple_Pack({len(outs)}, {', '.join(outs)})"
+    kwargs = {"name": name, "n_args": len(args), "n_arrays": len(args) + len(outputs),
+              "result": result}
+    return (
+        f"\nstatic void {name}({', '.join(signature)}) {{\n" + "\n".join(body) +
+        "\n}\n" + _C_WRAPPER_TEMPLATE.format(
+            parse_args="\n".join(parse_args), create_outputs="\n".join(create_outputs),
+            call_args=", ".join(call_args), **kwargs) +
+        _C_INTO_WRAPPER_TEMPLATE.format(
+            name=name, n_args=len(args), n_args_outputs=len(args) + len(outputs),
+            parse_args="\n".join(parse_args), parse_outputs="\n".join(parse_outputs),
+            call_args=", ".join([*call_args[:len(args)], *(
+                f"out{i}" for i in range(len(outputs)))])) +
+        _C_BATCH_WRAPPER_TEMPLATE.format(
+            parse_args="\n".join(parse_batch_args),
+            create_outputs="\n".join(create_batch_outputs),
+            call_args=", ".join(batch_call_args), **kwargs))
+
+
+def _c_lambdify(functions: dict[str, tuple[Sequence, Sequence[Sequence[Basic]]]],
+                build_dir: str | Path | None = None, module_name: str | None = None
+                ) -> dict[str, Callable]:
+    """Generate C code for the functions and compile it into an extension module.
+
+    Parameters
+    ----------
+    functions : dict[str, tuple[Sequence, Sequence[Sequence[Basic]]]]
+        Mapping from the name of a function to its arguments and outputs. Each
+        argument is either a single symbol or a sequence of symbols, like the arguments
+        of ``lambdify``. Each output is a sequence of expressions.
+    build_dir : str | Path, optional
+        Directory to store the generated code and the compiled extension module. By
+        default a temporary directory is used, which is removed afterward.
+    module_name : str, optional
+        Name of the extension module. If an extension module with this name already
+        exists in ``build_dir``, then it is loaded instead of generating and compiling
+        the code again. By default the name is derived from the hash of the code.
+
+    Returns
+    -------
+    dict[str, Callable]
+        Compiled functions, which take the same arguments as the functions created
+        with ``lambdify``. A function returns a flat array if it has a single output,
+        otherwise it returns a tuple of flat arrays. For each function there is also a
+        version writing into preallocated outputs and a batched version, whose names
+        have the suffixes ``_into`` and ``_batch``.
+    """
+    if build_dir is None:
+        build_dir = tempfile.mkdtemp()
+        try:
+            return _c_lambdify(functions, build_dir, module_name)
+        finally:
+            # A loaded extension module remains usable after its file is removed. On
+            # Windows the file cannot be removed, in which case the directory is kept.
+            shutil.rmtree(build_dir, ignore_errors=True)
+    build_dir = Path(build_dir)
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX") or ".so"
+    if module_name is None or not (build_dir / (module_name + ext_suffix)).exists():
+        compiler = sysconfig.get_config_var("CC") or "cc"
+        if shutil.which(compiler.split()[0]) is None:
+            raise RuntimeError(
+                f"Compiler {compiler!r} to compile the C code is not found.")
+        build_dir.mkdir(parents=True, exist_ok=True)
+        c_functions = "".join(_generate_c_function(name, args, outputs)
+                              for name, (args, outputs) in functions.items())
+        if module_name is None:
+            module_name = (
+                f"simulator_{hashlib.sha256(c_functions.encode()).hexdigest()[:16]}")
+        source = _C_MODULE_TEMPLATE.format(
+            functions=c_functions, module_name=module_name, method_defs="\n".join(
+                f'    {{"{name}", (PyCFunction)(void (*)(void))py_{name}, '
+                f"METH_FASTCALL, NULL}},"
+                for base in functions
+                for name in (base, f"{base}_into", f"{base}_batch")))
+        source_file = build_dir / f"{module_name}.c"
+        source_file.write_text(source)
+        try:
+            subprocess.run([
+                *compiler.split(), "-O2", "-shared", "-fPIC",
+                f"-I{sysconfig.get_paths()['include']}", f"-I{np.get_include()}",
+                "-o", str(build_dir / (module_name + ext_suffix)), str(source_file),
+                "-lm",
+            ], check=True, capture_output=True, text=True)
+        except subprocess.CalledProcessError as e:
+            raise RuntimeError(f"Compiling the C code failed:\n{e.stderr}") from e
+    return _load_c_functions(build_dir / (module_name + ext_suffix))
+
+
+def _load_c_functions(path: Path) -> dict[str, Callable]:
+    """Load the functions of an extension module compiled by ``_c_lambdify``."""
+    spec = importlib.util.spec_from_file_location(path.name.split(".")[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return {name: getattr(module, name) for name in dir(module)
+            if not name.startswith("_")}
+
+
+def _get_numpy_namespace() -> dict[str, object]:
+    """Create a namespace to execute source code generated by ``lambdify``.
+
+    Explanation
+    -----------
+    The namespace equals the one of the NumPy module used by ``lambdify``, but it is
+    not shared with any other function.
+    """
+    namespace = dict(NUMPY_DEFAULT)
+    exec("import numpy; from numpy import *; from numpy.linalg import *",  # noqa: S102
+         namespace)
+    namespace.update({name: namespace[translation]
+                      for name, translation in NUMPY_TRANSLATIONS.items()})
+    return namespace
+
+
+def _get_key(root: object) -> str:
+    """Compute a stable key of nested sequences of expressions.
+
+    Explanation
+    -----------
+    The key is a hash over the structure, including the ordering, and the expressions.
+    The expressions are hashed as a Merkle tree of their directed acyclic graph, where
+    each unique node is only hashed once. Hashing the string representation instead is
+    much slower, because it repeats all shared subexpressions. Dummy symbols are
+    hashed by their name, as their index differs between processes.
+    """
+    digests: dict[int, bytes] = {}
+    nodes = []  # Keep the nodes alive to guarantee that their identities are unique.
+
+    def get_children(node: object) -> Sequence:
+        if isinstance(node, MatrixBase):
+            return list(node)
+        if isinstance(node, Basic):
+            return node.args
+        return node if isinstance(node, (tuple, list)) else ()
+
+    def get_label(node: object) -> str:
+        if isinstance(node, MatrixBase):
+            return f"Matrix{node.shape}"
+        if isinstance(node, Dummy):
+            return f"Dummy({node.name})"
+        if isinstance(node, Basic):
+            return type(node).__name__ if node.args else srepr(node)
+        return type(node).__name__ if iterable(node) else repr(node)
+
+    stack = [(root, False)]
+    while stack:
+        node, children_hashed = stack.pop()
+        if id(node) in digests:
+            continue
+        children = get_children(node)
+        if not children_hashed and children:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children
+                         if id(child) not in digests)
+            continue
+        node_hash = hashlib.sha256(get_label(node).encode())
+        for child in children:
+            node_hash.update(digests[id(child)])
+        digests[id(node)] = node_hash.digest()
+        nodes.append(node)
+    return digests[id(root)].hex()
 
 
 class Simulator:
@@ -43,7 +449,17 @@ class Simulator:
         self._r, self._r_funcs = (), ()
         self._eval_configuration_constraints = None
         self._eval_velocity_constraints = None
+        self._eval_configuration_newton_batch = None
+        self._eval_velocity_matrices_batch = None
         self._eval_eoms_matrices = None
+        self._eval_eoms_matrices_into = None
+        self._eval_eoms_matrices_batch = None
+        self._eval_jacobian_matrices = None
+        self._compiled = {}
+        self._eoms_outputs = ()
+        self._r_vals = np.array([], dtype=np.float64)
+        self._eoms_buffers = ()
+        self._explicit_kinematics = False
         self._initialized = False
         self._n_qind, self._n_qdep, self._n_q, self._n_uind, self._n_udep, self._n_u = (
             None, None, None, None, None, None)
@@ -131,54 +547,182 @@ class Simulator:
             else:
                 self.solve_initial_conditions()
 
-    def _eval_eoms_reshaped(self, t: float, x: array_type
-                            ) -> tuple[array_type, array_type]:
-        """Evaluate the equations of motion and reshape the output."""
-        mass_matrix, forcing = self._eval_eoms_matrices(
-            t, x, self._p_vals,
-            np.array([cf(t, x) for cf in self._r_funcs], dtype=np.float64))
-        return (mass_matrix.reshape((self._n_x, self._n_x)),
-                forcing.reshape((self._n_x,)))
+    def _eval_eoms_into(self, t: float, x: array_type
+                        ) -> tuple[array_type, array_type, array_type | None]:
+        """Evaluate the equations of motion into the preallocated buffers.
 
-    def _solve_configuration_constraints(
-            self, q_ind: array_type, q_dep_guess: array_type
+        Explanation
+        -----------
+        If the kinematic differential equations are explicit, then the dynamic mass
+        matrix and forcing vector are returned together with the time derivatives of
+        the generalized coordinates. Otherwise, the full mass matrix and forcing vector
+        are returned and the time derivatives are None. The returned arrays are the
+        buffers of the simulator, which are overwritten by the next evaluation.
+        """
+        for i, rf in enumerate(self._r_funcs):
+            self._r_vals[i] = rf(t, x)
+        self._eval_eoms_matrices_into(t, x, self._p_vals, self._r_vals,
+                                      *self._eoms_buffers)
+        if self._explicit_kinematics:
+            return self._eoms_buffers
+        return (*self._eoms_buffers, None)
+
+    def _solve_configuration_constraints_batch(
+            self, q_ind: array_type, q_dep_guess: array_type, p: array_type
     ) -> array_type:
-        """Solve the configuration constraints for the dependent coordinates."""
+        """Solve the configuration constraints for the dependent coordinates.
+
+        Explanation
+        -----------
+        The constraints are solved for all rows at once using Newton's method with the
+        symbolically derived Jacobian. Rows that do not converge are solved separately
+        using ``fsolve``, which is more robust for poor initial guesses. If the
+        Jacobian of any row is singular, then all unsolved rows are solved using
+        ``fsolve``.
+        """
+        q_dep = np.array(q_dep_guess, dtype=np.float64)
         if not self.system.q_dep:
-            return np.array([])
-        return np.array(fsolve(self._eval_configuration_constraints, q_dep_guess,
-                               args=(q_ind, self._p_vals)))
+            return q_dep
+        unsolved = np.ones(q_dep.shape[0], dtype=bool)
+        for _ in range(NEWTON_MAX_ITERATIONS):
+            residual, jacobian = self._eval_configuration_newton_batch(
+                q_dep[unsolved], q_ind[unsolved], p[unsolved])
+            converged = np.all(np.abs(residual) < NEWTON_TOLERANCE, axis=1)
+            try:
+                step = np.linalg.solve(
+                    jacobian.reshape((-1, self._n_qdep, self._n_qdep))[~converged],
+                    residual[~converged, :, np.newaxis])[:, :, 0]
+            except np.linalg.LinAlgError:
+                break  # The rows with a singular Jacobian are left to fsolve.
+            indices = np.flatnonzero(unsolved)
+            q_dep[indices[~converged]] -= step
+            unsolved[indices[converged]] = False
+            if not unsolved.any():
+                return q_dep
+        for i in np.flatnonzero(unsolved):
+            q_dep[i] = fsolve(
+                self._eval_configuration_constraints, q_dep_guess[i],
+                args=(q_ind[i], p[i]), fprime=lambda q_dep, q_ind, p: (
+                    self._eval_configuration_newton_batch(
+                        q_dep[np.newaxis], q_ind[np.newaxis], p[np.newaxis]
+                    )[1].reshape((self._n_qdep, self._n_qdep))))
+        return q_dep
 
-    def _solve_velocity_constraints(
-            self, q: array_type, u_ind: array_type, u_dep_guess: array_type
+    def _solve_velocity_constraints_batch(
+            self, q: array_type, u_ind: array_type, p: array_type
     ) -> array_type:
-        """Solve the velocity constraints for the dependent speeds."""
+        """Solve the velocity constraints, which are linear in the dependent speeds."""
         if not self.system.u_dep:
-            return np.array([])
-        return np.array(fsolve(self._eval_velocity_constraints, u_dep_guess,
-                               args=(q, u_ind, self._p_vals)))
+            return np.empty((q.shape[0], 0))
+        matrix, rhs = self._eval_velocity_matrices_batch(q, u_ind, p)
+        return np.linalg.solve(matrix.reshape((-1, self._n_udep, self._n_udep)),
+                               rhs[:, :, np.newaxis])[:, :, 0]
+
+    def solve_initial_conditions_batch(
+            self, q_ind: array_type, u_ind: array_type,
+            q_dep_guess: array_type | None = None, p: array_type | None = None
+    ) -> tuple[array_type, array_type]:
+        """Solve the dependent coordinates and speeds for many initial conditions.
+
+        Parameters
+        ----------
+        q_ind : array_type
+            Independent generalized coordinates with shape ``(n_batch, n_qind)``.
+        u_ind : array_type
+            Independent generalized speeds with shape ``(n_batch, n_uind)``.
+        q_dep_guess : array_type, optional
+            Initial guesses of the dependent generalized coordinates with shape
+            ``(n_batch, n_qdep)`` or ``(n_qdep,)``. By default the values in
+            ``initial_conditions`` are used, or zero if those are not given.
+        p : array_type, optional
+            Constants with shape ``(n_batch, n_p)`` or ``(n_p,)``, which are ordered
+            like the keys of ``constants``. By default the values of ``constants`` are
+            used.
+
+        Returns
+        -------
+        tuple[array_type, array_type]
+            The generalized coordinates with shape ``(n_batch, n_q)`` and the
+            generalized speeds with shape ``(n_batch, n_u)``.
+        """
+        if self._eval_velocity_constraints is None:
+            raise ValueError("Simulator has not been initialized yet.")
+        q_ind = np.atleast_2d(np.asarray(q_ind, dtype=np.float64))
+        n_batch = q_ind.shape[0]
+        u_ind = np.broadcast_to(np.asarray(u_ind, dtype=np.float64),
+                                (n_batch, self._n_uind))
+        if q_dep_guess is None:
+            q_dep_guess = [self.initial_conditions.get(qi, 0.)
+                           for qi in self.system.q_dep]
+        q_dep_guess = np.broadcast_to(np.asarray(q_dep_guess, dtype=np.float64),
+                                      (n_batch, self._n_qdep))
+        p = np.broadcast_to(np.asarray(self._p_vals if p is None else p,
+                                       dtype=np.float64), (n_batch, len(self._p)))
+        q = np.concatenate((q_ind, self._solve_configuration_constraints_batch(
+            q_ind, q_dep_guess, p)), axis=1)
+        u = np.concatenate((u_ind, self._solve_velocity_constraints_batch(
+            q, u_ind, p)), axis=1)
+        return q, u
+
+    def eval_constraint_drift(self, x: array_type) -> float:
+        """Evaluate the maximum absolute violation of the constraints for a state."""
+        q, u = x[:self._n_q], x[self._n_q:]
+        return max(
+            np.abs(self._eval_configuration_constraints(
+                q[self._n_qind:], q[:self._n_qind], self._p_vals)).max(initial=0.),
+            np.abs(self._eval_velocity_constraints(
+                u[self._n_uind:], q, u[:self._n_uind], self._p_vals)).max(initial=0.))
+
+    def project_state(self, x: array_type) -> array_type:
+        """Project a state onto the constraint manifold.
+
+        Explanation
+        -----------
+        The independent coordinates and speeds are kept fixed, while the dependent
+        coordinates are solved from the configuration constraints, starting from their
+        current values, and the dependent speeds from the velocity constraints.
+        """
+        q, u = self.solve_initial_conditions_batch(
+            x[np.newaxis, :self._n_qind], x[np.newaxis, self._n_q:self._n_q + self._n_uind],
+            x[np.newaxis, self._n_qind:self._n_q])
+        return np.concatenate((q[0], u[0]))
 
     def solve_initial_conditions(self) -> None:
         """Solve the initial conditions for the dependent coordinates and speeds."""
         if (self._eval_configuration_constraints is None or
                 self._eval_velocity_constraints is None):
             raise ValueError("Simulator has not been initialized yet.")
-        q_dep_guess = [self.initial_conditions.get(qi, 0.) for qi in self.system.q_dep]
-        q_ind = [self.initial_conditions[qi] for qi in self.system.q_ind]
-        q_dep = self._solve_configuration_constraints(
-            np.array(q_ind), np.array(q_dep_guess))
-        q0 = q_ind + list(q_dep)
-        u_dep_guess = [self.initial_conditions.get(ui, 0.) for ui in self.system.u_dep]
-        u_ind = [self.initial_conditions[ui] for ui in self.system.u_ind]
-        u_dep = self._solve_velocity_constraints(
-            np.array(q0), np.array(u_ind), np.array(u_dep_guess))
-        u0 = u_ind + list(u_dep)
-        for qi, q0i in zip(self.system.q, q0):
+        q, u = self.solve_initial_conditions_batch(
+            [self.initial_conditions[qi] for qi in self.system.q_ind],
+            [self.initial_conditions[ui] for ui in self.system.u_ind])
+        for qi, q0i in zip(self.system.q, q[0]):
             self.initial_conditions[qi] = q0i
-        for ui, u0i in zip(self.system.u, u0):
+        for ui, u0i in zip(self.system.u, u[0]):
             self.initial_conditions[ui] = u0i
 
-    def initialize(self, check_parameters: bool = False) -> None:
+    def _get_eoms_matrices(self, qdot_to_u: dict[Basic, Basic]
+                           ) -> tuple[Matrix, ...]:
+        """Get the matrices of the equations of motion to be evaluated numerically.
+
+        Explanation
+        -----------
+        The kinematic differential equations of Kane's method can be solved explicitly,
+        so only the dynamic equations need to be solved numerically. In that case the
+        dynamic mass matrix, the dynamic forcing vector and the time derivatives of the
+        generalized coordinates are returned. Otherwise, the full mass matrix and
+        forcing vector are returned.
+        """
+        self._explicit_kinematics = isinstance(self.system.eom_method, KanesMethod)
+        if not self._explicit_kinematics:
+            return self.system.mass_matrix_full, self.system.forcing_full
+        t = dynamicsymbols._t
+        return (self.system.mass_matrix, self.system.forcing,
+                Matrix([qdot_to_u[qi.diff(t)] for qi in self.system.q]))
+
+    def initialize(  # noqa: PLR0915
+        self, check_parameters: bool = False, backend: str = "lambdify",
+        jacobian: bool = False, cache_dir: str | Path | None = None
+    ) -> None:
         """Initialize the simulator.
 
         Parameters
@@ -186,9 +730,33 @@ class Simulator:
         check_parameters : bool, optional
             Whether the constants and initial conditions should be checked for
             consistency with the system, by default False.
+        backend : str, optional
+            Backend used to generate the numerical functions, by default "lambdify".
+            The options are:
+
+            - "lambdify": Python functions generated with ``sympy.lambdify``.
+            - "c": C functions compiled with the local C compiler. Generating and
+              compiling the code takes longer, but evaluating the equations of motion
+              is much faster.
+        jacobian : bool, optional
+            Whether to derive the Jacobian of the right-hand side with respect to the
+            state, by default False. The Jacobian is used by the implicit methods of
+            ``solve_ivp``, which otherwise approximate it using finite differences.
+            See :meth:`eval_jac` for details.
+        cache_dir : str | Path, optional
+            Directory in which the generated functions are cached on disk, by default
+            None. The functions are always cached in memory, such that simulators of
+            the same equations of motion share them. The key of the cache is a hash of
+            the equations of motion, the constraints, the orderings of the coordinates,
+            speeds, constants and inputs, the backend and ``jacobian``, so a changed
+            model results in new functions. The functions are only derived if they are
+            not cached. The cached files are executed or loaded when found, so only use
+            directories to which no one else can write.
         """
         if self._initialized:
             raise RuntimeError("Simulator has already been initialized.")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, choose from {BACKENDS}.")
         if self.system.eom_method is None:
             raise ValueError("Equations of motion have not been formed yet.")
         if self.constants is None:
@@ -218,7 +786,6 @@ class Simulator:
 
         qdot_to_u = self.system.eom_method.kindiffdict() if isinstance(
             self.system.eom_method, KanesMethod) else {}
-        t = dynamicsymbols._t
         self._n_qind, self._n_qdep = len(self.system.q_ind), len(self.system.q_dep)
         self._n_uind, self._n_udep = len(self.system.u_ind), len(self.system.u_dep)
         self._n_q, self._n_u = self._n_qind + self._n_qdep, self._n_uind + self._n_udep
@@ -229,38 +796,365 @@ class Simulator:
             self._r, self._r_funcs = zip(*self.inputs.items())
         else:
             self._r, self._r_funcs = (), ()
-        velocity_constraints = msubs(self.system.holonomic_constraints.diff(t).col_join(
-            self.system.nonholonomic_constraints), qdot_to_u)
-        self._eval_configuration_constraints = lambdify(
-            (self.system.q_dep, self.system.q_ind, self._p),
-            self.system.holonomic_constraints[:], cse=True)
-        self._eval_velocity_constraints = lambdify(
-            (self.system.u_dep, self.system.q, self.system.u_ind, self._p),
-            velocity_constraints[:], cse=True)
+        eoms_matrices = self._get_eoms_matrices(qdot_to_u)
         # Fix for https://github.com/numba/numba/issues/3709
-        self._eval_eoms_matrices = lambdify(
-            (t, self.system.q.col_join(self.system.u), self._p, self._r),
-            (self.system.mass_matrix_full.reshape(1, self._n_x * self._n_x),
-             self.system.forcing_full.reshape(1, self._n_x)), cse=True)
+        self._eoms_outputs = tuple(mat.reshape(1, len(mat)) for mat in eoms_matrices)
+        key = _get_key((
+            backend, jacobian, self.system.q_ind, self.system.q_dep,
+            self.system.u_ind, self.system.u_dep, self._p, self._r, eoms_matrices,
+            self.system.holonomic_constraints, self.system.nonholonomic_constraints,
+            tuple(qdot_to_u.items())))
+        compiled = self._compiled = self._compile_functions(
+            key, lambda: self._derive_functions(qdot_to_u, eoms_matrices, jacobian),
+            backend, cache_dir)
+        self._eval_configuration_constraints = compiled[
+            "eval_configuration_constraints"]
+        self._eval_velocity_constraints = compiled["eval_velocity_constraints"]
+        self._eval_eoms_matrices = compiled["eval_eoms_matrices"]
+        self._eval_eoms_matrices_into = compiled["eval_eoms_matrices_into"]
+        # The batched function of the lambdify backend is only created when needed.
+        self._eval_eoms_matrices_batch = compiled.get("eval_eoms_matrices_batch")
+        self._eval_jacobian_matrices = compiled.get("eval_jacobian_matrices")
+        self._eval_configuration_newton_batch = compiled.get(
+            "eval_configuration_newton_batch")
+        self._eval_velocity_matrices_batch = compiled.get("eval_velocity_matrices_batch")
+        # Buffers reused by each evaluation of the right-hand side.
+        self._r_vals = np.empty(len(self._r), dtype=np.float64)
+        n = self._n_u if self._explicit_kinematics else self._n_x
+        self._eoms_buffers = (np.empty((n, n), dtype=np.float64),
+                              np.empty(n, dtype=np.float64))
+        if self._explicit_kinematics:
+            self._eoms_buffers += (np.empty(self._n_q, dtype=np.float64),)
         self.solve_initial_conditions()
         self._initialized = True
 
-    def eval_rhs(self, t: np.float64, x: array_type) -> array_type:
-        """Evaluate the right-hand side of the equations of motion."""
-        mass_matrix, forcing = self._eval_eoms_reshaped(t, x)
-        return np.linalg.solve(mass_matrix, forcing)
+    def eval_rhs(self, t: np.float64, x: array_type, out: array_type | None = None
+                 ) -> array_type:
+        """Evaluate the right-hand side of the equations of motion.
+
+        Explanation
+        -----------
+        The equations of motion are evaluated into buffers, which are allocated upon
+        initialization, and the linear system is solved in place. With the C backend,
+        only the returned array is allocated, unless ``out`` is given. The result is
+        then written into ``out``, which should have shape ``(n_x,)``. Note that
+        ``solve_ivp`` requires a new array to be returned for each evaluation.
+        """
+        mass_matrix, forcing, qdot = self._eval_eoms_into(t, x)
+        # The transpose of the row-major mass matrix is column-major, such that LAPACK
+        # can factorize it in place. The transpose is undone by solving with trans=1.
+        lu, piv, info = dgetrf(mass_matrix.T, overwrite_a=True)
+        if info > 0:
+            raise np.linalg.LinAlgError("Mass matrix is singular.")
+        solution = dgetrs(lu, piv, forcing, trans=1, overwrite_b=True)[0]
+        if out is None:
+            out = np.empty(self._n_x, dtype=np.float64)
+        if qdot is None:
+            out[:] = solution
+        else:
+            out[:self._n_q] = qdot
+            out[self._n_q:] = solution
+        return out
+
+    def _derive_functions(
+        self, qdot_to_u: dict[Basic, Basic], eoms_matrices: Sequence[Matrix],
+        jacobian: bool
+    ) -> dict[str, tuple[Sequence, Sequence[Matrix]]]:
+        """Derive the arguments and outputs of the functions to be generated."""
+        t = dynamicsymbols._t
+        velocity_constraints = msubs(self.system.holonomic_constraints.diff(t).col_join(
+            self.system.nonholonomic_constraints), qdot_to_u)
+        return {
+            **(self._jacobian_functions(eoms_matrices) if jacobian else {}),
+            **self._constraint_solver_functions(velocity_constraints),
+            "eval_configuration_constraints": (
+                (self.system.q_dep, self.system.q_ind, self._p),
+                (self.system.holonomic_constraints[:],)),
+            "eval_velocity_constraints": (
+                (self.system.u_dep, self.system.q, self.system.u_ind, self._p),
+                (velocity_constraints[:],)),
+            "eval_eoms_matrices": (
+                (t, self.system.q.col_join(self.system.u), self._p, self._r),
+                self._eoms_outputs),
+        }
+
+    def _jacobian_functions(self, eoms_matrices: Sequence[Matrix]
+                            ) -> dict[str, tuple[Sequence, Sequence[Matrix]]]:
+        """Derive the expressions to evaluate the Jacobian of the right-hand side.
+
+        Explanation
+        -----------
+        The right-hand side of the dynamic equations is ``M(x)^-1 F(x)``, which is
+        never solved symbolically. Therefore, its Jacobian is computed numerically from
+        ``M(x)^-1 (dF/dx - d(M(x) a)/dx)``, where ``a`` is set to the solution of the
+        dynamic equations. This method derives ``dF/dx - d(M(x) a)/dx`` with ``a`` as
+        additional argument, and the Jacobian of the kinematic differential equations
+        if those are explicit.
+        """
+        t = dynamicsymbols._t
+        x = self.system.q.col_join(self.system.u)
+        mass_matrix, forcing = eoms_matrices[:2]
+        a = Matrix([Dummy(f"a{i}") for i in range(len(forcing))])
+        outputs = [forcing.jacobian(x) - (mass_matrix * a).jacobian(x)]
+        if self._explicit_kinematics:
+            outputs.append(eoms_matrices[2].jacobian(x))
+        # Fix for https://github.com/numba/numba/issues/3709
+        outputs = tuple(mat.reshape(1, len(mat)) for mat in outputs)
+        return {"eval_jacobian_matrices": ((t, x, self._p, self._r, a), outputs)}
+
+    def eval_jac(self, t: float, x: array_type) -> array_type:
+        """Evaluate the Jacobian of the right-hand side with respect to the state.
+
+        Explanation
+        -----------
+        The Jacobian is derived symbolically upon initialization if ``jacobian=True``.
+        The inputs are considered to be independent of the state.
+        """
+        if self._eval_jacobian_matrices is None:
+            raise RuntimeError("Simulator has not been initialized with jacobian=True.")
+        mass_matrix, forcing, _ = self._eval_eoms_into(t, x)
+        lu = lu_factor(mass_matrix)
+        outputs = self._eval_jacobian_matrices(
+            t, x, self._p_vals,
+            np.array([cf(t, x) for cf in self._r_funcs], dtype=np.float64),
+            lu_solve(lu, forcing))
+        if not self._explicit_kinematics:
+            return lu_solve(lu, outputs.reshape((self._n_x, self._n_x)))
+        return np.concatenate((
+            outputs[1].reshape((self._n_q, self._n_x)),
+            lu_solve(lu, outputs[0].reshape((self._n_u, self._n_x)))))
+
+    def _constraint_solver_functions(self, velocity_constraints: Matrix
+                                     ) -> dict[str, tuple[Sequence, Sequence[Matrix]]]:
+        """Derive the expressions to solve the constraints for the dependent variables.
+
+        Explanation
+        -----------
+        The configuration constraints are solved with Newton's method, for which their
+        Jacobian with respect to the dependent coordinates is derived. The velocity
+        constraints are linear in the dependent speeds, ``A(q) u_dep = b(q, u_ind)``,
+        such that they can be solved directly as a linear system.
+        """
+        functions = {}
+        if self.system.q_dep:
+            hol = self.system.holonomic_constraints
+            functions["eval_configuration_newton"] = (
+                (self.system.q_dep, self.system.q_ind, self._p),
+                (hol.reshape(1, len(hol)),
+                 hol.jacobian(self.system.q_dep).reshape(1, self._n_qdep ** 2)))
+        if self.system.u_dep:
+            matrix = velocity_constraints.jacobian(self.system.u_dep)
+            rhs = -velocity_constraints.xreplace(dict.fromkeys(self.system.u_dep, 0))
+            functions["eval_velocity_matrices"] = (
+                (self.system.q, self.system.u_ind, self._p),
+                (matrix.reshape(1, self._n_udep ** 2), rhs.reshape(1, self._n_udep)))
+        return functions
+
+    @staticmethod
+    def _compile_functions(
+        key: str, derive_functions: Callable[[], dict], backend: str,
+        cache_dir: str | Path | None
+    ) -> dict[str, Callable]:
+        """Get the compiled functions from the cache or compile them.
+
+        Explanation
+        -----------
+        The functions are only derived if they are neither cached in memory nor in
+        ``cache_dir``.
+        """
+        if key in _COMPILED_FUNCTIONS:
+            _COMPILED_FUNCTIONS.move_to_end(key)
+            return _COMPILED_FUNCTIONS[key]
+        if backend == "c":
+            module_name = f"simulator_{key[:16]}"
+            path = None if cache_dir is None else Path(cache_dir) / (
+                module_name + (sysconfig.get_config_var("EXT_SUFFIX") or ".so"))
+            if path is not None and path.exists():
+                compiled = _load_c_functions(path)
+            else:
+                compiled = _c_lambdify(derive_functions(), cache_dir, module_name)
+        else:
+            path = (None if cache_dir is None else
+                    Path(cache_dir) / f"lambdify_{key[:16]}.py")
+            if path is not None and path.exists():
+                compiled = Simulator._load_lambdified_functions(path)
+            else:
+                compiled = Simulator._lambdify_functions(derive_functions(), path)
+        _COMPILED_FUNCTIONS[key] = compiled
+        while len(_COMPILED_FUNCTIONS) > COMPILED_FUNCTIONS_CACHE_SIZE:
+            _COMPILED_FUNCTIONS.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def _lambdify_functions(
+        functions: dict[str, tuple[Sequence, Sequence[Matrix]]], path: Path | None
+    ) -> dict[str, Callable]:
+        """Lambdify the functions, optionally storing their source code on disk.
+
+        Explanation
+        -----------
+        For each function a version writing into preallocated outputs is created with
+        the suffix ``_into``, like the C backend. For the functions in
+        ``BATCH_FUNCTIONS`` also a batched version is created. If a path is given,
+        then the source code of the lambdified functions is stored in it together with
+        the number of their arguments and outputs. As the source code only uses the
+        NumPy namespace of ``lambdify``, it can be executed again in later processes,
+        which is much faster than lambdifying the expressions.
+        """
+        sizes = {name: [len(output) for output in functions[name][1]]
+                 for name in BATCH_FUNCTIONS if name in functions}
+        functions = {
+            **functions,
+            **{f"{name}_entries": (functions[name][0], (
+                [expr for output in functions[name][1] for expr in output],))
+               for name in sizes},
+        }
+        signatures = {name: (len(args), len(outputs))
+                      for name, (args, outputs) in functions.items()}
+        compiled = {
+            name: lambdify(args, outputs[0] if len(outputs) == 1 else outputs,
+                           cse=True)
+            for name, (args, outputs) in functions.items()}
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("\n\n".join((
+                *(inspect.getsource(function).replace(
+                    "def _lambdifygenerated(", f"def {name}(", 1)
+                  for name, function in compiled.items()),
+                f"SIGNATURES = {signatures!r}\nBATCH_SIZES = {sizes!r}\n")))
+        return Simulator._complete_lambdified_functions(compiled, signatures, sizes)
+
+    @staticmethod
+    def _load_lambdified_functions(path: Path) -> dict[str, Callable]:
+        """Load the functions stored by ``_lambdify_functions``."""
+        namespace = _get_numpy_namespace()
+        exec(path.read_text(), namespace)  # noqa: S102
+        signatures = namespace["SIGNATURES"]
+        return Simulator._complete_lambdified_functions(
+            {name: namespace[name] for name in signatures}, signatures,
+            namespace["BATCH_SIZES"])
+
+    @staticmethod
+    def _complete_lambdified_functions(
+        compiled: dict[str, Callable], signatures: dict[str, tuple[int, int]],
+        sizes: dict[str, Sequence[int]]
+    ) -> dict[str, Callable]:
+        """Add the batched and ``_into`` versions of the lambdified functions."""
+        for name, output_sizes in sizes.items():
+            compiled[f"{name}_batch"] = Simulator._batch_from_entries(
+                compiled.pop(f"{name}_entries"), output_sizes)
+        for name, (n_args, n_outputs) in signatures.items():
+            if name in compiled:
+                compiled[f"{name}_into"] = Simulator._into_from_function(
+                    compiled[name], n_args, n_outputs)
+        return compiled
+
+    @staticmethod
+    def _into_from_function(function: Callable, n_args: int, n_outputs: int
+                            ) -> Callable:
+        """Create a function writing the outputs into preallocated arrays."""
+        def eval_into(*args_outputs: array_type) -> None:
+            values = function(*args_outputs[:n_args])
+            for out, value in zip(args_outputs[n_args:],
+                                  (values,) if n_outputs == 1 else values):
+                out[...] = np.reshape(value, out.shape)
+
+        return eval_into
+
+    @staticmethod
+    def _batch_from_entries(eval_entries: Callable, sizes: Sequence[int]
+                            ) -> Callable:
+        """Create a batched function from a function evaluating the flat entries.
+
+        Explanation
+        -----------
+        The returned function takes each argument with an additional leading batch
+        dimension and returns each output with shape ``(n_batch, size)``.
+        """
+        def eval_batch(*batch_args: array_type) -> tuple[array_type, ...]:
+            n_batch = np.shape(batch_args[-1])[0]
+            # Entries are either scalars or arrays of shape (n_batch,).
+            entries = np.empty((sum(sizes), n_batch))
+            for i, entry in enumerate(eval_entries(
+                    *(np.asarray(arg).T for arg in batch_args))):
+                entries[i] = entry
+            return tuple(entries[start:start + size].T for start, size in zip(
+                np.cumsum([0, *sizes[:-1]]), sizes))
+
+        return eval_batch
+
+    @staticmethod
+    def _lambdify_batch(args: Sequence, outputs: Sequence[Matrix]) -> Callable:
+        """Lambdify matrices to be evaluated for a batch of arguments."""
+        return Simulator._batch_from_entries(
+            lambdify(args, [expr for output in outputs for expr in output], cse=True),
+            [len(output) for output in outputs])
+
+    def eval_rhs_batch(self, t: float | array_type, x: array_type,
+                       p: array_type | None = None, r: array_type | None = None
+                       ) -> array_type:
+        """Evaluate the right-hand side of the equations of motion for many states.
+
+        Parameters
+        ----------
+        t : float | array_type
+            Time or array of times with shape ``(n_batch,)``.
+        x : array_type
+            States with shape ``(n_batch, n_x)``.
+        p : array_type, optional
+            Constants with shape ``(n_batch, n_p)`` or ``(n_p,)``, which are ordered
+            like the keys of ``constants``. By default the values of ``constants`` are
+            used.
+        r : array_type, optional
+            Inputs with shape ``(n_batch, n_r)`` or ``(n_r,)``, which are ordered like
+            the keys of ``inputs``. By default the input functions are evaluated for
+            each state.
+
+        Returns
+        -------
+        array_type
+            Time derivatives of the states with shape ``(n_batch, n_x)``.
+        """
+        if not self._initialized:
+            raise RuntimeError("Simulator has not been initialized yet.")
+        if self._eval_eoms_matrices_batch is None:
+            # The function is stored in the shared functions to reuse it as well.
+            self._eval_eoms_matrices_batch = self._compiled[
+                "eval_eoms_matrices_batch"] = self._lambdify_batch(
+                (dynamicsymbols._t, self.system.q.col_join(self.system.u), self._p,
+                 self._r), self._eoms_outputs)
+        x = np.asarray(x, dtype=np.float64)
+        n_batch = x.shape[0]
+        t = np.broadcast_to(np.asarray(t, dtype=np.float64), (n_batch,))
+        if p is None:
+            p = self._p_vals
+        p = np.broadcast_to(np.asarray(p, dtype=np.float64), (n_batch, len(self._p)))
+        if r is None:
+            r = [[rf(ti, xi) for rf in self._r_funcs] for ti, xi in zip(t, x)]
+        r = np.broadcast_to(np.asarray(r, dtype=np.float64), (n_batch, len(self._r)))
+        mass_matrices, forcings, *qdots = self._eval_eoms_matrices_batch(t, x, p, r)
+        n = self._n_u if self._explicit_kinematics else self._n_x
+        solution = np.linalg.solve(mass_matrices.reshape((n_batch, n, n)),
+                                   forcings.reshape((n_batch, n, 1)))[:, :, 0]
+        if not self._explicit_kinematics:
+            return solution
+        return np.concatenate((qdots[0], solution), axis=1)
 
     def _eval_eoms(self, t: float, x: array_type, xd: array_type, residual: array_type
                    ) -> None:
         """Evaluate the residual vector of the equations of motion."""
-        mass_matrix, forcing = self._eval_eoms_reshaped(t, x)
+        mass_matrix, forcing, qdot = self._eval_eoms_into(t, x)
 
         n_nh = self._n_udep - self._n_qdep
         q, u = x[:self._n_q], x[self._n_q:]
         q_ind, q_dep = q[:self._n_qind], q[self._n_qind:]
         u_ind, u_dep = u[:-self._n_udep], u[-self._n_udep:]
 
-        residual[:self._n_x] = mass_matrix @ xd - forcing
+        if qdot is None:
+            residual[:self._n_x] = mass_matrix @ xd - forcing
+        else:
+            residual[:self._n_q] = xd[:self._n_q] - qdot
+            residual[self._n_q:self._n_x] = mass_matrix @ xd[self._n_q:] - forcing
         if self._n_qdep != 0:
             residual[self._n_x - self._n_udep:-n_nh] = (
                 self._eval_configuration_constraints(q_dep, q_ind, self._p_vals))
@@ -268,10 +1162,65 @@ class Simulator:
             residual[-n_nh:] = self._eval_velocity_constraints(
                 u_dep, q, u_ind, self._p_vals)[-n_nh:]
 
+    def _solve_ivp_projected(
+        self, t_span: tuple[float, float], x0: array_type,
+        projection_interval: int | None, projection_tolerance: float | None,
+        method: str | type[OdeSolver] = "RK45", t_eval: array_type | None = None,
+        **options: object,
+    ) -> tuple[array_type, array_type]:
+        """Integrate the equations of motion while projecting onto the constraints.
+
+        Explanation
+        -----------
+        ``solve_ivp`` does not allow modifying the state during the integration.
+        Therefore, the integration is stepped manually with the ``OdeSolver`` of
+        ``solve_ivp``, which is restarted from the projected state with the last step
+        size. The options of ``solve_ivp`` that are not passed to the ``OdeSolver``,
+        like ``events`` and ``dense_output``, are not supported.
+        """
+        unsupported = [name for name in PROJECTION_UNSUPPORTED_OPTIONS
+                       if name in options]
+        if unsupported:
+            raise ValueError(f"The options {unsupported} of solve_ivp are not supported "
+                             f"when projecting the state.")
+        solver_class = getattr(scipy.integrate, method) if isinstance(
+            method, str) else method
+        t_final = t_span[-1]
+        solver = solver_class(self.eval_rhs, t_span[0], x0, t_final, **options)
+        ts, xs = ([solver.t], [solver.y]) if t_eval is None else ([], [])
+        n_steps, i_eval = 0, 0
+        while solver.status == "running":
+            message = solver.step()
+            if solver.status == "failed":
+                raise RuntimeError(f"Integration failed: {message}")
+            n_steps += 1
+            if t_eval is not None:
+                i_next = np.searchsorted(t_eval, solver.t, side="right")
+                if i_next > i_eval:
+                    ts.extend(t_eval[i_eval:i_next])
+                    xs.extend(solver.dense_output()(t_eval[i_eval:i_next]).T)
+                i_eval = i_next
+            x = solver.y
+            if ((projection_interval and n_steps % projection_interval == 0) or (
+                    projection_tolerance is not None and
+                    self.eval_constraint_drift(x) > projection_tolerance)):
+                x = self.project_state(x)
+                if solver.status == "running":
+                    solver = solver_class(
+                        self.eval_rhs, solver.t, x, t_final,
+                        **{**options, "first_step": min(
+                            solver.step_size, abs(t_final - solver.t))})
+            if t_eval is None:
+                ts.append(solver.t)
+                xs.append(x)
+        return np.array(ts), np.array(xs).reshape((-1, self._n_x)).T
+
     def solve(
         self,
         t_span: tuple[float, float] | array_type,
         solver: str = "solve_ivp",
+        projection_interval: int | None = None,
+        projection_tolerance: float | None = None,
         **kwargs: dict[str, object],
     ) -> tuple[array_type, array_type]:
         """Simulate the system.
@@ -283,8 +1232,21 @@ class Simulator:
             evaluate the solution in case of a DAE solver.
         solver : str, optional
             The solver to use, by default "solve_ivp".
+        projection_interval : int, optional
+            Number of integration steps after which the state is projected onto the
+            constraint manifold using :meth:`project_state`. Only supported by the
+            "solve_ivp" solver. By default the state is not projected periodically.
+        projection_tolerance : float, optional
+            Maximum constraint violation, see :meth:`eval_constraint_drift`, above which
+            the state is projected onto the constraint manifold after an integration
+            step. Only supported by the "solve_ivp" solver. By default the state is not
+            projected upon drift detection.
         **kwargs
-            Keyword arguments to pass to `scipy.integrate.solve_ivp`.
+            Keyword arguments to pass to `scipy.integrate.solve_ivp`. If the simulator
+            is initialized with ``jacobian=True`` and an implicit method is used, then
+            :meth:`eval_jac` is passed as ``jac`` unless specified otherwise. When
+            projecting the state, the options ``args``, ``dense_output``, ``events``
+            and ``vectorized`` are not supported.
 
         Returns
         -------
@@ -297,9 +1259,19 @@ class Simulator:
         x0 = np.array([self.initial_conditions[xi] for xi in self.system.q.col_join(
             self.system.u)])
         if solver == "solve_ivp":
-            sol = solve_ivp(self.eval_rhs, t_span, x0, **kwargs)
-            self._t = sol.t
-            self._x = sol.y
+            method = kwargs.get("method", "RK45")
+            if isinstance(method, str):
+                method = getattr(scipy.integrate, method, None)
+            if (self._eval_jacobian_matrices is not None and
+                    isinstance(method, type) and issubclass(method, IMPLICIT_METHODS)):
+                kwargs.setdefault("jac", self.eval_jac)
+            if projection_interval is not None or projection_tolerance is not None:
+                self._t, self._x = self._solve_ivp_projected(
+                    t_span, x0, projection_interval, projection_tolerance, **kwargs)
+            else:
+                sol = solve_ivp(self.eval_rhs, t_span, x0, **kwargs)
+                self._t = sol.t
+                self._x = sol.y
         elif solver == "dae":  # pragma: no cover
             if dae is None:
                 raise ImportError("scikits.odes is not installed.")
@@ -3,6 +3,9 @@
 A Modular and Extensible Open-Source Framework for Creating Symbolic Bicycle-Rider
 Models.
 """
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
 
 __all__ = [
     "WhippleBicycle", "StationaryBicycle",
@@ -46,46 +49,67 @@ __all__ = [
     "HolonomicPedals",
 ]
 
-from symbrim.bicycle import (
-    FlatGround,
-    InContactTire,
-    KnifeEdgeWheel,
-    MasslessCranks,
-    NonHolonomicTire,
-    RigidFrontFrame,
-    RigidRearFrame,
-    StationaryBicycle,
-    SuspensionRigidFrontFrame,
-    ToroidalWheel,
-    WhippleBicycle,
-)
-from symbrim.brim import (
-    BicycleRider,
-    FixedSeat,
-    HolonomicHandGrips,
-    HolonomicPedals,
-    SideLeanSeat,
-)
-from symbrim.rider import (
-    FixedSacrum,
-    FlexAddLeftShoulder,
-    FlexAddRightShoulder,
-    FlexRotLeftShoulder,
-    FlexRotRightShoulder,
-    PinElbowStickLeftArm,
-    PinElbowStickRightArm,
-    PinLeftHip,
-    PinRightHip,
-    PlanarPelvis,
-    PlanarTorso,
-    Rider,
-    SphericalLeftHip,
-    SphericalLeftShoulder,
-    SphericalRightHip,
-    SphericalRightShoulder,
-    TwoPinStickLeftLeg,
-    TwoPinStickRightLeg,
-)
+if TYPE_CHECKING:
+    from symbrim.bicycle import (
+        FlatGround,
+        InContactTire,
+        KnifeEdgeWheel,
+        MasslessCranks,
+        NonHolonomicTire,
+        RigidFrontFrame,
+        RigidRearFrame,
+        StationaryBicycle,
+        SuspensionRigidFrontFrame,
+        ToroidalWheel,
+        WhippleBicycle,
+    )
+    from symbrim.brim import (
+        BicycleRider,
+        FixedSeat,
+        HolonomicHandGrips,
+        HolonomicPedals,
+        SideLeanSeat,
+    )
+    from symbrim.rider import (
+        FixedSacrum,
+        FlexAddLeftShoulder,
+        FlexAddRightShoulder,
+        FlexRotLeftShoulder,
+        FlexRotRightShoulder,
+        PinElbowStickLeftArm,
+        PinElbowStickRightArm,
+        PinLeftHip,
+        PinRightHip,
+        PlanarPelvis,
+        PlanarTorso,
+        Rider,
+        SphericalLeftHip,
+        SphericalLeftShoulder,
+        SphericalRightHip,
+        SphericalRightShoulder,
+        TwoPinStickLeftLeg,
+        TwoPinStickRightLeg,
+    )
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "bicycle": (
+        "FlatGround", "InContactTire", "KnifeEdgeWheel", "MasslessCranks",
+        "NonHolonomicTire", "RigidFrontFrame", "RigidRearFrame", "StationaryBicycle",
+        "SuspensionRigidFrontFrame", "ToroidalWheel", "WhippleBicycle",
+    ),
+    "brim": (
+        "BicycleRider", "FixedSeat", "HolonomicHandGrips", "HolonomicPedals",
+        "SideLeanSeat",
+    ),
+    "rider": (
+        "FixedSacrum", "FlexAddLeftShoulder", "FlexAddRightShoulder",
+        "FlexRotLeftShoulder", "FlexRotRightShoulder", "PinElbowStickLeftArm",
+        "PinElbowStickRightArm", "PinLeftHip", "PinRightHip", "PlanarPelvis",
+        "PlanarTorso", "Rider", "SphericalLeftHip", "SphericalLeftShoulder",
+        "SphericalRightHip", "SphericalRightShoulder", "TwoPinStickLeftLeg",
+        "TwoPinStickRightLeg",
+    ),
+})
 
 try:
     from importlib.metadata import PackageNotFoundError, version
@@ -1,4 +1,8 @@
 """Bicycle module."""
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
+
 __all__ = [
     "BicycleBase",
     "StationaryBicycle",
@@ -12,22 +16,40 @@ __all__ = [
     "CranksBase", "MasslessCranks",
 ]
 
-from symbrim.bicycle.bicycle_base import BicycleBase
-from symbrim.bicycle.cranks import CranksBase, MasslessCranks
-from symbrim.bicycle.front_frames import (
-    FrontFrameBase,
-    RigidFrontFrame,
-    RigidFrontFrameMoore,
-    SuspensionRigidFrontFrame,
-    SuspensionRigidFrontFrameMoore,
-)
-from symbrim.bicycle.grounds import FlatGround, GroundBase
-from symbrim.bicycle.rear_frames import (
-    RearFrameBase,
-    RigidRearFrame,
-    RigidRearFrameMoore,
-)
-from symbrim.bicycle.stationary_bicycle import StationaryBicycle
-from symbrim.bicycle.tires import InContactTire, NonHolonomicTire, TireBase
-from symbrim.bicycle.wheels import KnifeEdgeWheel, ToroidalWheel, WheelBase
-from symbrim.bicycle.whipple_bicycle import WhippleBicycle, WhippleBicycleMoore
+if TYPE_CHECKING:
+    from symbrim.bicycle.bicycle_base import BicycleBase
+    from symbrim.bicycle.cranks import CranksBase, MasslessCranks
+    from symbrim.bicycle.front_frames import (
+        FrontFrameBase,
+        RigidFrontFrame,
+        RigidFrontFrameMoore,
+        SuspensionRigidFrontFrame,
+        SuspensionRigidFrontFrameMoore,
+    )
+    from symbrim.bicycle.grounds import FlatGround, GroundBase
+    from symbrim.bicycle.rear_frames import (
+        RearFrameBase,
+        RigidRearFrame,
+        RigidRearFrameMoore,
+    )
+    from symbrim.bicycle.stationary_bicycle import StationaryBicycle
+    from symbrim.bicycle.tires import InContactTire, NonHolonomicTire, TireBase
+    from symbrim.bicycle.wheels import KnifeEdgeWheel, ToroidalWheel, WheelBase
+    from symbrim.bicycle.whipple_bicycle import WhippleBicycle, WhippleBicycleMoore
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "bicycle_base": ("BicycleBase",),
+    "cranks": ("CranksBase", "MasslessCranks"),
+    "front_frames": (
+        "FrontFrameBase", "RigidFrontFrame", "RigidFrontFrameMoore",
+        "SuspensionRigidFrontFrame", "SuspensionRigidFrontFrameMoore",
+    ),
+    "grounds": ("FlatGround", "GroundBase"),
+    "rear_frames": ("RearFrameBase", "RigidRearFrame", "RigidRearFrameMoore"),
+    "stationary_bicycle": ("StationaryBicycle",),
+    "tires": ("InContactTire", "NonHolonomicTire", "TireBase"),
+    "wheels": ("KnifeEdgeWheel", "ToroidalWheel", "WheelBase"),
+    "whipple_bicycle": ("WhippleBicycle", "WhippleBicycleMoore"),
+}, {
+    "moore": ("front_frames", "rear_frames", "whipple_bicycle"),
+})
@@ -1,7 +1,6 @@
 """Module containing the models of the front frame of a bicycle."""
 from __future__ import annotations
 
-import contextlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -17,19 +16,12 @@ from sympy.physics.mechanics import (
 
 from symbrim.core import Attachment, Hub, ModelBase, set_default_convention
 
-with contextlib.suppress(ImportError):
-    import numpy as np
-    from bicycleparameters.io import remove_uncertainties
-    from dtk.bicycle import benchmark_to_moore
-    from scipy.optimize import fsolve
-
-    from symbrim.utilities.parametrize import get_inertia_vals
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
-if TYPE_CHECKING:
-    with contextlib.suppress(ImportError):
         from symbrim.utilities.plotting import PlotModel
 
 __all__ = ["FrontFrameBase", "RigidFrontFrame", "RigidFrontFrameMoore",
@@ -122,6 +114,8 @@ class RigidFrontFrame(FrontFrameBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the front frame."""
+        from symbrim.utilities.parametrize import get_inertia_vals
+
         params = super().get_param_values(bicycle_parameters)
         str_params = _get_front_frame_moore_params(bicycle_parameters)
         if "mass" in str_params:
@@ -362,6 +356,8 @@ class SuspensionRigidFrontFrameMoore(SuspensionRigidFrontFrame):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the front frame."""
+        from symbrim.utilities.parametrize import get_inertia_vals
+
         params = super().get_param_values(bicycle_parameters)
         str_params = _get_front_frame_moore_params(bicycle_parameters)
         if "mass" in str_params:
@@ -376,6 +372,11 @@ class SuspensionRigidFrontFrameMoore(SuspensionRigidFrontFrame):
 
 def _get_front_frame_moore_params(bicycle_parameters: Bicycle
                                   ) -> dict[str, object]:  # pragma: no cover
+    import numpy as np
+    from bicycleparameters.io import remove_uncertainties
+    from dtk.bicycle import benchmark_to_moore
+    from scipy.optimize import fsolve
+
     params = {}
     if "Benchmark" in bicycle_parameters.parameters:
         bp = remove_uncertainties(bicycle_parameters.parameters["Benchmark"])
@@ -1,7 +1,6 @@
 """Module containing the models of the rear frame of a bicycle."""
 from __future__ import annotations
 
-import contextlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -10,20 +9,12 @@ from sympy.physics.mechanics import Point, RigidBody, System, inertia
 
 from symbrim.core import Attachment, Hub, ModelBase, set_default_convention
 
-with contextlib.suppress(ImportError):
-    import numpy as np
-    from bicycleparameters.io import remove_uncertainties
-    from bicycleparameters.main import calculate_benchmark_from_measured
-    from bicycleparameters.rider import yeadon_vec_to_bicycle_vec
-    from dtk.bicycle import benchmark_to_moore
-
-    from symbrim.utilities.parametrize import get_inertia_vals
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
-if TYPE_CHECKING:
-    with contextlib.suppress(ImportError):
         from symbrim.utilities.plotting import PlotModel
 
 __all__ = ["RearFrameBase", "RigidRearFrame", "RigidRearFrameMoore"]
@@ -130,6 +121,9 @@ class RigidRearFrame(RearFrameBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get a parameters mapping of a model based on a bicycle parameters object."""
+        import numpy as np
+        from bicycleparameters.io import remove_uncertainties
+
         params = super().get_param_values(bicycle_parameters)
         if "Benchmark" in bicycle_parameters.parameters:
             bp = remove_uncertainties(bicycle_parameters.parameters["Benchmark"])
@@ -213,6 +207,14 @@ class RigidRearFrameMoore(RigidRearFrame):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the rear frame."""
+        import numpy as np
+        from bicycleparameters.io import remove_uncertainties
+        from bicycleparameters.main import calculate_benchmark_from_measured
+        from bicycleparameters.rider import yeadon_vec_to_bicycle_vec
+        from dtk.bicycle import benchmark_to_moore
+
+        from symbrim.utilities.parametrize import get_inertia_vals
+
         params = super().get_param_values(bicycle_parameters)
         if "Benchmark" in bicycle_parameters.parameters:
             if bicycle_parameters.hasRider:
@@ -87,12 +87,15 @@ class TireBase(ConnectionBase):
         name = "The upward radial axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        normalized, perpendicular_rotation, perpendicular_longitudinal = check_zero([
+            axis.magnitude() - 1, axis.dot(self.wheel.rotation_axis),
+            axis.dot(cross(self.ground.get_normal(self.contact_point),
+                           self.wheel.rotation_axis))])
+        if not normalized:
             raise ValueError(f"{name} should be normalized.")
-        if not check_zero(axis.dot(self.wheel.rotation_axis)):
+        if not perpendicular_rotation:
             raise ValueError(f"{name} should be perpendicular to the rotation axis.")
-        if not check_zero(axis.dot(cross(self.ground.get_normal(self.contact_point),
-                                         self.wheel.rotation_axis))):
+        if not perpendicular_longitudinal:
             raise ValueError(
                 f"{name} should be perpendicular to the longitudinal axis.")
         self._upward_radial_axis = axis
@@ -110,11 +113,14 @@ class TireBase(ConnectionBase):
         name = "The longitudinal axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        normalized, perpendicular_rotation, perpendicular_normal = check_zero([
+            axis.magnitude() - 1, axis.dot(self.wheel.rotation_axis),
+            axis.dot(self.ground.get_normal(self.contact_point))])
+        if not normalized:
             raise ValueError(f"{name} should be normalized.")
-        if not check_zero(axis.dot(self.wheel.rotation_axis)):
+        if not perpendicular_rotation:
             raise ValueError(f"{name} should be perpendicular to the rotation axis.")
-        if not check_zero(axis.dot(self.ground.get_normal(self.contact_point))):
+        if not perpendicular_normal:
             raise ValueError(f"{name} should be perpendicular to the normal vector.")
         self._longitudinal_axis = axis
 
@@ -133,12 +139,15 @@ class TireBase(ConnectionBase):
         name = "The lateral axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        normalized, perpendicular_longitudinal, perpendicular_normal = check_zero([
+            axis.magnitude() - 1, axis.dot(self.longitudinal_axis),
+            axis.dot(self.ground.get_normal(self.contact_point))])
+        if not normalized:
             raise ValueError(f"{name} should be normalized.")
-        if not check_zero(axis.dot(self.longitudinal_axis)):
+        if not perpendicular_longitudinal:
             raise ValueError(
                 f"{name} should be perpendicular to the longitudinal axis.")
-        if not check_zero(axis.dot(self.ground.get_normal(self.contact_point))):
+        if not perpendicular_normal:
             raise ValueError(f"{name} should be perpendicular to the normal vector.")
         self._lateral_axis = axis
 
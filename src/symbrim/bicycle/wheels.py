@@ -1,7 +1,6 @@
 """Module containing the wheel models."""
 from __future__ import annotations
 
-import contextlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -10,16 +9,12 @@ from sympy.physics.mechanics import Point, Vector, inertia
 
 from symbrim.core import ModelBase, NewtonianBodyMixin
 
-with contextlib.suppress(ImportError):
-    from bicycleparameters.io import remove_uncertainties
-
-    from symbrim.utilities.parametrize import get_inertia_vals
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
-if TYPE_CHECKING:
-    with contextlib.suppress(ImportError):
         from symbrim.utilities.plotting import PlotModel
 
 __all__ = ["WheelBase", "KnifeEdgeWheel", "ToroidalWheel"]
@@ -50,6 +45,10 @@ class WheelBase(NewtonianBodyMixin, ModelBase):
         position : str, optional
             Position of the wheel, by default None. Options are "front" and "rear".
         """
+        from bicycleparameters.io import remove_uncertainties
+
+        from symbrim.utilities.parametrize import get_inertia_vals
+
         params = super().get_param_values(bicycle_parameters)
         if position is None:
             return params
@@ -122,6 +121,8 @@ class KnifeEdgeWheel(WheelBase):
         position : str, optional
             Position of the wheel, by default None. Options are "front" and "rear".
         """
+        from bicycleparameters.io import remove_uncertainties
+
         params = super().get_param_values(bicycle_parameters, position)
         if position is None:
             return params
@@ -1,4 +1,7 @@
 """Module containing the bicycle rider model."""
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
 
 __all__ = [
     "PedalsBase", "SeatBase", "HandGripsBase",
@@ -13,18 +16,30 @@ __all__ = [
     "HolonomicHandGrips", "SpringDamperHandGrips",
 ]
 
-from symbrim.brim.base_connections import (
-    HandGripsBase,
-    PedalsBase,
-    SeatBase,
-)
-from symbrim.brim.bicycle_rider import BicycleRider
-from symbrim.brim.hand_grips import HolonomicHandGrips, SpringDamperHandGrips
-from symbrim.brim.pedals import HolonomicPedals, SpringDamperPedals
-from symbrim.brim.seats import (
-    FixedSeat,
-    PelvisInterPointMixin,
-    SideLeanSeat,
-    SideLeanSeatSpringDamper,
-    SideLeanSeatTorque,
-)
+if TYPE_CHECKING:
+    from symbrim.brim.base_connections import (
+        HandGripsBase,
+        PedalsBase,
+        SeatBase,
+    )
+    from symbrim.brim.bicycle_rider import BicycleRider
+    from symbrim.brim.hand_grips import HolonomicHandGrips, SpringDamperHandGrips
+    from symbrim.brim.pedals import HolonomicPedals, SpringDamperPedals
+    from symbrim.brim.seats import (
+        FixedSeat,
+        PelvisInterPointMixin,
+        SideLeanSeat,
+        SideLeanSeatSpringDamper,
+        SideLeanSeatTorque,
+    )
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "base_connections": ("HandGripsBase", "PedalsBase", "SeatBase"),
+    "bicycle_rider": ("BicycleRider",),
+    "hand_grips": ("HolonomicHandGrips", "SpringDamperHandGrips"),
+    "pedals": ("HolonomicPedals", "SpringDamperPedals"),
+    "seats": (
+        "FixedSeat", "PelvisInterPointMixin", "SideLeanSeat",
+        "SideLeanSeatSpringDamper", "SideLeanSeatTorque",
+    ),
+})
@@ -46,10 +46,16 @@ class HolonomicHandGrips(HandGripsBase):
 
         def attach_hand(hand_point: Point, hand_grip: Attachment) -> None:
             """Attach the hand to the steer."""
-            for direction in hand_grip.frame:
-                constr = hand_point.pos_from(hand_grip.point).dot(direction)
-                if not check_zero(constr):
-                    if check_zero(constr.diff(dynamicsymbols._t)):
+            directions = list(hand_grip.frame)
+            constrs = [hand_point.pos_from(hand_grip.point).dot(direction)
+                       for direction in directions]
+            is_zero = check_zero(constrs)
+            is_static = check_zero([constr.diff(dynamicsymbols._t)
+                                    for constr in constrs])
+            for direction, constr, zero, static in zip(
+                    directions, constrs, is_zero, is_static):
+                if not zero:
+                    if static:
                         error_msg.append(
                             f"While constraining the the hands to the steer, it was "
                             f"found that the holonomic constraint of a hand along "
@@ -40,10 +40,16 @@ class HolonomicPedals(PedalsBase):
 
         def attach_foot(foot_point: Point, pedal_point: Point) -> None:
             """Attach the foot to the pedal."""
-            for direction in self.cranks.frame:
-                constr = foot_point.pos_from(pedal_point).dot(direction)
-                if not check_zero(constr):
-                    if check_zero(constr.diff(dynamicsymbols._t)):
+            directions = list(self.cranks.frame)
+            constrs = [foot_point.pos_from(pedal_point).dot(direction)
+                       for direction in directions]
+            is_zero = check_zero(constrs)
+            is_static = check_zero([constr.diff(dynamicsymbols._t)
+                                    for constr in constrs])
+            for direction, constr, zero, static in zip(
+                    directions, constrs, is_zero, is_static):
+                if not zero:
+                    if static:
                         error_msg.append(
                             f"While constraining the the feet to the pedals, it was "
                             f"found that the holonomic constraint of a foot along "
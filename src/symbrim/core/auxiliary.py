@@ -1,6 +1,7 @@
 """Utility to compute the noncontributing forces and torques."""
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -113,6 +114,7 @@ class AuxiliaryDataHandler:
         self._inertial_frame = inertial_frame
         self._inertial_point = inertial_point
         self._position_tree = None  # Chosen structure is {parent: [child1, ...]}
+        self._parents = None  # Chosen structure is {child: parent}
         self._aux_vels_points = None
         self.auxiliary_data_list: list[AuxiliaryData] = []
 
@@ -164,9 +166,9 @@ class AuxiliaryDataHandler:
             def get_childs(parent: object) -> Iterable[object]:
                 return getattr(parent, attr_name)
         tree = {}
-        queue = [root]
+        queue = deque([root])
         while queue:
-            parent = queue.pop(0)
+            parent = queue.popleft()
             if parent in tree:
                 raise ValueError("Graph contains a cycle.")
             tree[parent] = []
@@ -176,29 +178,21 @@ class AuxiliaryDataHandler:
                     tree[parent].append(neighbor)
         return tree
 
-    @staticmethod
-    def _get_children_from_tree(
-        tree: dict[object, list[object]], parent: object, include_parent: bool = False
-    ) -> list[object]:
-        """Get children of a node in a tree."""
-        queue = tree[parent].copy()
-        children = [parent] if include_parent else []
-        while queue:
-            child = queue.pop(0)
-            children.append(child)
-            queue.extend(tree[child])
-        return children
+    def _reset_speeds(self) -> None:
+        """Reset the position tree and auxiliary velocities to apply speeds again."""
+        self._position_tree = None
+        self._parents = None
+        self._aux_vels_points = None
 
     def retrieve_graphs(self) -> None:
         """Read in the graphs of the system."""
         self._position_tree = self._extract_tree(self.inertial_point, "_pos_dict")
+        self._parents = {child: parent for parent, childs in self._position_tree.items()
+                         for child in childs}
 
     def _get_parent(self, point: Point) -> Point | None:
         """Get parent point in the position tree."""
-        for parent, childs in self._position_tree.items():
-            if point in childs:
-                return parent
-        return None
+        return self._parents.get(point)
 
     def _compute_velocity(self, point: Point, parent: Point | None = None) -> Vector:
         """Compute the velocity of a point based on its parent in the position tree."""
@@ -243,37 +237,38 @@ class AuxiliaryDataHandler:
         if self._aux_vels_points is not None:
             raise ValueError("Auxiliary speeds have already been applied.")
         self.retrieve_graphs()
-        all_points = self._get_children_from_tree(
-            self._position_tree, self.inertial_point, include_parent=True)
-        self._aux_vels_points = {pt: Vector(0) for pt in all_points}
 
         if self.auxiliary_torques_data:  # pragma: no cover
             raise NotImplementedError(
                 "Support for noncontributing torques has not been implemented")
 
-        # Add auxiliary velocities to auxiliary speed graph of the points
+        # Sum the auxiliary velocities of the noncontributing forces per point.
+        own_aux_vels = {}
         for load in self.auxiliary_forces_data:
             if load.location not in self._position_tree:
                 raise ValueError(
                     f"The point of the noncontributing force {load!r} is not connected"
                     f" to {self.inertial_point!r}.")
-            for point in self._get_children_from_tree(
-                self._position_tree, load.location, include_parent=True):
-                self._aux_vels_points[point] += load.auxiliary_velocity
+            own_aux_vels[load.location] = (
+                own_aux_vels.get(load.location, Vector(0)) + load.auxiliary_velocity)
 
-        # Set all speeds using a breath first search.
+        # Set all speeds using a breath first search, while propagating the auxiliary
+        # velocities from each point to its children in the position tree.
         # This is done before adding the auxiliary forces because auxiliary speeds may
         # otherwise also be added by Point.vel.
-        queue = [self.inertial_point]
+        self._aux_vels_points = {
+            self.inertial_point: own_aux_vels.get(self.inertial_point, Vector(0))}
+        queue = deque([self.inertial_point])
         while queue:
-            parent = queue.pop(0)
+            parent = queue.popleft()
             for child in self._position_tree[parent]:
                 self._compute_velocity(child, parent)
+                self._aux_vels_points[child] = (
+                    self._aux_vels_points[parent] + own_aux_vels.get(child, Vector(0)))
                 queue.append(child)
 
         # Add auxiliary speeds to each point of the graph.
-        for point in all_points:
-            aux_vel = self._aux_vels_points[point]
+        for point, aux_vel in self._aux_vels_points.items():
             if aux_vel != 0:
                 point.set_vel(self.inertial_frame,
                               point._vel_dict[self.inertial_frame] + aux_vel)
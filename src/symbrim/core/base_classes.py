@@ -1,33 +1,53 @@
 """Module containing the base class for all models in SymBRiM."""
 from __future__ import annotations
 
+import pickle
+import zlib
 from abc import ABCMeta
+from contextlib import contextmanager
 from functools import wraps
 from typing import TYPE_CHECKING
 
-from sympy import Basic, MutableDenseMatrix, Symbol, symbols
-from sympy.physics.mechanics import System, dynamicsymbols, find_dynamicsymbols
+from sympy import Basic, MutableDenseMatrix, Symbol, symbols, sympify
+from sympy.physics.mechanics import (
+    RigidBody,
+    System,
+    dynamicsymbols,
+    find_dynamicsymbols,
+)
 
 from symbrim.core.auxiliary import AuxiliaryDataHandler
+from symbrim.core.journal import GraphJournal, remove_cached_relations
 from symbrim.core.registry import Registry
 
-try:  # pragma: no cover
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     from bicycleparameters import Bicycle
-except ImportError:  # pragma: no cover
-    Bicycle = object
-try:
     from symmeplot.matplotlib.plot_base import MplPlotBase
-except ImportError:  # pragma: no cover
-    MplPlotBase = object
-
-if TYPE_CHECKING:
-    from collections.abc import Callable
 
     from symbrim.core.requirement import ConnectionRequirement, ModelRequirement
 
 __all__ = ["ConnectionBase", "ConnectionMeta", "LoadGroupBase", "LoadGroupMeta",
            "ModelBase", "ModelMeta", "set_default_convention"]
 
+_STAGES = ("objects", "kinematics", "loads", "constraints")
+_DEFINITION_STATE_ATTRIBUTES = ("_is_dirty", "_defined_stages", "_initial_state",
+                                "_final_state", "_replaced_objects", "_journals")
+_COPIED_STATE_TYPES = (dict, list, set, MutableDenseMatrix)
+
+
+def _copy_state_value(value: object) -> object:
+    """Copy a value of an attribute if it is a mutable container."""
+    return value.copy() if isinstance(value, _COPIED_STATE_TYPES) else value
+
+
+def _is_same_state_value(value: object, other: object) -> bool:
+    """Check whether the value of an attribute has not been changed."""
+    if isinstance(value, _COPIED_STATE_TYPES):
+        return type(value) is type(other) and value == other
+    return value is other
+
 
 def _get_requirements(bases, namespace, req_attr_name):  # noqa: ANN001, ANN202
     requirements = {}
@@ -52,7 +72,7 @@ def _create_submodel_property(requirement: ModelRequirement) -> property:
                 f"{requirement.full_name} should be an instance of an subclass of "
                 f"{requirement.type_name}, but {model!r} is an instance of "
                 f"{type(model)}.")
-        setattr(self, f"_{requirement.attribute_name}", model)
+        self._set_requirement(requirement.attribute_name, model)
 
     getter.__annotations__ = {"return": requirement.type_hint}
     setter.__annotations__ = {"model": requirement.type_hint, "return": None}
@@ -69,7 +89,7 @@ def _create_connection_property(requirement: ConnectionRequirement) -> property:
                 f"{requirement.full_name} should be an instance of an subclass "
                 f"of {requirement.type_name}, but {conn!r} is an instance of "
                 f"{type(conn)}.")
-        setattr(self, f"_{requirement.attribute_name}", conn)
+        self._set_requirement(requirement.attribute_name, conn)
 
     getter.__annotations__ = {"return": requirement.type_hint}
     setter.__annotations__ = {"conn": requirement.type_hint, "return": None}
@@ -141,6 +161,12 @@ class BrimBase:
         self.q: MutableDenseMatrix = MutableDenseMatrix()
         self.u: MutableDenseMatrix = MutableDenseMatrix()
         self.u_aux: MutableDenseMatrix = MutableDenseMatrix()
+        self._is_dirty = False
+        self._defined_stages: set[str] = set()
+        self._initial_state: dict[str, object] | None = None
+        self._final_state: dict[str, object] | None = None
+        self._replaced_objects: list[BrimBase] = []
+        self._journals: list[GraphJournal] = []
 
     def _add_prefix(self, names: str) -> str:
         """Add the name of the object as a prefix to a set of names.
@@ -236,21 +262,85 @@ class BrimBase:
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:  # noqa: ARG002
         """Get a parameters mapping of a model based on a bicycle parameters object."""
-        if Bicycle is None:
-            raise ImportError("The bicycle parameters package is not installed.")
+        # The optional dependencies are only imported when used, as they are slow to
+        # import.
+        try:
+            import bicycleparameters  # noqa: F401
+        except ImportError as e:
+            raise ImportError("The bicycle parameters package is not installed.") from e
         return {}
 
     def set_plot_objects(self, plot_object: MplPlotBase) -> None:  # noqa: ARG002
         """Set the symmeplot plot objects."""
-        if MplPlotBase is None:
-            raise ImportError("The symmeplot package is not installed.")
+        try:
+            import symmeplot  # noqa: F401
+        except ImportError as e:
+            raise ImportError("The symmeplot package is not installed.") from e
+
+    def _set_requirement(self, attribute_name: str, obj: BrimBase | None) -> None:
+        """Set a required submodel or connection and mark the object as changed."""
+        old_obj = getattr(self, f"_{attribute_name}")
+        if obj is not old_obj:
+            self._is_dirty = True
+            # The submodels of connections are set by the parent model, which already
+            # keeps track of the replaced objects.
+            if old_obj is not None and not isinstance(self, ConnectionBase):
+                self._replaced_objects.append(old_obj)
+        setattr(self, f"_{attribute_name}", obj)
+
+    def _get_state(self) -> dict[str, object]:
+        """Get a copy of the attributes that can be changed by the definition."""
+        protected = {*_DEFINITION_STATE_ATTRIBUTES, "_load_groups", "_parent",
+                     "_frozen_values"}
+        protected.update(f"_{req.attribute_name}" for req in (
+            *getattr(self, "required_models", ()),
+            *getattr(self, "required_connections", ())))
+        return {name: _copy_state_value(value) for name, value in vars(self).items()
+                if name not in protected}
+
+    def _set_stage_defined(self, stage: str) -> None:
+        """Mark a stage as defined and store the state of the object if needed."""
+        self._defined_stages.add(stage)
+        if stage == "constraints":
+            self._final_state = self._get_state()
+
+    def _reset_definition(self) -> None:
+        """Reset the object to the state before it was defined.
+
+        Explanation
+        -----------
+        The attributes are reset to their values before the object was defined, unless
+        they have been changed after the object was completely defined. The changes
+        to the kinematic graph are not reverted by this method.
+        """
+        if self._initial_state is not None:
+            current = self._get_state()
+            final = current if self._final_state is None else self._final_state
+            for name in current.keys() | self._initial_state.keys():
+                if name in current:
+                    if name not in final:
+                        continue  # Added after the definition, so keep it.
+                    if not _is_same_state_value(current[name], final[name]):
+                        continue  # Changed after the definition, so keep it.
+                if name in self._initial_state:
+                    setattr(self, name, _copy_state_value(self._initial_state[name]))
+                else:
+                    delattr(self, name)
+        self._is_dirty = False
+        self._defined_stages = set()
+        self._initial_state = None
+        self._final_state = None
+        self._replaced_objects = []
+        self._journals = []
 
     def _define_objects(self) -> None:
         """Define the objects of the system."""
 
     def define_objects(self) -> None:
         """Define the objects of the system."""
+        self._initial_state = self._get_state()
         self._define_objects()
+        self._set_stage_defined("objects")
 
     def _define_kinematics(self) -> None:
         """Define the kinematics of the system."""
@@ -258,6 +348,7 @@ class BrimBase:
     def define_kinematics(self) -> None:
         """Define the kinematics of the system."""
         self._define_kinematics()
+        self._set_stage_defined("kinematics")
 
     def _define_loads(self) -> None:
         """Define the loads of the system."""
@@ -265,6 +356,7 @@ class BrimBase:
     def define_loads(self) -> None:
         """Define the loads of the system."""
         self._define_loads()
+        self._set_stage_defined("loads")
 
     def _define_constraints(self) -> None:
         """Define the constraints of the system."""
@@ -272,6 +364,7 @@ class BrimBase:
     def define_constraints(self) -> None:
         """Define the constraints of the system."""
         self._define_constraints()
+        self._set_stage_defined("constraints")
 
 
 class ModelBase(BrimBase, metaclass=ModelMeta):
@@ -292,6 +385,7 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
         super().__init__(name)
         self.is_root: bool | None = None  # None means that it is not defined.
         self._load_groups = []
+        self._frozen_values: dict[Basic, Basic] = {}
         for req in self.required_models:
             setattr(self, f"_{req.attribute_name}", None)
         for req in self.required_connections:
@@ -323,16 +417,14 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
         for load_group in load_groups:
             load_group.parent = self
         self._load_groups.extend(load_groups)
+        self._is_dirty = True
 
     @classmethod
     def from_convention(
         cls, convention: str, name: str, *args: object, **kwargs: dict[str, object]
     ) -> ModelBase:
         """Create a model from a convention."""
-        possible_models = [
-            model for model in Registry().models
-            if issubclass(model, cls) and model.convention == convention
-        ]
+        possible_models = Registry().get_from_convention(convention, cls)
         if len(possible_models) == 0:
             raise ValueError(f"No model found for convention {convention!r} of type "
                              f"{cls}.")
@@ -341,6 +433,53 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
                              f"of type {cls}: {set(possible_models)}.")
         return possible_models[0](name, *args, **kwargs)
 
+    def freeze_parameters(self, values: dict[Basic, float]) -> None:
+        """Replace symbols by numeric values before the kinematics are defined.
+
+        Explanation
+        -----------
+        The frozen symbols are substituted in the symbols of all objects in the model
+        tree and in the masses and inertias of their bodies, right before the
+        kinematics are defined. As a result the kinematics, loads and constraints, and
+        thereby the equations of motion, are derived with numeric values. This makes
+        terms like zero products of inertia and zero offsets vanish from the
+        expressions. As most symbols are created in the objects stage, the values of
+        :meth:`get_param_values` should be computed before freezing, after which the
+        frozen symbols are no longer part of the model.
+
+        If the kinematics have already been defined, then the complete model is
+        redefined upon the next call of :meth:`define_all`.
+
+        Parameters
+        ----------
+        values : dict[Basic, float]
+            Mapping of the symbols to their numeric values.
+        """
+        self._frozen_values.update(
+            {sym: sympify(value) for sym, value in values.items()})
+        tree = list(self._iter_tree())
+        if any("kinematics" in obj._defined_stages for obj in tree):
+            for obj in tree:
+                obj._is_dirty = True
+
+    def _apply_frozen_values(self) -> None:
+        """Substitute the frozen values of all models in the tree."""
+        tree = list(self._iter_tree())
+        values = {}
+        for obj in tree:
+            values.update(getattr(obj, "_frozen_values", {}))
+        if not values:
+            return
+        for obj in tree:
+            obj.symbols.update({name: sym.xreplace(values) for name, sym in
+                                obj.symbols.items() if isinstance(sym, Basic)})
+            if obj.system is None:
+                continue
+            for body in obj.system.bodies:
+                body.mass = body.mass.xreplace(values)
+                if isinstance(body, RigidBody):
+                    body.central_inertia = body.central_inertia.xreplace(values)
+
     def _set_auxiliary_handler(self, auxiliary_handler: AuxiliaryDataHandler) -> None:
         """Set the auxiliary data handler of the model."""
         self._auxiliary_handler = auxiliary_handler
@@ -358,54 +497,158 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
         for submodel in self.submodels:
             submodel.define_connections()
 
+    def _iter_tree(self) -> Iterator[BrimBase]:
+        """Iterate over the model and all its submodels, connections and load groups."""
+        yield self
+        for submodel in self.submodels:
+            yield from submodel._iter_tree()
+        for conn in self.connections:
+            yield conn
+            yield from conn.load_groups
+        yield from self.load_groups
+
+    @contextmanager
+    def _record_stage(self, stage: str) -> Iterator[None]:
+        """Record the changes to the kinematic graph made while defining a stage."""
+        journal = GraphJournal(self._iter_tree(), self.auxiliary_handler)
+        try:
+            yield
+        finally:
+            journal.finish(self._iter_tree())
+            self._journals.append(journal)
+        self._set_stage_defined(stage)
+
+    def _prepare_redefinition(self) -> None:
+        """Reset all objects that have to be redefined, such that others are reused.
+
+        Explanation
+        -----------
+        A model has to be redefined if it has not been defined yet, if one of its
+        requirements has been replaced, or if any of its submodels, connections or load
+        groups has to be redefined. As a model defines its connections and load groups,
+        those are reset as well. The changes these objects made to the kinematic graph
+        are undone in reverse chronological order, such that the points and reference
+        frames of the reused submodels are restored to their state before they were
+        used by the objects that are redefined.
+        """
+        requires_definition = {}
+
+        def check_definition(obj: BrimBase) -> bool:
+            if obj not in requires_definition:
+                children = [*getattr(obj, "submodels", ()),
+                            *getattr(obj, "connections", ()),
+                            *getattr(obj, "load_groups", ())]
+                status = [check_definition(child) for child in children]
+                requires_definition[obj] = (
+                    obj._is_dirty or any(status) or
+                    not obj._defined_stages.issuperset(_STAGES) or
+                    (obj is not self and getattr(obj, "is_root", False)))
+            return requires_definition[obj]
+
+        check_definition(self)
+        objects = [obj for obj, redefine in requires_definition.items() if redefine]
+        for obj in self._iter_tree():
+            objects.extend(obj._replaced_objects)
+        to_reset = set()
+        for obj in objects:
+            to_reset.add(obj)
+            to_reset.update(getattr(obj, "load_groups", ()))
+            for conn in getattr(obj, "connections", ()):
+                to_reset.add(conn)
+                to_reset.update(conn.load_groups)
+        if not to_reset:
+            return
+        auxiliary_handler = self.auxiliary_handler
+        journals = [journal for obj in to_reset for journal in obj._journals]
+        for journal in sorted(journals, key=lambda journal: journal.index,
+                              reverse=True):
+            journal.undo()
+        for obj in to_reset:
+            obj._reset_definition()
+        remove_cached_relations(journal for obj in self._iter_tree()
+                                if obj not in to_reset for journal in obj._journals)
+        if auxiliary_handler is not None:
+            auxiliary_handler._reset_speeds()
+            self._auxiliary_handler = auxiliary_handler
+
     def define_objects(self) -> None:
         """Initialize the objects belonging to the model."""
-        if self.is_root is None:
+        if self.is_root is not False:
+            self._prepare_redefinition()
             self.is_root = True
             queue = list(self.submodels)
             while queue:
                 submodel = queue.pop(0)
                 submodel.is_root = False
                 queue.extend(submodel.submodels)
+        if "objects" in self._defined_stages:
+            return
+        self._initial_state = self._get_state()
         for submodel in self.submodels:
             submodel.define_objects()
-        self._define_objects()
-        for load_group in self._load_groups:
-            load_group.define_objects()
-        if self.is_root:
-            self._set_auxiliary_handler(AuxiliaryDataHandler.from_system(self.system))
+        with self._record_stage("objects"):
+            self._define_objects()
+            for load_group in self._load_groups:
+                load_group.define_objects()
+            if self.is_root:
+                handler = self.auxiliary_handler
+                if (handler is None or
+                        handler.inertial_frame is not self.system.frame or
+                        handler.inertial_point is not self.system.fixed_point):
+                    handler = AuxiliaryDataHandler.from_system(self.system)
+                self._set_auxiliary_handler(handler)
 
     def define_kinematics(self) -> None:
         """Establish the kinematics of the objects belonging to the model."""
+        if "kinematics" in self._defined_stages:
+            return
+        if self.is_root:
+            self._apply_frozen_values()
         for submodel in self.submodels:
             submodel.define_kinematics()
-        self._define_kinematics()
-        for load_group in self._load_groups:
-            load_group.define_kinematics()
-        if self.is_root:
-            self.auxiliary_handler.apply_speeds()
-            self.system.add_auxiliary_speeds(*self.auxiliary_handler.auxiliary_speeds)
+        with self._record_stage("kinematics"):
+            self._define_kinematics()
+            for load_group in self._load_groups:
+                load_group.define_kinematics()
+            if self.is_root:
+                self.auxiliary_handler.apply_speeds()
+                self.system.add_auxiliary_speeds(
+                    *self.auxiliary_handler.auxiliary_speeds)
 
     def define_loads(self) -> None:
         """Define the loads that are acting upon the model."""
+        if "loads" in self._defined_stages:
+            return
         for submodel in self.submodels:
             submodel.define_loads()
-        self._define_loads()
-        for load_group in self._load_groups:
-            load_group.define_loads()
-        if self.is_root:
-            self.system.add_loads(*self.auxiliary_handler.create_loads())
+        with self._record_stage("loads"):
+            self._define_loads()
+            for load_group in self._load_groups:
+                load_group.define_loads()
+            if self.is_root:
+                self.system.add_loads(*self.auxiliary_handler.create_loads())
 
     def define_constraints(self) -> None:
         """Define the constraints on the model."""
+        if "constraints" in self._defined_stages:
+            return
         for submodel in self.submodels:
             submodel.define_constraints()
-        self._define_constraints()
-        for load_group in self._load_groups:
-            load_group.define_constraints()
+        with self._record_stage("constraints"):
+            self._define_constraints()
+            for load_group in self._load_groups:
+                load_group.define_constraints()
 
     def define_all(self) -> None:
-        """Define all aspects of the model."""
+        """Define all aspects of the model.
+
+        Explanation
+        -----------
+        The model can be redefined after replacing some of its submodels, connections
+        or load groups. In that case only the replaced objects, the models containing
+        them and the connections depending on them are redefined. All other objects are
+        reused including their points, reference frames and systems.
+        """
         self.define_connections()
         self.define_objects()
         self.define_kinematics()
@@ -431,6 +674,53 @@ class ModelBase(BrimBase, metaclass=ModelMeta):
 
         return _merge_systems(*get_systems(self))
 
+    def snapshot(self) -> bytes:
+        """Serialize the model including its current definition.
+
+        Explanation
+        -----------
+        The snapshot contains the entire tree of the model, i.e. its submodels,
+        connections and load groups, including their symbols, points, reference frames,
+        systems, auxiliary data and the journals required for a redefinition. It is
+        serialized using :mod:`pickle` and compressed using :mod:`zlib`. Restoring a
+        defined model from a snapshot is much faster than defining it again, which makes
+        snapshots well suited to be shipped to worker processes.
+
+        Returns
+        -------
+        bytes
+            Compressed snapshot of the model, which can be restored using
+            :meth:`restore`.
+        """
+        return zlib.compress(pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def restore(cls, snapshot: bytes) -> ModelBase:
+        """Restore a model from a snapshot created by :meth:`snapshot`.
+
+        Explanation
+        -----------
+        The restored model is a copy of the model at the time the snapshot was taken.
+        The symbols of the restored model are equal to the original ones. However, its
+        points, reference frames and systems are new objects. As snapshots are
+        deserialized using :mod:`pickle`, only restore snapshots you trust.
+
+        Parameters
+        ----------
+        snapshot : bytes
+            Snapshot created by :meth:`snapshot`.
+
+        Returns
+        -------
+        ModelBase
+            Restored model.
+        """
+        model = pickle.loads(zlib.decompress(snapshot))  # noqa: S301
+        if not isinstance(model, cls):
+            raise TypeError(f"Expected the snapshot to contain an instance of {cls}, "
+                            f"but got {type(model)} instead.")
+        return model
+
 
 class ConnectionBase(BrimBase, metaclass=ConnectionMeta):
     """Base class for all connections in SymBRiM."""
@@ -468,30 +758,36 @@ class ConnectionBase(BrimBase, metaclass=ConnectionMeta):
         for load_group in load_groups:
             load_group.parent = self
         self._load_groups.extend(load_groups)
+        self._is_dirty = True
 
     def define_objects(self) -> None:
         """Define the objects in the connection."""
+        self._initial_state = self._get_state()
         self._define_objects()
         for load_group in self._load_groups:
             load_group.define_objects()
+        self._set_stage_defined("objects")
 
     def define_kinematics(self) -> None:
         """Define the kinematics of the connection."""
         self._define_kinematics()
         for load_group in self._load_groups:
             load_group.define_kinematics()
+        self._set_stage_defined("kinematics")
 
     def define_loads(self) -> None:
         """Define the loads on the connection."""
         self._define_loads()
         for load_group in self._load_groups:
             load_group.define_loads()
+        self._set_stage_defined("loads")
 
     def define_constraints(self) -> None:
         """Define the constraints on the connection."""
         self._define_constraints()
         for load_group in self._load_groups:
             load_group.define_constraints()
+        self._set_stage_defined("constraints")
 
 
 class LoadGroupBase(BrimBase, metaclass=LoadGroupMeta):
@@ -555,32 +851,54 @@ def set_default_convention(
     return decorator
 
 
+_MERGED_SYSTEM_ATTRIBUTES = (
+    ("q_ind", "q", "add_coordinates", {"independent": True}),
+    ("q_dep", "q", "add_coordinates", {"independent": False}),
+    ("u_ind", "u", "add_speeds", {"independent": True}),
+    ("u_dep", "u", "add_speeds", {"independent": False}),
+    ("u_aux", "u", "add_auxiliary_speeds", {}),
+    ("bodies", "bodies", "add_bodies", {}),
+    ("joints", "joints", "add_joints", {}),
+    ("loads", "loads", "add_loads", {}),
+    ("actuators", "actuators", "add_actuators", {}),
+    ("kdes", "kdes", "add_kdes", {}),
+    ("holonomic_constraints", "holonomic_constraints",
+     "add_holonomic_constraints", {}),
+    ("nonholonomic_constraints", "nonholonomic_constraints",
+     "add_nonholonomic_constraints", {}),
+)
+
+
 def _merge_systems(*systems: System) -> System:
-    """Combine multiple system instance into one."""
-    system = System(systems[0].frame, systems[0].fixed_point)
+    """Combine multiple system instance into one.
+
+    Explanation
+    -----------
+    The items of each category are first collected, where a set per category is used
+    to skip items that have already been collected. Afterward, all items of a category
+    are added to the system at once. This keeps the merging linear in the size of the
+    model, as adding items one by one to a system requires rebuilding its matrices and
+    checking them against all existing items.
+    """
+    seen = {attr_existing: set()
+            for _, attr_existing, _, _ in _MERGED_SYSTEM_ATTRIBUTES}
+    items = {attr_to_add: [] for attr_to_add, _, _, _ in _MERGED_SYSTEM_ATTRIBUTES}
+    velocity_constraints = []
     for s in systems:
         if s is None:  # pragma: no cover
             continue
-        attributes = [
-            ("q_ind", "q", "add_coordinates", {"independent": True}),
-            ("q_dep", "q", "add_coordinates", {"independent": False}),
-            ("u_ind", "u", "add_speeds", {"independent": True}),
-            ("u_dep", "u", "add_speeds", {"independent": False}),
-            ("u_aux", "u", "add_auxiliary_speeds", {}),
-            ("bodies", "bodies", "add_bodies", {}),
-            ("joints", "joints", "add_joints", {}),
-            ("loads", "loads", "add_loads", {}),
-            ("actuators", "actuators", "add_actuators", {}),
-            ("kdes", "kdes", "add_kdes", {}),
-            ("holonomic_constraints", "holonomic_constraints",
-             "add_holonomic_constraints", {}),
-            ("nonholonomic_constraints", "nonholonomic_constraints",
-             "add_nonholonomic_constraints", {}),
-        ]
-        for attr_to_add, attr_existing, add_method, kwargs in attributes:
+        for attr_to_add, attr_existing, _, _ in _MERGED_SYSTEM_ATTRIBUTES:
             for item in getattr(s, attr_to_add):
-                if item not in getattr(system, attr_existing):
-                    getattr(system, add_method)(item, **kwargs)
-        system.velocity_constraints = (
-            system.velocity_constraints[:] + s.velocity_constraints[:])
+                if item not in seen[attr_existing]:
+                    seen[attr_existing].add(item)
+                    items[attr_to_add].append(item)
+        velocity_constraints.extend(s.velocity_constraints)
+    system = System(systems[0].frame, systems[0].fixed_point)
+    for attr_to_add, attr_existing, add_method, kwargs in _MERGED_SYSTEM_ATTRIBUTES:
+        # Adding joints also adds their coordinates, speeds, kdes and bodies.
+        existing = set(getattr(system, attr_existing))
+        new_items = [item for item in items[attr_to_add] if item not in existing]
+        if new_items:
+            getattr(system, add_method)(*new_items, **kwargs)
+    system.velocity_constraints = velocity_constraints
     return system
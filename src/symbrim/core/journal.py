@@ -0,0 +1,219 @@
+"""Module containing a journal of the changes made to the kinematic graph.
+
+Explanation
+-----------
+The kinematic graph of a model consists of the points and reference frames, which
+store their relations to other points and frames in dictionaries. For example,
+``point.set_pos(other, vector)`` adds an entry to the position dictionaries of both
+points. To be able to redefine part of a model without recreating all other objects,
+the changes made by a definition stage are recorded in a :class:`GraphJournal`. The
+journal can later be used to undo those changes, after which the objects of the
+unchanged part of the model can be reused.
+"""
+from __future__ import annotations
+
+from itertools import count
+from typing import TYPE_CHECKING
+
+from sympy.physics.mechanics import (
+    Particle,
+    Point,
+    ReferenceFrame,
+    RigidBody,
+    System,
+)
+from sympy.physics.mechanics.joint import Joint
+
+from symbrim.core.attachment import Attachment
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from symbrim.core.auxiliary import AuxiliaryData, AuxiliaryDataHandler
+
+    Node = Point | ReferenceFrame
+
+__all__ = ["GraphJournal", "remove_cached_relations"]
+
+_POINT_DICTS = ("_pos_dict", "_vel_dict", "_acc_dict")
+_FRAME_DICTS = ("_dcm_dict", "_dcm_cache", "_ang_vel_dict", "_ang_acc_dict")
+
+
+class _Missing:
+    """Sentinel of a missing relation, which remains the same object when pickled."""
+
+    def __reduce__(self) -> str:
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+_counter = count()
+
+
+def _get_dict_names(node: Node) -> tuple[str, ...]:
+    """Get the names of the dictionaries storing the relations of a node."""
+    return _POINT_DICTS if isinstance(node, Point) else _FRAME_DICTS
+
+
+def _find_nodes(objects: Iterable[object]) -> set[Node]:
+    """Find all points and frames connected to the attributes of the objects."""
+    nodes, queue = set(), []
+    def add(value: object) -> None:
+        if isinstance(value, (Point, ReferenceFrame)):
+            queue.append(value)
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                add(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                add(item)
+        elif isinstance(value, (RigidBody, Particle)):
+            queue.append(value.masscenter)
+            if isinstance(value, RigidBody):
+                queue.append(value.frame)
+        elif isinstance(value, Attachment):
+            queue.extend((value.frame, value.point))
+        elif isinstance(value, Joint):
+            queue.extend((value.parent_point, value.child_point,
+                          value.parent_interframe, value.child_interframe))
+        elif isinstance(value, System):
+            queue.extend((value.frame, value.fixed_point))
+            add(value.bodies)
+            add(value.joints)
+
+    for obj in objects:
+        for value in vars(obj).values():
+            add(value)
+    # Breadth-first search through the relations stored in the dictionaries.
+    while queue:
+        node = queue.pop()
+        if node in nodes:
+            continue
+        nodes.add(node)
+        for dict_name in _get_dict_names(node):
+            queue.extend(nb for nb in getattr(node, dict_name) if nb not in nodes)
+    return nodes
+
+
+def _take_snapshot(nodes: Iterable[Node]) -> dict[Node, tuple[dict, ...]]:
+    """Take a snapshot of the relation dictionaries of the nodes."""
+    return {node: tuple(dict(getattr(node, dict_name))
+                        for dict_name in _get_dict_names(node))
+            for node in nodes}
+
+
+class GraphJournal:
+    """Journal of the changes made to the kinematic graph during a definition stage.
+
+    Explanation
+    -----------
+    The journal takes a snapshot of the relations of all points and frames connected
+    to the objects when it is started. When it is finished, it takes another snapshot
+    and stores the difference. The dictionaries of the points and reference frames are
+    never replaced when undoing the changes, as SymPy also stores references to them.
+
+    Parameters
+    ----------
+    objects : Iterable[object]
+        Objects, like models and connections, whose attributes are scanned for points
+        and reference frames.
+    auxiliary_handler : AuxiliaryDataHandler, optional
+        Auxiliary data handler of which the added auxiliary data is recorded.
+    """
+
+    def __init__(self, objects: Iterable[object],
+                 auxiliary_handler: AuxiliaryDataHandler | None = None) -> None:
+        self._index = next(_counter)
+        self._auxiliary_handler = auxiliary_handler
+        self._n_auxiliary_data = (None if auxiliary_handler is None else
+                                  len(auxiliary_handler.auxiliary_data_list))
+        self._snapshot = _take_snapshot(_find_nodes(objects))
+        self._changes: list[tuple[Node, str, object, object, object]] = []
+        self._auxiliary_data: list[AuxiliaryData] = []
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        """Restore the journal and ensure that new journals get a higher index."""
+        global _counter  # noqa: PLW0603
+        self.__dict__.update(state)
+        if next(_counter) <= self._index:
+            _counter = count(self._index + 1)
+
+    @property
+    def index(self) -> int:
+        """Index of the journal, which defines the chronological order of journals."""
+        return self._index
+
+    def finish(self, objects: Iterable[object]) -> None:
+        """Finish the journal by recording the changes w.r.t. the first snapshot."""
+        nodes = _find_nodes(objects).union(self._snapshot)
+        for node in nodes:
+            befores = self._snapshot.get(node)
+            for i, dict_name in enumerate(_get_dict_names(node)):
+                before = {} if befores is None else befores[i]
+                after = getattr(node, dict_name)
+                for key in before.keys() | after.keys():
+                    old, new = before.get(key, _MISSING), after.get(key, _MISSING)
+                    if old is not new:
+                        self._changes.append((node, dict_name, key, old, new))
+        if self._auxiliary_handler is not None:
+            self._auxiliary_data = self._auxiliary_handler.auxiliary_data_list[
+                self._n_auxiliary_data:]
+        self._snapshot = {}
+
+    def get_recorded_relations(self) -> dict[tuple[Node, str], set[Node]]:
+        """Get the keys that have been set in the relation dictionaries of the nodes."""
+        relations = {}
+        for node, dict_name, key, _, new in self._changes:
+            if new is not _MISSING:
+                relations.setdefault((node, dict_name), set()).add(key)
+        return relations
+
+    def get_changed_values(self) -> list[object]:
+        """Get the new values of the relations that have been changed."""
+        return [new for _, _, _, _, new in self._changes if new is not _MISSING]
+
+    def undo(self) -> None:
+        """Undo the recorded changes.
+
+        Explanation
+        -----------
+        Changes are only reverted if the value has not been changed afterward. The
+        journals should therefore be undone in reverse chronological order.
+        """
+        for node, dict_name, key, old, new in reversed(self._changes):
+            relations = getattr(node, dict_name)
+            if relations.get(key, _MISSING) is not new:
+                continue
+            if old is _MISSING:
+                del relations[key]
+            else:
+                relations[key] = old
+        if self._auxiliary_handler is not None:
+            data_list = self._auxiliary_handler.auxiliary_data_list
+            data_list[:] = [data for data in data_list
+                            if not any(data is ad for ad in self._auxiliary_data)]
+        self._changes, self._auxiliary_data = [], []
+
+
+def remove_cached_relations(journals: Iterable[GraphJournal]) -> None:
+    """Remove cached relations, which have not been recorded by the journals.
+
+    Explanation
+    -----------
+    SymPy caches the velocities of points and the direction cosine matrices between
+    reference frames when they are computed. Such a cached relation may be outdated
+    after undoing a journal, so all relations of the nodes in the journals that have not
+    been set during a recorded stage are removed.
+    """
+    relations = {}
+    for journal in journals:
+        for key, frames in journal.get_recorded_relations().items():
+            relations.setdefault(key, set()).update(frames)
+    for node in {node for node, _ in relations}:
+        if isinstance(node, Point):
+            recorded = relations.get((node, "_vel_dict"), set())
+            for frame in [fr for fr in node._vel_dict if fr not in recorded]:
+                del node._vel_dict[frame]
+        else:
+            for frame in [fr for fr in node._dcm_cache if fr not in node._dcm_dict]:
+                del node._dcm_cache[frame]
@@ -1,10 +1,15 @@
 """Registry to keep track of all existing model and connection types in SymBRiM."""
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from symbrim.core.requirement import ConnectionRequirement, ModelRequirement
 from symbrim.core.singleton import Singleton
+from symbrim.utilities.lazy_loading import (
+    import_convention_modules,
+    import_lazy_modules,
+)
 
 if TYPE_CHECKING:
     from symbrim.core.base_classes import ConnectionBase, ModelBase
@@ -13,38 +18,71 @@ __all__ = ["Registry"]
 
 
 class Registry(Singleton):
-    """Registry to keep track of all existing model and connection types in SymBRiM."""
+    """Registry to keep track of all existing model and connection types in SymBRiM.
+
+    Explanation
+    -----------
+    Besides the sets of registered types, the registry maintains indexes, which are
+    updated upon registration. The models and connections are indexed by each class in
+    their method resolution order, the models are also indexed by their convention, and
+    the load groups are indexed by their required parent types. This allows retrieving
+    the options of a requirement without checking every registered type.
+
+    As the subpackages of SymBRiM are lazily imported, types are only registered once
+    their module is imported. Therefore, all lazily imported modules are imported
+    before the registered types are retrieved. The exception is retrieving the models
+    of a convention, which only imports the modules recorded for that convention. If
+    no models of the convention are found in those, then all lazily imported modules
+    are imported as well.
+    """
 
     def __init__(self) -> None:
         self._models = set()
         self._connections = set()
         self._load_groups = set()
+        self._models_by_base = defaultdict(set)
+        self._connections_by_base = defaultdict(set)
+        self._models_by_convention = defaultdict(set)
+        self._load_groups_by_parent = defaultdict(set)
 
     def register_model(self, model: type) -> None:
         """Register a new type in the registry."""
         self._models.add(model)
+        for base in model.__mro__:
+            self._models_by_base[base].add(model)
+            self._models_by_convention[(model.convention, base)].add(model)
 
     def register_connection(self, conn: type) -> None:
         """Register a new type in the registry."""
         self._connections.add(conn)
+        for base in conn.__mro__:
+            self._connections_by_base[base].add(conn)
 
     def register_load_group(self, group: type) -> None:
         """Register a new load group in the registry."""
         self._load_groups.add(group)
+        parent_types = group.required_parent_type
+        if not isinstance(parent_types, tuple):
+            parent_types = (parent_types,)
+        for parent_type in parent_types:
+            self._load_groups_by_parent[parent_type].add(group)
 
     @property
     def models(self) -> frozenset[type]:
         """Return the registered models."""
+        import_lazy_modules()
         return frozenset(self._models)
 
     @property
     def connections(self) -> frozenset[type]:
         """Return the registered connections."""
+        import_lazy_modules()
         return frozenset(self._connections)
 
     @property
     def load_groups(self) -> frozenset[type]:
         """Return the registered load groups."""
+        import_lazy_modules()
         return frozenset(self._load_groups)
 
     def get_from_property(self, obj: ModelBase | ConnectionBase, prop: str,
@@ -87,19 +125,17 @@ class Registry(Singleton):
         list[type]
             All models or connections that satisfy the given requirement.
         """
+        import_lazy_modules()
         if isinstance(requirement, ModelRequirement):
-            options = [
-                model for model in self.models if requirement.is_satisfied_by(model)
-            ]
+            index = self._models_by_base
         elif isinstance(requirement, ConnectionRequirement):
-            options = [
-                conn for conn in self.connections if requirement.is_satisfied_by(conn)
-            ]
+            index = self._connections_by_base
         else:
             raise TypeError(
                 f"Expected requirement to be of type {ModelRequirement} or "
                 f"{ConnectionRequirement}, but got {type(requirement)} instead."
             )
+        options = list(set().union(*(index.get(tp, ()) for tp in requirement.types)))
         if drop_abstract:
             options = [option for option in options if option.__name__[-4:] != "Base"]
         return options
@@ -120,13 +156,31 @@ class Registry(Singleton):
         list[type]
             All load groups that could be applied to the given object.
         """
-        options = []
+        import_lazy_modules()
         if not isinstance(obj, type):
             obj = type(obj)
-        options = [
-            group for group in self.load_groups
-            if issubclass(obj, group.required_parent_type)
-        ]
+        options = list(set().union(
+            *(self._load_groups_by_parent.get(base, ()) for base in obj.__mro__)))
         if drop_abstract:
             options = [option for option in options if option.__name__[-4:] != "Base"]
         return options
+
+    def get_from_convention(self, convention: str, base: type) -> list[type]:
+        """Return all models of the given type that follow the given convention.
+
+        Parameters
+        ----------
+        convention : str
+            The convention of the models.
+        base : type
+            The type the models should be a subclass of.
+
+        Returns
+        -------
+        list[type]
+            All models of the given type that follow the given convention.
+        """
+        import_convention_modules(convention)
+        if (convention, base) not in self._models_by_convention:
+            import_lazy_modules()
+        return list(self._models_by_convention.get((convention, base), ()))
@@ -1,5 +1,13 @@
 """Module containing other models, which are neither bicycles nor riders."""
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
 
 __all__ = ["RollingDisc"]
 
-from symbrim.other.rolling_disc import RollingDisc
+if TYPE_CHECKING:
+    from symbrim.other.rolling_disc import RollingDisc
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "rolling_disc": ("RollingDisc",),
+})
@@ -1,4 +1,7 @@
 """Rider module."""
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
 
 __all__ = [
     "RiderLean", "RiderLeanConnection",
@@ -35,53 +38,83 @@ __all__ = [
     "SphericalShoulderTorque", "SphericalShoulderSpringDamper",
 ]
 
-from symbrim.rider.arms import (
-    ArmBase,
-    LeftArmBase,
-    PinElbowSpringDamper,
-    PinElbowStickLeftArm,
-    PinElbowStickRightArm,
-    PinElbowTorque,
-    RightArmBase,
-)
-from symbrim.rider.base_connections import (
-    HipBase,
-    LeftHipBase,
-    LeftShoulderBase,
-    RightHipBase,
-    RightShoulderBase,
-    SacrumBase,
-    ShoulderBase,
-)
-from symbrim.rider.hip_joints import (
-    PinLeftHip,
-    PinRightHip,
-    SphericalHipSpringDamper,
-    SphericalHipTorque,
-    SphericalLeftHip,
-    SphericalRightHip,
-)
-from symbrim.rider.legs import (
-    LeftLegBase,
-    LegBase,
-    RightLegBase,
-    TwoPinLegSpringDamper,
-    TwoPinLegTorque,
-    TwoPinStickLeftLeg,
-    TwoPinStickRightLeg,
-)
-from symbrim.rider.pelvis import PelvisBase, PlanarPelvis
-from symbrim.rider.rider import Rider
-from symbrim.rider.rider_lean import RiderLean, RiderLeanConnection
-from symbrim.rider.sacrums import FixedSacrum
-from symbrim.rider.shoulder_joints import (
-    FlexAddLeftShoulder,
-    FlexAddRightShoulder,
-    FlexRotLeftShoulder,
-    FlexRotRightShoulder,
-    SphericalLeftShoulder,
-    SphericalRightShoulder,
-    SphericalShoulderSpringDamper,
-    SphericalShoulderTorque,
-)
-from symbrim.rider.torso import PlanarTorso, TorsoBase
+if TYPE_CHECKING:
+    from symbrim.rider.arms import (
+        ArmBase,
+        LeftArmBase,
+        PinElbowSpringDamper,
+        PinElbowStickLeftArm,
+        PinElbowStickRightArm,
+        PinElbowTorque,
+        RightArmBase,
+    )
+    from symbrim.rider.base_connections import (
+        HipBase,
+        LeftHipBase,
+        LeftShoulderBase,
+        RightHipBase,
+        RightShoulderBase,
+        SacrumBase,
+        ShoulderBase,
+    )
+    from symbrim.rider.hip_joints import (
+        PinLeftHip,
+        PinRightHip,
+        SphericalHipSpringDamper,
+        SphericalHipTorque,
+        SphericalLeftHip,
+        SphericalRightHip,
+    )
+    from symbrim.rider.legs import (
+        LeftLegBase,
+        LegBase,
+        RightLegBase,
+        TwoPinLegSpringDamper,
+        TwoPinLegTorque,
+        TwoPinStickLeftLeg,
+        TwoPinStickRightLeg,
+    )
+    from symbrim.rider.pelvis import PelvisBase, PlanarPelvis
+    from symbrim.rider.rider import Rider
+    from symbrim.rider.rider_lean import RiderLean, RiderLeanConnection
+    from symbrim.rider.sacrums import FixedSacrum
+    from symbrim.rider.shoulder_joints import (
+        FlexAddLeftShoulder,
+        FlexAddRightShoulder,
+        FlexRotLeftShoulder,
+        FlexRotRightShoulder,
+        SphericalLeftShoulder,
+        SphericalRightShoulder,
+        SphericalShoulderSpringDamper,
+        SphericalShoulderTorque,
+    )
+    from symbrim.rider.torso import PlanarTorso, TorsoBase
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "arms": (
+        "ArmBase", "LeftArmBase", "PinElbowSpringDamper", "PinElbowStickLeftArm",
+        "PinElbowStickRightArm", "PinElbowTorque", "RightArmBase",
+    ),
+    "base_connections": (
+        "HipBase", "LeftHipBase", "LeftShoulderBase", "RightHipBase",
+        "RightShoulderBase", "SacrumBase", "ShoulderBase",
+    ),
+    "hip_joints": (
+        "PinLeftHip", "PinRightHip", "SphericalHipSpringDamper", "SphericalHipTorque",
+        "SphericalLeftHip", "SphericalRightHip",
+    ),
+    "legs": (
+        "LeftLegBase", "LegBase", "RightLegBase", "TwoPinLegSpringDamper",
+        "TwoPinLegTorque", "TwoPinStickLeftLeg", "TwoPinStickRightLeg",
+    ),
+    "pelvis": ("PelvisBase", "PlanarPelvis"),
+    "rider": ("Rider",),
+    "rider_lean": ("RiderLean", "RiderLeanConnection"),
+    "sacrums": ("FixedSacrum",),
+    "shoulder_joints": (
+        "FlexAddLeftShoulder", "FlexAddRightShoulder", "FlexRotLeftShoulder",
+        "FlexRotRightShoulder", "SphericalLeftShoulder", "SphericalRightShoulder",
+        "SphericalShoulderSpringDamper", "SphericalShoulderTorque",
+    ),
+    "torso": ("PlanarTorso", "TorsoBase"),
+})
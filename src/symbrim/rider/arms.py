@@ -1,7 +1,6 @@
 """Module containing models of the arms."""
 from __future__ import annotations
 
-import contextlib
 from abc import abstractmethod
 from typing import TYPE_CHECKING
 
@@ -18,14 +17,12 @@ from sympy.physics.mechanics import (
 
 from symbrim.core import LoadGroupBase, ModelBase
 
-with contextlib.suppress(ImportError):
-    from symbrim.utilities.parametrize import get_inertia_vals_from_yeadon
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
-if TYPE_CHECKING:
-    with contextlib.suppress(ImportError):
         from symbrim.utilities.plotting import PlotModel
 
 __all__ = ["ArmBase", "LeftArmBase", "RightArmBase", "PinElbowStickLeftArm",
@@ -174,6 +171,8 @@ class PinElbowStickLeftArm(PinElbowStickArmMixin, LeftArmBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the pelvis."""
+        from symbrim.utilities.parametrize import get_inertia_vals_from_yeadon
+
         params = super().get_param_values(bicycle_parameters)
         human = bicycle_parameters.human
         if human is None:
@@ -198,6 +197,8 @@ class PinElbowStickRightArm(PinElbowStickArmMixin, RightArmBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the pelvis."""
+        from symbrim.utilities.parametrize import get_inertia_vals_from_yeadon
+
         params = super().get_param_values(bicycle_parameters)
         human = bicycle_parameters.human
         if human is None:
@@ -1,7 +1,6 @@
 """Module containing pelvis models."""
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING
 
 from sympy import Symbol
@@ -9,16 +8,12 @@ from sympy.physics.mechanics import Point
 
 from symbrim.core import ModelBase, NewtonianBodyMixin
 
-with contextlib.suppress(ImportError):
-    import numpy as np
-
-    from symbrim.utilities.parametrize import get_inertia_vals_from_yeadon
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
-if TYPE_CHECKING:
-    with contextlib.suppress(ImportError):
         from symbrim.utilities.plotting import PlotModel
 
 __all__ = ["PelvisBase", "PlanarPelvis"]
@@ -111,6 +106,10 @@ class PlanarPelvis(PelvisBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get the parameter values of the pelvis."""
+        import numpy as np
+
+        from symbrim.utilities.parametrize import get_inertia_vals_from_yeadon
+
         params = super().get_param_values(bicycle_parameters)
         human = bicycle_parameters.human
         if human is None:
@@ -1,7 +1,6 @@
 """Module containing connections between the pelvis and the torso."""
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING
 
 from sympy import Symbol
@@ -9,10 +8,10 @@ from sympy.physics.mechanics import System, Vector, WeldJoint
 
 from symbrim.rider.base_connections import SacrumBase
 
-with contextlib.suppress(ImportError):
-    import numpy as np
+if TYPE_CHECKING:
+    import contextlib
 
-    if TYPE_CHECKING:
+    with contextlib.suppress(ImportError):
         from bicycleparameters import Bicycle
 
 __all__ = ["FixedSacrum"]
@@ -62,6 +61,8 @@ class FixedSacrum(SacrumBase):
 
     def get_param_values(self, bicycle_parameters: Bicycle) -> dict[Symbol, float]:
         """Get a parameters mapping of a model based on a bicycle parameters object."""
+        import numpy as np
+
         params = super().get_param_values(bicycle_parameters)
         human = bicycle_parameters.human
         if human is None:
@@ -1,32 +1,110 @@
 """Module containing utilities to easily benchmark models."""
 from __future__ import annotations
 
+import timeit
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
-from sympy import count_ops, cse
+from sympy import lambdify
 from sympy.core.cache import clear_cache
+from sympy.physics.mechanics import dynamicsymbols, find_dynamicsymbols
+
+from symbrim.core import ModelBase
+from symbrim.utilities.utilities import count_operations
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from pytest_benchmark.fixture import BenchmarkFixture
     from sympy.physics.mechanics import KanesMethod, System
 
-__all__ = ["benchmark"]
+__all__ = ["PHASES", "benchmark"]
+
+PHASES = ("create", "define_all", "to_system", "form_eoms", "lambdify")
+
+
+@contextmanager
+def _time_phase(times: dict[str, list[float]], phase: str) -> Iterator[None]:
+    """Record the wall time of the context as a duration of a phase."""
+    start = perf_counter()
+    yield
+    times.setdefault(phase, []).append(perf_counter() - start)
+
+
+def _lambdify_rhs(eoms_object: KanesMethod | System, times: dict[str, list[float]]
+                  ) -> Callable[[], np.ndarray]:
+    """Lambdify the right-hand side of the equations of motion.
+
+    Explanation
+    -----------
+    All constants and dynamic symbols other than the state are treated as arguments,
+    which are given random values. The returned function evaluates the full mass
+    matrix and forcing vector and solves for the time derivatives of the state.
+    """
+    mass_matrix, forcing = eoms_object.mass_matrix_full, eoms_object.forcing_full
+    state = eoms_object.q.col_join(eoms_object.u)
+    inputs = sorted(find_dynamicsymbols(mass_matrix).union(
+        find_dynamicsymbols(forcing)).difference(state), key=str)
+    constants = sorted(mass_matrix.free_symbols.union(forcing.free_symbols).difference(
+        {dynamicsymbols._t}), key=str)
+    with _time_phase(times, "lambdify"):
+        eval_eoms = lambdify((state, inputs, constants), (mass_matrix, forcing),
+                             cse=True)
+    rng = np.random.default_rng(0)
+    args = [rng.uniform(0.5, 1.5, len(arg)) for arg in (state, inputs, constants)]
+
+    def eval_rhs() -> np.ndarray:
+        return np.linalg.solve(*eval_eoms(*args))
+
+    return eval_rhs
 
 
 def benchmark(
-    rounds: int = 3, group: str | None = None, **kwargs: dict[str, object]
-) -> Callable[[Callable[[], KanesMethod | System]], Callable]:
+    rounds: int = 3, group: str | None = None,
+    configure_system: Callable[[ModelBase, System], None] | None = None,
+    evaluate: bool = True, trace_memory: bool = False, **kwargs: dict[str, object]
+) -> Callable[[Callable[[], ModelBase | KanesMethod | System]], Callable]:
     """Create decorator to benchmark a function.
 
+    Explanation
+    -----------
+    The benchmark times the complete derivation of the equations of motion. The mean
+    wall time of each phase is stored separately in the extra info of the benchmark as
+    ``time_<phase>``, where the phases are listed in :data:`PHASES`. The ``create``
+    phase is the call to the decorated function, while the ``define_all`` and
+    ``to_system`` phases are only timed if the decorated function returns a model.
+    The number of operations in the equations of motion is stored as
+    ``operation_eoms_dag`` and ``operation_eoms_dag_csed``, see
+    :func:`symbrim.utilities.utilities.count_operations`, which counts the operations
+    on the expression graph and therefore differs from :func:`sympy.count_ops`.
+    After the timed rounds, the equations of motion are optionally lambdified once,
+    after which the number of evaluations of the right-hand side per second is
+    measured. Lastly, the peak memory usage of the derivation can be measured in a
+    separate run, such that tracing the memory does not influence the timings.
+
     Parameters
     ----------
     rounds : int, optional
         Number of rounds to run the benchmark for, by default 3.
     group : Optional[str], optional
         Group to put the benchmark in, by default None.
+    configure_system : Callable[[ModelBase, System], None], optional
+        Function to configure the system of a model before forming the equations of
+        motion, e.g. by applying gravity and specifying the independent and dependent
+        generalized coordinates and speeds. It is called with the model and its
+        system and is not included in the timings. By default None.
+    evaluate : bool, optional
+        Whether to lambdify the equations of motion and measure the number of
+        evaluations of the right-hand side per second, by default True. Lambdifying
+        the equations of motion of large models can take several minutes.
+    trace_memory : bool, optional
+        Whether to measure the peak memory usage of the derivation, by default False.
+        As the equations of motion are derived once more, this doubles the duration
+        of a single round.
     kwargs
         If kwargs are provided, then they are passed to
         :meth:`sympy.physics.mechanics.system.System.form_eoms`.
@@ -35,29 +113,61 @@ def benchmark(
     -------
     function
         Decorated function, which should return an instance of
+        :class:`symbrim.core.base_classes.ModelBase`,
         :class:`sympy.physics.mechanics.system.System` or
         :class:`sympy.physics.mechanics.kane.KanesMethod`.
 
     """
 
-    def decorator(func: Callable[[], KanesMethod | System]) -> Callable:
+    def decorator(func: Callable[[], ModelBase | KanesMethod | System]) -> Callable:
         @pytest.mark.benchmark(group=group)
         def wrapper(benchmark: BenchmarkFixture) -> None:
-            data = {}
+            data, times = {}, {}
 
             def setup() -> None:
                 clear_cache()
 
             def form_eoms() -> None:
-                data["system"] = func()
-                if hasattr(data["system"], "form_eoms"):
-                    data["eoms"] = data["system"].form_eoms(**kwargs)
-                else:
-                    data["eoms"] = data["system"]._form_eoms()
+                with _time_phase(times, "create"):
+                    data["system"] = func()
+                if isinstance(data["system"], ModelBase):
+                    model = data["system"]
+                    with _time_phase(times, "define_all"):
+                        model.define_all()
+                    with _time_phase(times, "to_system"):
+                        data["system"] = model.to_system()
+                    if configure_system is not None:
+                        configure_system(model, data["system"])
+                with _time_phase(times, "form_eoms"):
+                    if hasattr(data["system"], "form_eoms"):
+                        data["eoms"] = data["system"].form_eoms(**kwargs)
+                    else:
+                        data["eoms"] = data["system"]._form_eoms()
 
             benchmark.pedantic(form_eoms, setup=setup, rounds=rounds)
-            benchmark.extra_info["operation_eoms"] = count_ops(data["eoms"])
-            benchmark.extra_info["operation_eoms_csed"] = count_ops(cse(data["eoms"]))
+            for phase, durations in times.items():
+                benchmark.extra_info[f"time_{phase}"] = sum(durations) / len(durations)
+            n_ops, n_ops_csed = count_operations(data["eoms"])
+            benchmark.extra_info["operation_eoms_dag"] = n_ops
+            benchmark.extra_info["operation_eoms_dag_csed"] = n_ops_csed
+
+            if evaluate:
+                times.clear()
+                eval_rhs = _lambdify_rhs(data["system"], times)
+                benchmark.extra_info["time_lambdify"] = times["lambdify"][0]
+                n_evaluations, duration = timeit.Timer(eval_rhs).autorange()
+                benchmark.extra_info["rhs_evaluations_per_second"] = (
+                    n_evaluations / duration)
+
+            if trace_memory and not tracemalloc.is_tracing():
+                setup()
+                tracemalloc.start()
+                try:
+                    form_eoms()
+                    benchmark.extra_info["peak_memory"] = (
+                        tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
 
         return wrapper
 
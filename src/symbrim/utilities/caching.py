@@ -0,0 +1,353 @@
+"""Module containing utilities to cache the equations of motion of models on disk.
+
+Explanation
+-----------
+Deriving the equations of motion of a large model, like a bicycle-rider model, can
+take minutes. As the result only depends on the configuration of the model, i.e. the
+types of the submodels, connections and load groups, their names and their settings,
+the equations of motion can be stored on disk and reused by later processes. The
+:class:`EomCache` stores the equations of motion under a content-addressed key, which
+is computed from the model tree using :func:`get_model_key`.
+
+Notes
+-----
+The equations of motion are serialized using :mod:`pickle`. Therefore, only load
+caches from trusted sources.
+
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import sympy
+from sympy import ImmutableMatrix
+from sympy.physics.mechanics import KanesMethod
+
+import symbrim
+from symbrim.core import ModelBase
+
+if TYPE_CHECKING:
+    from sympy import Expr
+    from sympy.physics.mechanics import System
+
+    from symbrim.core.base_classes import BrimBase
+
+__all__ = ["CachedEoms", "EomCache", "get_model_key"]
+
+_CACHE_FORMAT_VERSION = 2
+_KEY_ATTRIBUTE_TYPES = (bool, int, float, str, type(None))
+# Public attributes, which are derived from the connectivity or described separately.
+_KEY_DESCRIBED_ATTRIBUTES = ("is_root", "symbols", "q", "u", "u_aux")
+
+
+def _get_setting_names(obj: BrimBase) -> set[str]:
+    """Get the names of the attributes storing the settings of an object.
+
+    Explanation
+    -----------
+    The settings are the public instance attributes, like
+    :attr:`symbrim.bicycle.tires.InContactTire.compute_normal_force`, and the private
+    attributes storing the arguments of the constructor and the settable properties,
+    like the normal of :class:`symbrim.bicycle.grounds.FlatGround`.
+    """
+    cls = type(obj)
+    public = {name for name, member in inspect.getmembers(cls)
+              if isinstance(member, property) and member.fset is not None}
+    public.update(inspect.signature(cls).parameters)
+    public.discard("name")
+    names = {f"_{name}" for name in public}
+    names.update(attr for attr in obj._initial_state if not attr.startswith("_"))
+    return names.difference(_KEY_DESCRIBED_ATTRIBUTES)
+
+
+def _get_tree_description(obj: BrimBase) -> tuple:
+    """Get a hashable description of the tree of a defined object."""
+    cls = type(obj)
+    # The definition replaces some settings, so the state before it is used instead.
+    state = obj._initial_state
+    settings = []
+    for attr in sorted(_get_setting_names(obj).intersection(state)):
+        value = state[attr]
+        if not isinstance(value, _KEY_ATTRIBUTE_TYPES):
+            raise TypeError(
+                f"Cannot compute the key of {obj!r}, because its setting {attr!r} is "
+                f"not a primitive but an instance of {type(value)}.")
+        settings.append((attr, repr(value)))
+    symbols = [("symbols", repr(sorted(
+        (name, str(symbol)) for name, symbol in obj.symbols.items())))]
+    symbols.extend((attr, str(getattr(obj, attr)[:]))
+                   for attr in ("q", "u", "u_aux") if hasattr(obj, attr))
+    frozen_values = ()
+    children = []
+    if isinstance(obj, ModelBase):
+        frozen_values = tuple(sorted(
+            (str(sym), str(value)) for sym, value in obj._frozen_values.items()))
+        for req in obj.required_models + obj.required_connections:
+            child = getattr(obj, req.attribute_name)
+            children.append((req.attribute_name, None if child is None else
+                             _get_tree_description(child)))
+    load_groups = tuple(_get_tree_description(load_group)
+                        for load_group in getattr(obj, "load_groups", ()))
+    return (f"{cls.__module__}.{cls.__qualname__}", getattr(cls, "convention", ""),
+            obj.name, tuple(settings), tuple(symbols), frozen_values, tuple(children),
+            load_groups)
+
+
+def get_model_key(model: ModelBase, **options: object) -> str:
+    """Get a stable key describing the configuration of a model.
+
+    Explanation
+    -----------
+    The key is computed from the model tree after its objects have been defined, such
+    that it does not change when the model is defined further. The tree is described
+    by a whitelist consisting of the classes, conventions and names of the models,
+    connections and load groups, the submodels and load groups connected to them, the
+    names of their symbols, generalized coordinates and speeds, their frozen values
+    and their settings. The settings are the public primitive attributes and the
+    private attributes storing the constructor arguments and settable properties, see
+    for example :class:`symbrim.bicycle.grounds.FlatGround`. Settings that are not
+    primitive cannot be described reliably, therefore a TypeError is raised if any is
+    present. The submodels of connections are not included as they are set by the
+    parent model. Additional options, like the chosen independent coordinates or the
+    constraint solver, can be passed as keyword arguments and are included using
+    their string representation. The versions of SymBRiM and SymPy are included as
+    well, as they affect the equations of motion.
+
+    Parameters
+    ----------
+    model : ModelBase
+        Root model of the tree, of which the objects have been defined.
+    **options : object
+        Additional options that affect the equations of motion.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 hash of the model configuration.
+
+    Notes
+    -----
+    The symbols are created when the objects of the model are defined. Therefore, if
+    symbols are changed, e.g. to substitute them, then the key should be computed after
+    the change and before the symbols are used in the kinematics. The settings of a
+    defined object are taken from its state before the definition, as some objects
+    replace their settings while being defined.
+    """
+    if not isinstance(model, ModelBase):
+        raise TypeError(f"Model should be an instance of {ModelBase}, but {model!r} is "
+                        f"an instance of {type(model)}.")
+    if "objects" not in model._defined_stages:
+        raise ValueError(f"The objects of {model!r} must be defined before computing "
+                         f"its key.")
+    description = (
+        _CACHE_FORMAT_VERSION,
+        symbrim.__version__,
+        sympy.__version__,
+        _get_tree_description(model),
+        tuple(sorted((name, str(value)) for name, value in options.items())),
+    )
+    return hashlib.sha256(repr(description).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedEoms:
+    """Dataclass storing the equations of motion of a system.
+
+    Parameters
+    ----------
+    q_ind : ImmutableMatrix
+        Independent generalized coordinates.
+    q_dep : ImmutableMatrix
+        Dependent generalized coordinates.
+    u_ind : ImmutableMatrix
+        Independent generalized speeds.
+    u_dep : ImmutableMatrix
+        Dependent generalized speeds.
+    u_aux : ImmutableMatrix
+        Auxiliary generalized speeds.
+    kdes : ImmutableMatrix
+        Kinematic differential equations.
+    kindiffdict : dict[Expr, Expr]
+        Mapping from the time derivatives of the generalized coordinates to the
+        generalized speeds. Only available if Kane's method has been used.
+    holonomic_constraints : ImmutableMatrix
+        Holonomic constraints.
+    nonholonomic_constraints : ImmutableMatrix
+        Nonholonomic constraints.
+    velocity_constraints : ImmutableMatrix
+        Velocity constraints.
+    mass_matrix : ImmutableMatrix
+        Mass matrix of the dynamic differential equations.
+    forcing : ImmutableMatrix
+        Forcing vector of the dynamic differential equations.
+    mass_matrix_full : ImmutableMatrix
+        Mass matrix of the kinematic and dynamic differential equations.
+    forcing_full : ImmutableMatrix
+        Forcing vector of the kinematic and dynamic differential equations.
+    """
+
+    q_ind: ImmutableMatrix
+    q_dep: ImmutableMatrix
+    u_ind: ImmutableMatrix
+    u_dep: ImmutableMatrix
+    u_aux: ImmutableMatrix
+    kdes: ImmutableMatrix
+    kindiffdict: dict[Expr, Expr]
+    holonomic_constraints: ImmutableMatrix
+    nonholonomic_constraints: ImmutableMatrix
+    velocity_constraints: ImmutableMatrix
+    mass_matrix: ImmutableMatrix
+    forcing: ImmutableMatrix
+    mass_matrix_full: ImmutableMatrix
+    forcing_full: ImmutableMatrix
+
+    @classmethod
+    def from_system(cls, system: System) -> CachedEoms:
+        """Extract the equations of motion from a system."""
+        if system.eom_method is None:
+            raise ValueError("Equations of motion have not been formed yet.")
+        kindiffdict = system.eom_method.kindiffdict() if isinstance(
+            system.eom_method, KanesMethod) else {}
+        return cls(
+            **{field.name: ImmutableMatrix(getattr(system, field.name))
+               for field in fields(cls) if field.name != "kindiffdict"},
+            kindiffdict=kindiffdict,
+        )
+
+    @property
+    def q(self) -> ImmutableMatrix:
+        """Generalized coordinates."""
+        return self.q_ind.col_join(self.q_dep)
+
+    @property
+    def u(self) -> ImmutableMatrix:
+        """Generalized speeds."""
+        return self.u_ind.col_join(self.u_dep)
+
+
+class EomCache:
+    """Content-addressed on-disk cache of the equations of motion of models.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        Directory in which the equations of motion are stored.
+
+    Examples
+    --------
+    The cache is used by computing the key after defining the objects of the model. If
+    the key is present, then the equations of motion are loaded from disk. Otherwise,
+    the model is defined further and the equations of motion are derived and stored.
+
+    >>> from symbrim import FlatGround, KnifeEdgeWheel, NonHolonomicTire
+    >>> from symbrim.other import RollingDisc
+    >>> from symbrim.utilities.caching import EomCache
+    >>> disc = RollingDisc("disc")
+    >>> disc.wheel = KnifeEdgeWheel("wheel")
+    >>> disc.ground = FlatGround("ground")
+    >>> disc.tire = NonHolonomicTire("tire")
+    >>> disc.define_connections()
+    >>> disc.define_objects()
+    >>> cache = EomCache(".symbrim_cache")  # doctest: +SKIP
+    >>> key = cache.get_key(disc)  # doctest: +SKIP
+    >>> eoms = cache.load(key)  # doctest: +SKIP
+    >>> if eoms is None:  # doctest: +SKIP
+    ...     disc.define_kinematics()
+    ...     disc.define_loads()
+    ...     disc.define_constraints()
+    ...     system = disc.to_system()
+    ...     system.u_ind = disc.u[2:]
+    ...     system.u_dep = disc.u[:2]
+    ...     system.form_eoms()
+    ...     eoms = cache.save(key, system)
+    """
+
+    def __init__(self, directory: str | os.PathLike) -> None:
+        self._directory = Path(directory)
+
+    @property
+    def directory(self) -> Path:
+        """Directory in which the equations of motion are stored."""
+        return self._directory
+
+    @staticmethod
+    def get_key(model: ModelBase, **options: object) -> str:
+        """Get the key of a model, see :func:`get_model_key`."""
+        return get_model_key(model, **options)
+
+    def _get_path(self, key: str) -> Path:
+        """Get the path of the file storing the equations of motion of a key."""
+        return self.directory / f"{key}.pkl"
+
+    def __contains__(self, key: str) -> bool:
+        return self._get_path(key).is_file()
+
+    def load(self, key: str) -> CachedEoms | None:
+        """Load the equations of motion stored under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the equations of motion.
+
+        Returns
+        -------
+        CachedEoms | None
+            Equations of motion if they are cached, otherwise None.
+        """
+        path = self._get_path(key)
+        if not path.is_file():
+            return None
+        with path.open("rb") as f:
+            eoms = pickle.load(f)  # noqa: S301
+        if not isinstance(eoms, CachedEoms):
+            raise TypeError(f"Cache file {path} does not contain {CachedEoms}.")
+        return eoms
+
+    def save(self, key: str, system: System | CachedEoms) -> CachedEoms:
+        """Store the equations of motion of a system under a key.
+
+        Parameters
+        ----------
+        key : str
+            Key of the equations of motion.
+        system : System | CachedEoms
+            System of which the equations of motion have been formed.
+
+        Returns
+        -------
+        CachedEoms
+            Equations of motion that have been stored.
+        """
+        eoms = system if isinstance(system, CachedEoms) else CachedEoms.from_system(
+            system)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, such that other processes never read a
+        # partially written file.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(eoms, f, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(tmp_path).replace(self._get_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        return eoms
+
+    def remove(self, key: str) -> None:
+        """Remove the equations of motion stored under a key."""
+        self._get_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all equations of motion from the cache."""
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.pkl"):
+                path.unlink()
+
@@ -0,0 +1,214 @@
+"""Module containing utilities to export the equations of motion to numeric code.
+
+Explanation
+-----------
+Evaluating the equations of motion numerically usually requires lambdifying them in
+the same process, which means that SymPy has to be imported and the model has to be
+derived or loaded before the first evaluation. Deployed applications, like controllers
+and batch simulations, only need the numeric functions. Therefore,
+:func:`generate_numpy_module` writes the equations of motion as a standalone Python
+module, which only imports NumPy. Besides the numeric functions, the module contains
+the names of the states, inputs and constants in the order in which the functions
+expect them.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sympy import Matrix, Symbol, cse, linear_eq_to_matrix, numbered_symbols
+from sympy.physics.mechanics import dynamicsymbols, find_dynamicsymbols, msubs
+from sympy.printing.numpy import NumPyPrinter
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+
+    from sympy import Basic
+    from sympy.physics.mechanics import System
+
+__all__ = ["generate_numpy_module"]
+
+_FUNCTIONS = (
+    ("mass_matrix", "Evaluate the mass matrix.", False),
+    ("forcing", "Evaluate the forcing vector.", True),
+    ("kinematic_map", "Evaluate the time derivatives of the coordinates.", True),
+    ("holonomic_constraints", "Evaluate the holonomic constraints.", True),
+    ("velocity_constraints", "Evaluate the velocity constraints.", True),
+)
+
+_MODULE_TEMPLATE = '''\
+"""Numeric functions of the equations of motion of a system.
+
+This module has been generated by SymBRiM and only depends on NumPy. All functions
+take the state ``x``, the inputs ``r`` and the constants ``p`` as arguments, which are
+ordered as in ``STATE``, ``INPUTS`` and ``CONSTANTS``.
+"""
+import numpy
+
+Q_IND = {q_ind}
+Q_DEP = {q_dep}
+U_IND = {u_ind}
+U_DEP = {u_dep}
+STATE = Q_IND + Q_DEP + U_IND + U_DEP
+INPUTS = {inputs}
+CONSTANTS = {constants}
+{functions}
+
+def eval_rhs(t, x, r, p):
+    """Evaluate the time derivative of the state.
+
+    The signature is compatible with ``scipy.integrate.solve_ivp``, where the inputs
+    and constants should be passed using ``args=(r, p)``.
+    """
+    return numpy.concatenate((
+        eval_kinematic_map(x, r, p),
+        numpy.linalg.solve(eval_mass_matrix(x, r, p), eval_forcing(x, r, p)),
+    ))
+'''
+
+
+def _generate_function(name: str, docstring: str, expr: Matrix,
+                       variables: dict[Symbol, str], vector: bool) -> str:
+    """Generate the source of a function evaluating a matrix.
+
+    Parameters
+    ----------
+    name : str
+        Name of the function.
+    docstring : str
+        One-line docstring of the function.
+    expr : Matrix
+        Matrix to evaluate, of which the symbols have been replaced by the keys of
+        ``variables``.
+    variables : dict[Symbol, str]
+        Mapping from the symbols to the source extracting them from the arguments.
+    vector : bool
+        Whether to return the matrix as a one-dimensional array.
+    """
+    printer = NumPyPrinter()
+    subexpressions, (expr,) = cse(expr, numbered_symbols("_c"))
+    used = expr.free_symbols.union(*(value.free_symbols for _, value in subexpressions))
+    lines = [f"def {name}(x, r, p):", f'    """{docstring}"""',
+             *(f"    {sym} = {source}" for sym, source in variables.items()
+               if sym in used),
+             *(f"    {sym} = {printer.doprint(value)}"
+               for sym, value in subexpressions)]
+    if not expr:
+        shape = (len(expr),) if vector else expr.shape
+        lines.append(f"    return numpy.zeros({shape})")
+        return "\n".join(lines)
+    if vector:
+        entries = ", ".join(printer.doprint(entry) for entry in expr)
+    else:
+        entries = ", ".join(
+            f"[{', '.join(printer.doprint(entry) for entry in expr.row(i))}]"
+            for i in range(expr.rows))
+    lines.append(f"    return numpy.array([{entries}], dtype=numpy.float64)")
+    return "\n".join(lines)
+
+
+def generate_numpy_module(
+    system: System, path: str | os.PathLike | None = None,
+    inputs: Sequence[Basic] | None = None, constants: Sequence[Basic] | None = None,
+) -> str:
+    """Generate a Python module evaluating the equations of motion using NumPy.
+
+    Explanation
+    -----------
+    The generated module contains the following functions, which all take the state,
+    inputs and constants as one-dimensional arrays:
+
+    - ``eval_mass_matrix(x, r, p)``: mass matrix of the dynamic differential equations.
+    - ``eval_forcing(x, r, p)``: forcing vector of the dynamic differential equations.
+    - ``eval_kinematic_map(x, r, p)``: time derivatives of the generalized
+      coordinates.
+    - ``eval_holonomic_constraints(x, r, p)``: holonomic constraints.
+    - ``eval_velocity_constraints(x, r, p)``: velocity constraints, i.e. the time
+      derivatives of the holonomic constraints and the nonholonomic constraints.
+    - ``eval_rhs(t, x, r, p)``: time derivative of the state.
+
+    The ordering is stored as tuples of the names of the symbols in ``Q_IND``,
+    ``Q_DEP``, ``U_IND``, ``U_DEP``, ``STATE``, ``INPUTS`` and ``CONSTANTS``. Common
+    subexpressions are eliminated within each function.
+
+    Parameters
+    ----------
+    system : System
+        System of which the equations of motion have been formed using Kane's method.
+    path : str | os.PathLike, optional
+        Path of the file to which the module is written. By default, the module is
+        not written.
+    inputs : Sequence[Basic], optional
+        Dynamic symbols, other than the state, in the order of the input vector. By
+        default, all dynamic symbols sorted by name.
+    constants : Sequence[Basic], optional
+        Symbols in the order of the constants vector. By default, all free symbols
+        sorted by name.
+
+    Returns
+    -------
+    str
+        Source code of the generated module.
+
+    Examples
+    --------
+    >>> system.form_eoms()  # doctest: +SKIP
+    >>> generate_numpy_module(system, "bicycle_eoms.py")  # doctest: +SKIP
+
+    The generated module can be used without importing SymPy:
+
+    >>> import bicycle_eoms  # doctest: +SKIP
+    >>> x_dot = bicycle_eoms.eval_rhs(0.0, x, r, p)  # doctest: +SKIP
+
+    """
+    if system.eom_method is None:
+        raise ValueError("Equations of motion have not been formed yet.")
+    t = dynamicsymbols._t
+    qdots = system.q.diff(t)
+    kdes_matrix, kdes_rhs = linear_eq_to_matrix(system.kdes, qdots[:])
+    kinematic_map = kdes_matrix.LUsolve(kdes_rhs)
+    exprs = {
+        "mass_matrix": Matrix(system.mass_matrix),
+        "forcing": Matrix(system.forcing),
+        "kinematic_map": kinematic_map,
+        "holonomic_constraints": Matrix(system.holonomic_constraints),
+        "velocity_constraints": Matrix(msubs(
+            system.velocity_constraints, dict(zip(qdots, kinematic_map)))),
+    }
+    state = system.q.col_join(system.u)[:]
+    found_inputs = set().union(*(find_dynamicsymbols(expr) for expr in exprs.values())
+                               ).difference(state)
+    found_constants = set().union(*(expr.free_symbols for expr in exprs.values()))
+    found_constants.discard(t)
+    arguments = {"x": state}
+    for arg, description, given, found in (("r", "inputs", inputs, found_inputs), (
+            "p", "constants", constants, found_constants)):
+        arguments[arg] = sorted(found, key=str) if given is None else list(given)
+        missing = found.difference(arguments[arg])
+        if missing:
+            raise ValueError(f"The {description} should contain "
+                             f"{sorted(missing, key=str)}.")
+    replacements, variables = {}, {}
+    for arg, syms in arguments.items():
+        for i, sym in enumerate(syms):
+            replacements[sym] = Symbol(f"{arg}_{i}")
+            variables[replacements[sym]] = f"{arg}[{i}]"
+    exprs = {name: expr.xreplace(replacements) for name, expr in exprs.items()}
+    if any(t in expr.free_symbols for expr in exprs.values()):
+        raise ValueError("Equations of motion depending explicitly on time are not "
+                         "supported.")
+    functions = "".join(
+        "\n\n" + _generate_function(f"eval_{name}", docstring, exprs[name], variables,
+                                    vector) + "\n"
+        for name, docstring, vector in _FUNCTIONS)
+    source = _MODULE_TEMPLATE.format(
+        q_ind=tuple(map(str, system.q_ind)), q_dep=tuple(map(str, system.q_dep)),
+        u_ind=tuple(map(str, system.u_ind)), u_dep=tuple(map(str, system.u_dep)),
+        inputs=tuple(map(str, arguments["r"])),
+        constants=tuple(map(str, arguments["p"])),
+        functions=functions,
+    )
+    if path is not None:
+        Path(path).write_text(source)
+    return source
@@ -0,0 +1,122 @@
+"""Module containing utilities to lazily import the submodules of a package."""
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["attach_lazy_attributes", "import_convention_modules", "import_lazy_modules"]
+
+_PENDING_MODULES: dict[str, None] = {}
+_CONVENTION_MODULES: dict[str, dict[str, None]] = {}
+
+
+def attach_lazy_attributes(
+    package_name: str, submodule_attributes: dict[str, tuple[str, ...]],
+    conventions: dict[str, tuple[str, ...]] | None = None,
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Create the ``__getattr__`` and ``__dir__`` to lazily import a package.
+
+    Explanation
+    -----------
+    Importing all models of SymBRiM upon importing the package is slow, as most time
+    is spent on importing the modules of SymPy, which are required by the models. This
+    function creates the module level ``__getattr__`` and ``__dir__`` functions
+    according to PEP 562, such that a submodule is only imported once one of its
+    attributes is accessed. The imported attributes are stored in the package, such
+    that ``__getattr__`` is only called upon the first access.
+
+    As models are registered in the :class:`symbrim.core.registry.Registry` when their
+    module is imported, the submodules are also recorded as pending. They can be
+    imported using :func:`import_lazy_modules`, which is done by the registry before
+    it is queried. Creating a model from a convention only requires the models of that
+    convention, therefore the submodules defining them can be recorded per convention
+    to be imported using :func:`import_convention_modules`.
+
+    Parameters
+    ----------
+    package_name : str
+        Full name of the package, i.e. ``__name__`` of the package.
+    submodule_attributes : dict[str, tuple[str, ...]]
+        Mapping of the names of the submodules, relative to the package, to the
+        attributes to be lazily imported from them.
+    conventions : dict[str, tuple[str, ...]], optional
+        Mapping of the conventions to the names of the submodules, relative to the
+        package, that define models following them.
+
+    Returns
+    -------
+    tuple[Callable[[str], object], Callable[[], list[str]]]
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+
+    Examples
+    --------
+    In the ``__init__.py`` of a package:
+
+    >>> __getattr__, __dir__ = attach_lazy_attributes(
+    ...     __name__, {"wheels": ("KnifeEdgeWheel", "ToroidalWheel")})
+
+    If the package defines models following a convention:
+
+    >>> __getattr__, __dir__ = attach_lazy_attributes(
+    ...     __name__, {"rear_frames": ("RigidRearFrame", "RigidRearFrameMoore")},
+    ...     {"moore": ("rear_frames",)})
+
+    """
+    attribute_to_submodule = {
+        attr: submodule for submodule, attrs in submodule_attributes.items()
+        for attr in attrs
+    }
+    for submodule in submodule_attributes:
+        _PENDING_MODULES[f"{package_name}.{submodule}"] = None
+    for convention, submodules in (conventions or {}).items():
+        _CONVENTION_MODULES.setdefault(convention, {}).update(
+            (f"{package_name}.{submodule}", None) for submodule in submodules)
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        if name in attribute_to_submodule:
+            module = importlib.import_module(
+                f"{package_name}.{attribute_to_submodule[name]}")
+            value = getattr(module, name)
+        elif name in submodule_attributes:
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted(set(sys.modules[package_name].__dict__).union(
+            attribute_to_submodule, submodule_attributes))
+
+    return __getattr__, __dir__
+
+
+def import_lazy_modules() -> None:
+    """Import all submodules, which have been registered to be lazily imported.
+
+    Explanation
+    -----------
+    Importing a lazily imported subpackage may register new submodules to be lazily
+    imported. Therefore, modules are imported until there are no pending modules left.
+    """
+    while _PENDING_MODULES:
+        module_name = next(iter(_PENDING_MODULES))
+        del _PENDING_MODULES[module_name]
+        importlib.import_module(module_name)
+
+
+def import_convention_modules(convention: str) -> None:
+    """Import the lazily imported submodules defining models of a convention.
+
+    Explanation
+    -----------
+    Only the submodules recorded for the convention using
+    :func:`attach_lazy_attributes` are imported, which are thereby no longer pending.
+    """
+    for module_name in _CONVENTION_MODULES.pop(convention, {}):
+        _PENDING_MODULES.pop(module_name, None)
+        importlib.import_module(module_name)
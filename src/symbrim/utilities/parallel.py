@@ -0,0 +1,128 @@
+"""Module containing utilities to form the equations of motion in parallel.
+
+Explanation
+-----------
+Kane's equations are linear in the contributions of the bodies to the generalized
+inertia forces and of the loads to the generalized active forces. Forming the equations
+of a large model, like a bicycle-rider model, is dominated by computing these
+contributions, which are independent of each other. The :class:`ParallelKanesMethod`
+therefore distributes the bodies and loads over a
+:class:`concurrent.futures.ProcessPoolExecutor`, where each worker forms Kane's
+equations of its share using
+:meth:`sympy.physics.mechanics.kane.KanesMethod.kanes_equations`. The results of the
+workers are summed afterward.
+
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from sympy import zeros
+from sympy.physics.mechanics import KanesMethod
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sympy import Matrix
+    from sympy.physics.mechanics import Particle, RigidBody
+
+__all__ = ["ParallelKanesMethod"]
+
+
+def _form_contribution(
+    kane: KanesMethod, bodies: Sequence[RigidBody | Particle], loads: Sequence[tuple]
+) -> tuple[Matrix, Matrix, Matrix, Matrix]:
+    """Form the contribution of bodies and loads to Kane's equations.
+
+    Returns
+    -------
+    tuple[Matrix, Matrix, Matrix, Matrix]
+        Contribution to the generalized active forces, the generalized inertia forces,
+        the mass matrix and the forcing vector. The mass matrix and forcing vector
+        exclude the rows of the velocity constraints.
+    """
+    fr, frstar = KanesMethod.kanes_equations(kane, bodies, loads)
+    n_dynamic = len(kane.u) - len(kane._udep)
+    return fr, frstar, kane.mass_matrix[:n_dynamic, :], kane.forcing[:n_dynamic, :]
+
+
+class ParallelKanesMethod(KanesMethod):
+    """Kane's method forming the equations of motion using a process pool.
+
+    Explanation
+    -----------
+    The bodies and loads are split into one share per worker process. Each worker
+    forms Kane's equations of its share using the serial implementation of SymPy, after
+    which the contributions are summed. The kinematic differential equations and the
+    constraints are only solved once upon initialization, as the instance is sent to
+    the workers. Sending the instance requires pickling the kinematic graph, so the
+    parallelization only pays off for large models on machines with multiple cores.
+
+    Parameters
+    ----------
+    *args : object
+        Arguments passed to :class:`sympy.physics.mechanics.kane.KanesMethod`.
+    processes : int, optional
+        Maximum number of worker processes. By default, the number of processors. If
+        it is one, then the equations are formed in the current process.
+    **kwargs : object
+        Keyword arguments passed to :class:`sympy.physics.mechanics.kane.KanesMethod`.
+
+    Examples
+    --------
+    The class can be selected as the method to form the equations of motion of a
+    system:
+
+    >>> from symbrim.utilities.parallel import ParallelKanesMethod
+    >>> eoms = system.form_eoms(  # doctest: +SKIP
+    ...     eom_method=ParallelKanesMethod, processes=4)
+
+    """
+
+    def __init__(self, *args: object, processes: int | None = None,
+                 **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)
+        self._processes = (os.cpu_count() or 1) if processes is None else processes
+        if self._processes < 1:
+            raise ValueError("The number of processes must be positive.")
+
+    def kanes_equations(self, bodies: Sequence[RigidBody | Particle] | None = None,
+                        loads: Sequence[tuple] | None = None) -> tuple[Matrix, Matrix]:
+        """Form Kane's equations, Fr + Fr* = 0, using a process pool.
+
+        Parameters
+        ----------
+        bodies : Sequence[RigidBody | Particle], optional
+            Bodies of the system. By default the bodies given upon initialization.
+        loads : Sequence[tuple], optional
+            Loads of the system. By default the loads given upon initialization.
+
+        Returns
+        -------
+        tuple[Matrix, Matrix]
+            Generalized active forces and generalized inertia forces.
+        """
+        bodies = list(self.bodies if bodies is None else bodies)
+        loads = list((self.forcelist or ()) if loads is None else loads)
+        n_shares = max(min(self._processes, len(bodies) + len(loads)), 1)
+        shares = [(self, bodies[i::n_shares], loads[i::n_shares])
+                  for i in range(n_shares)]
+        if n_shares == 1:
+            contributions = [_form_contribution(*share) for share in shares]
+        else:
+            with ProcessPoolExecutor(n_shares) as executor:
+                contributions = list(executor.map(_form_contribution, *zip(*shares)))
+        fr, frstar, mass_matrix, forcing = (
+            sum(matrices, zeros(*matrices[0].shape))
+            for matrices in zip(*contributions))
+        # Store the results like KanesMethod.kanes_equations, such that all other
+        # methods are inherited.
+        self._bodylist, self._forcelist = bodies, loads or None
+        self._fr, self._frstar = fr, frstar
+        self._k_d, self._f_d = mass_matrix, -forcing
+        if self._uaux:
+            n_dynamic = len(self.u) - len(self._udep)
+            self._aux_eq = fr[n_dynamic:, :] + frstar[n_dynamic:, :]
+        return self._fr, self._frstar
@@ -0,0 +1,295 @@
+"""Module containing utilities to select the partition of the coordinates and speeds.
+
+Explanation
+-----------
+The equations of motion of a constrained system require a choice of the dependent
+generalized coordinates and speeds, and of the method used to solve the velocity
+constraints for the dependent speeds. This choice does not change the dynamics, but the
+number of operations of the equations of motion can differ by orders of magnitude. In
+Kane's method the dependent speeds are eliminated using ``Ars = -B_dep^-1 B_ind``, where
+``B_dep`` and ``B_ind`` are the coefficient matrices of the velocity constraints with
+respect to the dependent and independent speeds. As the generalized forces of the
+dependent speeds are premultiplied by ``Ars.T``, the number of operations of ``Ars`` is
+a cheap estimate of the size of the equations of motion.
+
+Enumerating all valid sets of dependent speeds is infeasible for large models, like a
+bicycle-rider model, and computing ``Ars`` symbolically is expensive. Therefore,
+:func:`find_partitions` generates a few candidate sets by greedy pivoting on the
+numeric constraint Jacobian, ranks them using a structural estimate of the cost of
+solving the constraints, and only computes ``Ars`` symbolically for the best ones.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sympy import ImmutableMatrix, Matrix, linear_eq_to_matrix
+from sympy.physics.mechanics import dynamicsymbols, find_dynamicsymbols, msubs
+from sympy.physics.mechanics.functions import _parse_linear_solver
+
+from symbrim.utilities.utilities import count_operations, lambdify_random_eval
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sympy.physics.mechanics import System
+
+__all__ = ["Partition", "find_partitions", "select_partition"]
+
+
+@dataclass(frozen=True)
+class Partition:
+    """Dataclass describing a partition of the generalized coordinates and speeds.
+
+    Parameters
+    ----------
+    q_ind : ImmutableMatrix
+        Independent generalized coordinates.
+    q_dep : ImmutableMatrix
+        Dependent generalized coordinates.
+    u_ind : ImmutableMatrix
+        Independent generalized speeds.
+    u_dep : ImmutableMatrix
+        Dependent generalized speeds.
+    constraint_solver : str
+        Method used to solve the velocity constraints for the dependent speeds.
+    n_operations : int
+        Number of operations of the matrix relating the dependent speeds to the
+        independent speeds.
+    n_operations_cse : int
+        Estimated number of operations of that matrix after common subexpression
+        elimination.
+    """
+
+    q_ind: ImmutableMatrix
+    q_dep: ImmutableMatrix
+    u_ind: ImmutableMatrix
+    u_dep: ImmutableMatrix
+    constraint_solver: str
+    n_operations: int
+    n_operations_cse: int
+
+    def apply(self, system: System) -> None:
+        """Set the independent and dependent coordinates and speeds of a system.
+
+        Explanation
+        -----------
+        The constraint solver should be passed to the method forming the equations of
+        motion, e.g. ``system.form_eoms(constraint_solver="CRAMER")``.
+        """
+        # The dependent ones are cleared first, as the coordinates and speeds should be
+        # unique at all times.
+        system.q_dep, system.u_dep = [], []
+        system.q_ind = self.q_ind[:]
+        system.q_dep = self.q_dep[:]
+        system.u_ind = self.u_ind[:]
+        system.u_dep = self.u_dep[:]
+
+
+def _eval_random(matrix: Matrix) -> np.ndarray:
+    """Evaluate all entries of a matrix at the same random point."""
+    if not matrix:
+        return np.empty(matrix.shape)
+    f, n_free = lambdify_random_eval(tuple(matrix))
+    return np.array(f(*np.random.default_rng().random(n_free)),
+                    dtype=np.float64).reshape(matrix.shape)
+
+
+def _split(items: Sequence, dependent: Sequence[int]) -> tuple[ImmutableMatrix, ...]:
+    """Split items into independent and dependent items."""
+    return (ImmutableMatrix([x for i, x in enumerate(items) if i not in dependent]),
+            ImmutableMatrix([items[i] for i in dependent]))
+
+
+def _select_dependents(jacobian: np.ndarray, priorities: Sequence[float],
+                       first: int | None = None) -> tuple[int, ...] | None:
+    """Select columns of a Jacobian that can be solved for by greedy pivoting.
+
+    Explanation
+    -----------
+    The columns are selected one by one, where each time the column with the lowest
+    priority is selected among the columns that are numerically independent of the
+    already selected columns. Ties are broken by selecting the first column.
+
+    Parameters
+    ----------
+    jacobian : np.ndarray
+        Numeric Jacobian of the constraints.
+    priorities : Sequence[float]
+        Priority of each column, where lower is preferred.
+    first : int, optional
+        Column that should be selected first.
+
+    Returns
+    -------
+    tuple[int, ...] | None
+        Sorted indices of the selected columns, or None if the Jacobian does not have
+        full row rank or if the first column is zero.
+    """
+    residual = np.array(jacobian, dtype=np.float64)
+    tolerance = 1e-8 * max(np.abs(residual).max(initial=0.0), 1.0)
+    selected: list[int] = []
+    for _ in range(residual.shape[0]):
+        norms = np.linalg.norm(residual, axis=0)
+        norms[selected] = 0.0
+        valid = np.flatnonzero(norms > tolerance)
+        if first is not None and not selected:
+            valid = valid[valid == first]
+        if not valid.size:
+            return None
+        column = min(valid, key=lambda j: (priorities[j], j))
+        selected.append(column)
+        direction = residual[:, column] / norms[column]
+        residual -= np.outer(direction, direction @ residual)
+    return tuple(sorted(selected))
+
+
+def _estimate_solve_cost(costs: np.ndarray, dependent: Sequence[int]) -> float:
+    """Estimate the number of operations of solving the constraints for the speeds.
+
+    Explanation
+    -----------
+    The Gaussian elimination of ``[B_dep | B_ind]`` and the back substitution are
+    simulated on the number of operations of the entries, where zero entries are
+    skipped like in the symbolic ``LUsolve``. Each operation combines the number of
+    operations of its operands. The expressions are assumed not to simplify, which
+    overestimates the cost, but it preserves the effect of the sparsity and the size of
+    the entries on the cost of the symbolic solution.
+
+    Parameters
+    ----------
+    costs : np.ndarray
+        Number of operations plus one of each entry of the velocity constraint matrix,
+        where zero entries have a cost of zero.
+    dependent : Sequence[int]
+        Indices of the dependent speeds.
+    """
+    n_dep = len(dependent)
+    independent = [i for i in range(costs.shape[1]) if i not in dependent]
+    a = np.hstack((costs[:, dependent], costs[:, independent])).astype(np.float64)
+    for k in range(n_dep):
+        # The first row with a nonzero pivot is used, like in the symbolic solvers.
+        pivot = k + np.flatnonzero(a[k:, k])[0]
+        a[[k, pivot]] = a[[pivot, k]]
+        rows = k + 1 + np.flatnonzero(a[k + 1:, k])
+        columns = k + 1 + np.flatnonzero(a[k, k + 1:])
+        a[np.ix_(rows, columns)] += (
+            a[rows, k, np.newaxis] + a[np.newaxis, k, columns] + a[k, k] + 3)
+    x = a[:n_dep, n_dep:]
+    for i in reversed(range(n_dep)):
+        used = i + 1 + np.flatnonzero(a[i, i + 1:n_dep])
+        terms = np.where(x[used] > 0, a[i, used, np.newaxis] + x[used] + 2,
+                         0).sum(axis=0)
+        x[i] = np.where((x[i] > 0) | (terms > 0), x[i] + terms + a[i, i] + 1, 0)
+    return float(x.sum())
+
+
+def find_partitions(
+    system: System, constraint_solvers: Sequence[str] = ("LU",),
+    max_candidates: int | None = 5,
+) -> list[Partition]:
+    """Find partitions of a system sorted by their number of operations.
+
+    Explanation
+    -----------
+    Candidate sets of dependent speeds are generated by greedy pivoting on the
+    Jacobian of the velocity constraints with respect to the speeds, which is evaluated
+    at a random point. The pivoting prefers speeds of which the coefficients in the
+    velocity constraints have few operations. A candidate set is generated for each
+    speed by selecting it as first pivot, and one by selecting the first independent
+    speeds. The
+    candidates are ranked by a structural estimate of the number of operations of the
+    matrix relating the dependent speeds to the independent speeds. For the best
+    candidates this matrix is computed symbolically for each constraint solver and its
+    number of operations is counted.
+
+    The choice of the dependent coordinates does not affect the size of the equations
+    of motion formed by Kane's method. Therefore, the dependent coordinates are also
+    selected by greedy pivoting, where coordinates whose time derivatives only depend
+    on the dependent speeds are preferred.
+
+    Parameters
+    ----------
+    system : System
+        System, e.g. created using ``to_system()``, of which the coordinates, speeds,
+        kinematic differential equations and constraints have been defined.
+    constraint_solvers : Sequence[str], optional
+        Methods of ``Matrix.solve`` to consider as constraint solver. Default is
+        ("LU",). Note that "CRAMER" is only feasible for a few constraints.
+    max_candidates : int, optional
+        Maximum number of candidate sets of dependent speeds for which the matrix is
+        computed symbolically. Default is 5, None means all candidates.
+
+    Returns
+    -------
+    list[Partition]
+        Partitions sorted by their number of operations.
+
+    """
+    qdots = [qi.diff(dynamicsymbols._t) for qi in system.q]
+    kdes_matrix, kdes_rhs = linear_eq_to_matrix(system.kdes, qdots)
+    qdot_to_u = dict(zip(qdots, kdes_matrix.LUsolve(kdes_rhs)))
+    velocity_matrix = linear_eq_to_matrix(
+        msubs(system.velocity_constraints, qdot_to_u), system.u[:])[0]
+    # The Jacobian of the holonomic constraints is obtained from their time derivative,
+    # which is much faster than differentiating with respect to each coordinate.
+    holonomic_jacobian = _eval_random(linear_eq_to_matrix(
+        system.holonomic_constraints.diff(dynamicsymbols._t), qdots)[0])
+    if _select_dependents(holonomic_jacobian, [0] * len(system.q)) is None:
+        raise ValueError("The holonomic constraints cannot be solved for any set of "
+                         "coordinates.")
+    velocity_jacobian = _eval_random(velocity_matrix)
+    costs = np.array([[0 if entry == 0 else count_operations(entry)[0] + 1
+                       for entry in velocity_matrix.row(i)]
+                      for i in range(velocity_matrix.rows)],
+                     dtype=np.float64).reshape(velocity_matrix.shape)
+    column_costs = costs.sum(axis=0)
+    candidates = {
+        _select_dependents(velocity_jacobian, column_costs, first)
+        for first in range(len(system.u))}
+    candidates.add(_select_dependents(velocity_jacobian, [0] * len(system.u)))
+    candidates.discard(None)
+    if not candidates:
+        raise ValueError("The velocity constraints cannot be solved for any set of "
+                         "speeds.")
+    u_deps = sorted(candidates, key=lambda dependent: (
+        _estimate_solve_cost(costs, dependent), dependent))[:max_candidates]
+    speeds_of_qdots = [set(find_dynamicsymbols(qdot_to_u[qdot])).intersection(
+        system.u) for qdot in qdots]
+    partitions = []
+    for u_dep in u_deps:
+        u_ind, u_dep_syms = _split(system.u, u_dep)
+        q_ind, q_dep = _split(system.q, _select_dependents(holonomic_jacobian, [
+            not speeds.issubset(u_dep_syms) for speeds in speeds_of_qdots]))
+        independent = [i for i in range(len(system.u)) if i not in u_dep]
+        for solver in constraint_solvers:
+            n_operations, n_operations_cse = 0, 0
+            if u_dep:
+                ars = -_parse_linear_solver(solver)(
+                    velocity_matrix[:, u_dep], velocity_matrix[:, independent])
+                n_operations, n_operations_cse = count_operations(ars)
+            partitions.append(Partition(q_ind, q_dep, u_ind, u_dep_syms, solver,
+                                        n_operations, n_operations_cse))
+    return sorted(partitions, key=lambda p: (p.n_operations, p.n_operations_cse))
+
+
+def select_partition(system: System, **kwargs: object) -> Partition:
+    """Apply the partition with the smallest estimated cost to a system.
+
+    Explanation
+    -----------
+    See :func:`find_partitions` for the description of the estimate and the keyword
+    arguments. The constraint solver of the returned partition should be passed to
+    the method forming the equations of motion.
+
+    Examples
+    --------
+    >>> partition = select_partition(system)  # doctest: +SKIP
+    >>> system.form_eoms(  # doctest: +SKIP
+    ...     constraint_solver=partition.constraint_solver)
+
+    """
+    partition = find_partitions(system, **kwargs)[0]
+    partition.apply(system)
+    return partition
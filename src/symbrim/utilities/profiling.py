@@ -0,0 +1,603 @@
+"""Module containing utilities to profile the definition of models.
+
+Explanation
+-----------
+Defining a large model, like a bicycle-rider model, can take a significant amount of
+time. To find out which model, connection or load group is the bottleneck, the
+:class:`DefinitionProfiler` instruments the definition stages of all objects. For each
+object and stage it records the wall time, the peak memory usage and the number of
+operations of the expressions added to the kinematic graph and the system. The result
+is a :class:`ProfileNode` tree, which mirrors the submodels, connections and load
+groups of the model.
+
+The instrumentation is opt-in, only while the profiler is active the methods of the
+base classes are wrapped. Therefore, there is no overhead when not profiling.
+
+Besides the definition, the size of the equations of motion can be analyzed with
+:func:`attribute_operations`. It attributes the operations of the mass matrix and
+forcing vector to the objects declaring the symbols they depend on, such that it can be
+determined which component causes the equations of motion to explode in size.
+"""
+from __future__ import annotations
+
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from sympy import Basic, Derivative
+from sympy.core.function import AppliedUndef
+from sympy.physics.mechanics import System, Vector, dynamicsymbols, find_dynamicsymbols
+
+from symbrim.core import ConnectionBase, LoadGroupBase, ModelBase
+from symbrim.core.base_classes import BrimBase
+from symbrim.core.journal import GraphJournal
+from symbrim.utilities.utilities import (
+    count_node_operations,
+    count_operations,
+    iter_expressions,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from typing_extensions import Self
+
+__all__ = [
+    "DefinitionProfiler", "OperationsNode", "ProfileNode", "StageProfile",
+    "attribute_operations", "profile_definition",
+]
+
+STAGES = ("objects", "kinematics", "loads", "constraints", "to_system")
+_INSTRUMENTED_METHODS = {
+    "define_objects": "objects",
+    "define_kinematics": "kinematics",
+    "define_loads": "loads",
+    "define_constraints": "constraints",
+    "to_system": "to_system",
+}
+
+
+def _count_operations(values: Iterable[object]) -> int:
+    """Count the number of operations in expressions, matrices and vectors.
+
+    Explanation
+    -----------
+    The operations are counted on the expression graph using
+    :func:`symbrim.utilities.utilities.count_operations`, which is consistent with the
+    other operation counts of this module.
+    """
+    exprs = []
+    for value in values:
+        if isinstance(value, Vector):
+            exprs.extend(matrix for matrix, _ in value.args)
+        else:
+            exprs.append(value)
+    return count_operations(exprs)[0]
+
+
+def _count_system_operations(systems: Iterable[System | None]) -> int:
+    """Count the number of operations in the expressions stored in the systems."""
+    return sum(_count_operations((
+        system.kdes, system.holonomic_constraints, system.nonholonomic_constraints,
+        *(load.vector for load in system.loads)))
+        for system in {id(sys): sys for sys in systems if sys is not None}.values())
+
+
+def _get_graph_objects(obj: BrimBase) -> tuple[BrimBase, ...]:
+    """Get the objects whose points and frames can be changed by an object."""
+    if isinstance(obj, ModelBase):
+        return tuple(obj._iter_tree())
+    if isinstance(obj, ConnectionBase):
+        return (obj, *obj.submodels, *obj.load_groups)
+    return (obj,) if obj.parent is None else (obj, obj.parent)
+
+
+def _get_children(obj: BrimBase) -> list[BrimBase]:
+    """Get the submodels, connections and load groups shown as children in a tree."""
+    if isinstance(obj, ConnectionBase):
+        return list(obj.load_groups)
+    return [*getattr(obj, "submodels", ()), *getattr(obj, "connections", ()),
+            *getattr(obj, "load_groups", ())]
+
+
+@dataclass
+class StageProfile:
+    """Dataclass storing the profiling results of an object in a single stage.
+
+    Parameters
+    ----------
+    wall_time : float
+        Wall time in seconds spent by the object itself, so excluding the time spent
+        by the stages of its submodels, connections and load groups.
+    peak_memory : int
+        Peak increase in traced memory in bytes during the stage including the
+        children, as peak memory usage is not additive.
+    n_operations : int
+        Number of operations of the expressions added by the object itself. This
+        includes the relations in the kinematic graph and the expressions stored in
+        the system. For ``to_system`` it is the number of operations of the exported
+        system.
+    n_calls : int
+        Number of times the stage has been executed.
+    """
+
+    wall_time: float = 0.0
+    peak_memory: int = 0
+    n_operations: int = 0
+    n_calls: int = 0
+
+    def __add__(self, other: StageProfile) -> StageProfile:
+        return StageProfile(
+            self.wall_time + other.wall_time,
+            max(self.peak_memory, other.peak_memory),
+            self.n_operations + other.n_operations,
+            self.n_calls + other.n_calls,
+        )
+
+
+@dataclass
+class ProfileNode:
+    """Node in the profiling report tree.
+
+    Parameters
+    ----------
+    name : str
+        Name of the object.
+    type_name : str
+        Name of the class of the object.
+    stages : dict[str, StageProfile]
+        Profiling results of the object itself per stage.
+    children : list[ProfileNode]
+        Nodes of the submodels, connections and load groups of the object.
+    """
+
+    name: str
+    type_name: str
+    stages: dict[str, StageProfile] = field(default_factory=dict)
+    children: list[ProfileNode] = field(default_factory=list)
+
+    @property
+    def own_total(self) -> StageProfile:
+        """Profiling results of the object itself summed over all stages."""
+        return sum(self.stages.values(), StageProfile())
+
+    def get_stage_total(self, stage: str) -> StageProfile:
+        """Get the results of a stage summed over the object and its children."""
+        return sum((child.get_stage_total(stage) for child in self.children),
+                   self.stages.get(stage, StageProfile()))
+
+    @property
+    def total(self) -> StageProfile:
+        """Profiling results of the object and its children summed over all stages."""
+        return sum((child.total for child in self.children), self.own_total)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, ProfileNode]]:
+        """Iterate over the tree in depth-first order, yielding the depth and node."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def to_string(self, metric: str = "wall_time") -> str:
+        """Create a table of the tree with a column for each stage.
+
+        Parameters
+        ----------
+        metric : str, optional
+            Attribute of :class:`StageProfile` to show, by default "wall_time".
+
+        Returns
+        -------
+        str
+            Table with a row per object, where the values of the object itself are
+            shown per stage and the last column shows the total of its subtree.
+        """
+        if metric not in StageProfile.__dataclass_fields__:
+            raise ValueError(f"Metric {metric!r} is not a field of {StageProfile}.")
+        fmt = "{:.4f}" if metric == "wall_time" else "{:d}"
+        rows = [(f"{'  ' * depth}{node.name} ({node.type_name})",
+                 *(fmt.format(getattr(node.stages[stage], metric))
+                   if stage in node.stages else "" for stage in STAGES),
+                 fmt.format(getattr(node.total, metric)))
+                for depth, node in self.walk()]
+        header = ("object", *STAGES, "total")
+        widths = [max(len(row[i]) for row in (header, *rows))
+                  for i in range(len(header))]
+        return "\n".join(
+            "  ".join([row[0].ljust(widths[0]), *(
+                value.rjust(width) for value, width in zip(row[1:], widths[1:]))
+            ]).rstrip() for row in (header, *rows))
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+
+@dataclass
+class _CallFrame:
+    """Data of an instrumented call, which is still being executed."""
+
+    start_memory: int = 0
+    peak_memory: int = 0
+    children_time: float = 0.0
+    children_operations: int = 0
+
+
+class DefinitionProfiler:
+    """Context manager to profile the definition stages of models.
+
+    Explanation
+    -----------
+    While the profiler is active, the ``define_objects``, ``define_kinematics``,
+    ``define_loads`` and ``define_constraints`` methods of all models, connections
+    and load groups and the ``to_system`` method of the models are instrumented. The
+    results can be obtained as a tree using :meth:`get_report`.
+
+    Parameters
+    ----------
+    count_operations : bool, optional
+        Whether to count the operations of the added expressions, by default True.
+        Counting the operations can take a significant amount of time for large
+        models, which is not included in the measured wall time.
+    trace_memory : bool, optional
+        Whether to trace the peak memory usage using :mod:`tracemalloc`, by default
+        True. Tracing memory slows down the execution.
+
+    Examples
+    --------
+    >>> from symbrim import FlatGround, KnifeEdgeWheel, NonHolonomicTire
+    >>> from symbrim.other import RollingDisc
+    >>> from symbrim.utilities.profiling import DefinitionProfiler
+    >>> disc = RollingDisc("disc")
+    >>> disc.wheel = KnifeEdgeWheel("wheel")
+    >>> disc.ground = FlatGround("ground")
+    >>> disc.tire = NonHolonomicTire("tire")
+    >>> with DefinitionProfiler() as profiler:
+    ...     disc.define_all()
+    >>> report = profiler.get_report(disc)
+    >>> print(report.to_string("n_operations"))  # doctest: +SKIP
+    """
+
+    def __init__(self, count_operations: bool = True, trace_memory: bool = True
+                 ) -> None:
+        self.count_operations = count_operations
+        self.trace_memory = trace_memory
+        self._profiles: dict[BrimBase, dict[str, StageProfile]] = {}
+        self._stack: list[_CallFrame] = []
+        self._originals: list[tuple[type, str, Callable]] = []
+        self._started_tracing = False
+
+    def __enter__(self) -> Self:
+        if self._originals:
+            raise RuntimeError("The profiler is already active.")
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        for cls in (BrimBase, ModelBase, ConnectionBase, LoadGroupBase):
+            for method_name, stage in _INSTRUMENTED_METHODS.items():
+                if method_name in vars(cls):
+                    method = vars(cls)[method_name]
+                    self._originals.append((cls, method_name, method))
+                    setattr(cls, method_name, self._instrument(method, stage))
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        for cls, method_name, method in self._originals:
+            setattr(cls, method_name, method)
+        self._originals = []
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def _instrument(self, method: Callable, stage: str) -> Callable:
+        """Wrap a method to profile its execution."""
+        @wraps(method)
+        def wrapper(obj: BrimBase, *args: object, **kwargs: object) -> object:
+            return self._profile_call(obj, stage, method, args, kwargs)
+
+        return wrapper
+
+    def _profile_call(self, obj: BrimBase, stage: str, method: Callable,
+                      args: tuple, kwargs: dict) -> object:
+        """Execute a method and record the profiling results."""
+        call_start = perf_counter()
+        if self.trace_memory and self._stack:
+            self._stack[-1].peak_memory = max(self._stack[-1].peak_memory,
+                                              tracemalloc.get_traced_memory()[1])
+        journal, n_system_ops = None, 0
+        if self.count_operations and stage != "to_system":
+            objects = _get_graph_objects(obj)
+            journal = GraphJournal(objects)
+            n_system_ops = _count_system_operations(o.system for o in objects)
+        frame = _CallFrame()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            frame.start_memory = frame.peak_memory = tracemalloc.get_traced_memory()[0]
+        self._stack.append(frame)
+        start = perf_counter()
+        try:
+            result = method(obj, *args, **kwargs)
+        finally:
+            wall_time = perf_counter() - start
+            self._stack.pop()
+            if self.trace_memory:
+                frame.peak_memory = max(frame.peak_memory,
+                                        tracemalloc.get_traced_memory()[1])
+            n_ops = 0
+            if journal is not None:
+                objects = _get_graph_objects(obj)
+                journal.finish(objects)
+                n_ops = (_count_operations(journal.get_changed_values()) +
+                         _count_system_operations(o.system for o in objects) -
+                         n_system_ops)
+            elif self.count_operations:
+                n_ops = _count_system_operations([result])
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+            profile = self._profiles.setdefault(obj, {}).setdefault(
+                stage, StageProfile())
+            profile.wall_time += wall_time - frame.children_time
+            profile.peak_memory = max(profile.peak_memory,
+                                      frame.peak_memory - frame.start_memory)
+            profile.n_operations += n_ops - frame.children_operations
+            profile.n_calls += 1
+            if self._stack:
+                parent = self._stack[-1]
+                parent.children_time += perf_counter() - call_start
+                parent.children_operations += n_ops
+                parent.peak_memory = max(parent.peak_memory, frame.peak_memory)
+        return result
+
+    def get_report(self, obj: BrimBase) -> ProfileNode:
+        """Get the profiling results of an object and its children as a tree."""
+        return ProfileNode(
+            obj.name, type(obj).__name__,
+            dict(self._profiles.get(obj, {})),
+            [self.get_report(child) for child in _get_children(obj)],
+        )
+
+
+def profile_definition(model: ModelBase, to_system: bool = True,
+                       **kwargs: bool) -> ProfileNode:
+    """Profile the definition of a model.
+
+    Parameters
+    ----------
+    model : ModelBase
+        Model to define and profile.
+    to_system : bool, optional
+        Whether to also profile the export to a single system, by default True.
+    **kwargs : bool
+        Keyword arguments passed to :class:`DefinitionProfiler`.
+
+    Returns
+    -------
+    ProfileNode
+        Profiling results of the model as a tree.
+    """
+    with DefinitionProfiler(**kwargs) as profiler:
+        model.define_all()
+        if to_system:
+            model.to_system()
+    return profiler.get_report(model)
+
+
+@dataclass
+class OperationsNode:
+    """Node in the tree attributing the operations of expressions to objects.
+
+    Parameters
+    ----------
+    name : str
+        Name of the object.
+    type_name : str
+        Name of the class of the object.
+    n_operations : dict[str, float]
+        Number of operations of the expression trees attributed to the object itself
+        per analyzed expression.
+    n_operations_cse : dict[str, float]
+        Estimated number of operations after common subexpression elimination
+        attributed to the object itself per analyzed expression.
+    children : list[OperationsNode]
+        Nodes of the submodels, connections and load groups of the object.
+    """
+
+    name: str
+    type_name: str
+    n_operations: dict[str, float] = field(default_factory=dict)
+    n_operations_cse: dict[str, float] = field(default_factory=dict)
+    children: list[OperationsNode] = field(default_factory=list)
+
+    def get_total(self, cse: bool = False) -> float:
+        """Get the number of operations of the object and its children."""
+        own = self.n_operations_cse if cse else self.n_operations
+        return sum(own.values()) + sum(child.get_total(cse) for child in self.children)
+
+    def walk(self, depth: int = 0) -> Iterator[tuple[int, OperationsNode]]:
+        """Iterate over the tree in depth-first order, yielding the depth and node."""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def to_string(self, cse: bool = False) -> str:
+        """Create a table of the tree with a column for each expression.
+
+        Parameters
+        ----------
+        cse : bool, optional
+            Whether to show the estimated number of operations after common
+            subexpression elimination, by default False.
+
+        Returns
+        -------
+        str
+            Table with a row per object, where the operations attributed to the object
+            itself are shown per expression and the last column shows the total of its
+            subtree.
+        """
+        names = list(self.n_operations)
+        rows = [(f"{'  ' * depth}{node.name} ({node.type_name})",
+                 *(f"{(node.n_operations_cse if cse else node.n_operations)[name]:.1f}"
+                   for name in names),
+                 f"{node.get_total(cse):.1f}")
+                for depth, node in self.walk()]
+        header = ("object", *names, "total")
+        widths = [max(len(row[i]) for row in (header, *rows))
+                  for i in range(len(header))]
+        return "\n".join(
+            "  ".join([row[0].ljust(widths[0]), *(
+                value.rjust(width) for value, width in zip(row[1:], widths[1:]))
+            ]).rstrip() for row in (header, *rows))
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+
+def _get_symbol_owners(model: ModelBase) -> dict[Basic, BrimBase]:
+    """Get the object declaring each symbol in the tree of a model.
+
+    Explanation
+    -----------
+    The symbols are obtained from the ``symbols``, ``descriptions``, ``q``, ``u`` and
+    ``u_aux`` of each object. If a symbol is declared by multiple objects, then the
+    object, which is visited last in the tree, i.e. typically the child, is used.
+    """
+    owners = {}
+    for obj in model._iter_tree():
+        for value in (*obj.symbols.values(), *obj.descriptions, *obj.q, *obj.u,
+                      *obj.u_aux):
+            if isinstance(value, Basic):
+                owners.update(dict.fromkeys(
+                    (*value.free_symbols, *find_dynamicsymbols(value)), obj))
+    owners.pop(dynamicsymbols._t, None)
+    return owners
+
+
+def _sort_graph(roots: list[Basic], owners: dict[Basic, BrimBase]
+                ) -> tuple[list[Basic], dict[int, frozenset[BrimBase]]]:
+    """Sort the nodes of expressions topologically and get the owners of each node.
+
+    Returns
+    -------
+    tuple[list[Basic], dict[int, frozenset[BrimBase]]]
+        Unique nodes, where each node succeeds its arguments, and the owners of the
+        symbols each node depends on by the identity of the node.
+    """
+    order: list[Basic] = []
+    node_owners: dict[int, frozenset[BrimBase]] = {}
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node, args_visited = stack.pop()
+            if id(node) in node_owners:
+                continue
+            is_leaf = isinstance(node, (AppliedUndef, Derivative)) or not node.args
+            if not args_visited and not is_leaf:
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in node.args
+                             if id(arg) not in node_owners)
+                continue
+            if is_leaf:
+                owner = owners.get(node, owners.get(getattr(node, "expr", None)))
+                node_owners[id(node)] = frozenset(() if owner is None else (owner,))
+            else:
+                node_owners[id(node)] = frozenset().union(
+                    *(node_owners[id(arg)] for arg in node.args))
+            order.append(node)
+    return order, node_owners
+
+
+def _attribute_expression(
+    expr: Basic | Iterable, owners: dict[Basic, BrimBase], default: BrimBase
+) -> tuple[dict[BrimBase, float], dict[BrimBase, float]]:
+    """Attribute the operations of an expression to the owners of its symbols.
+
+    Explanation
+    -----------
+    The operations of each node in the directed acyclic graph of the expression are
+    divided equally among the owners of the symbols the node depends on. Nodes that do
+    not depend on any declared symbol are attributed to ``default``. The number of
+    operations of the expression tree is attributed by weighting each node with the
+    number of times it occurs in the tree, which is propagated from the roots to the
+    leaves in topological order.
+    """
+    # The roots are stored to guarantee that their identities remain unique.
+    roots = list(iter_expressions(expr))
+    order, node_owners = _sort_graph(roots, owners)
+    multiplicities = dict.fromkeys(node_owners, 0)
+    for root in roots:
+        multiplicities[id(root)] += 1
+    for node in reversed(order):
+        if not isinstance(node, (AppliedUndef, Derivative)):
+            for arg in node.args:
+                multiplicities[id(arg)] += multiplicities[id(node)]
+    n_ops_tree: dict[BrimBase, float] = {}
+    n_ops_csed: dict[BrimBase, float] = {}
+    unique_nodes: set[Basic] = set()
+    for node in order:
+        n_ops = count_node_operations(node)
+        if not n_ops:
+            continue
+        objs = node_owners[id(node)] or (default,)
+        for obj in objs:
+            n_ops_tree[obj] = (n_ops_tree.get(obj, 0.0) +
+                               n_ops * multiplicities[id(node)] / len(objs))
+        if node not in unique_nodes:
+            unique_nodes.add(node)
+            for obj in objs:
+                n_ops_csed[obj] = n_ops_csed.get(obj, 0.0) + n_ops / len(objs)
+    return n_ops_tree, n_ops_csed
+
+
+def attribute_operations(
+    model: ModelBase, expressions: System | dict[str, Basic | Iterable]
+) -> OperationsNode:
+    """Attribute the operations of expressions to the objects of a model.
+
+    Explanation
+    -----------
+    Each symbol is owned by the model, connection or load group declaring it, i.e. the
+    symbols used by :meth:`get_all_symbols` and the keys of the ``descriptions``,
+    together with the generalized coordinates and speeds of the object. The
+    expressions are traversed as a directed acyclic graph, where the operations of
+    each node are divided equally among the owners of the symbols the node depends on.
+    Operations only depending on undeclared symbols, like the gravitational constant,
+    are attributed to the model itself. The attributed operations therefore sum up to
+    the result of :func:`symbrim.utilities.utilities.count_operations`.
+
+    Parameters
+    ----------
+    model : ModelBase
+        Model of which the objects own the symbols.
+    expressions : System | dict[str, Basic | Iterable]
+        System of which the equations of motion have been formed, in which case the
+        mass matrix and forcing vector are analyzed, or a dictionary mapping names to
+        the expressions to analyze.
+
+    Returns
+    -------
+    OperationsNode
+        Attributed operations as a tree mirroring the model.
+
+    Examples
+    --------
+    >>> system = bicycle_rider.to_system()  # doctest: +SKIP
+    >>> system.form_eoms()  # doctest: +SKIP
+    >>> print(attribute_operations(bicycle_rider, system))  # doctest: +SKIP
+    """
+    if isinstance(expressions, System):
+        expressions = {"mass_matrix": expressions.mass_matrix,
+                       "forcing": expressions.forcing}
+    owners = _get_symbol_owners(model)
+    results = {name: _attribute_expression(expr, owners, model)
+               for name, expr in expressions.items()}
+
+    def create_node(obj: BrimBase) -> OperationsNode:
+        return OperationsNode(
+            obj.name, type(obj).__name__,
+            {name: tree.get(obj, 0.0) for name, (tree, _) in results.items()},
+            {name: csed.get(obj, 0.0) for name, (_, csed) in results.items()},
+            [create_node(child) for child in _get_children(obj)],
+        )
+
+    return create_node(model)
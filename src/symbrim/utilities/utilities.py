@@ -1,12 +1,23 @@
 """Utilities for SymBRiM."""
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import numpy as np
-from sympy import Basic, Derivative, Dummy, Expr, lambdify
+from sympy import Basic, Derivative, Dummy, Expr, Rational, lambdify
+from sympy.core.function import AppliedUndef
 from sympy.core.random import random
 from sympy.physics.mechanics import find_dynamicsymbols, msubs
+from sympy.utilities.iterables import iterable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
 
-__all__ = ["random_eval", "check_zero"]
+__all__ = [
+    "random_eval", "check_zero", "count_operations", "count_node_operations",
+    "iter_expressions", "lambdify_random_eval",
+]
 
 
 def random_eval(expr: Expr, prec: int = 7, method: str = "lambdify") -> float:
@@ -25,7 +36,32 @@ def random_eval(expr: Expr, prec: int = 7, method: str = "lambdify") -> float:
     raise NotImplementedError(f"Method {method} not implemented.")
 
 
-def check_zero(expr: Expr, n_evaluations: int = 10, atol: float = 1e-8) -> bool:
+@lru_cache(maxsize=1024)
+def lambdify_random_eval(exprs: tuple[Basic, ...]) -> tuple[Callable, int]:
+    """Lambdify expressions as a function of all their free symbols.
+
+    Explanation
+    -----------
+    The compiled function is cached based on the hash of the expressions, such that
+    repeated checks of the same expressions do not have to be lambdified again.
+
+    Returns
+    -------
+    tuple[Callable, int]
+        Function returning a list with the value of each expression and the number of
+        arguments of the function.
+    """
+    free = tuple(set().union(*(expr.free_symbols.union(find_dynamicsymbols(expr))
+                               for expr in exprs)))
+    if any(isinstance(f, Derivative) for f in free):
+        dummy_map = {f: Dummy() for f in free if isinstance(f, Derivative)}
+        free = tuple(dummy_map.get(f, f) for f in free)
+        exprs = tuple(msubs(expr, dummy_map) for expr in exprs)
+    return lambdify(free, list(exprs), cse=True), len(free)
+
+
+def check_zero(expr: Expr | Iterable[Expr], n_evaluations: int = 10,
+               atol: float = 1e-8) -> bool | list[bool]:
     """Check if an expression is zero based on random evaluations.
 
     Explanation
@@ -36,10 +72,14 @@ def check_zero(expr: Expr, n_evaluations: int = 10, atol: float = 1e-8) -> bool:
     that false negatives can still occur. Examples are when values are close to zero
     or functions like the Dirac function are used, which is likely to evaluate to zero.
 
+    The expressions are lambdified only once for all evaluations, which are performed
+    in a single vectorized call. Checking multiple expressions at once is therefore
+    faster than checking them one by one.
+
     Parameters
     ----------
-    expr : Expr
-        The expression to be checked.
+    expr : Expr | Iterable[Expr]
+        The expression to be checked or an iterable of expressions, like a matrix.
     n_evaluations : int, optional
         The number of evaluations to be performed. Default is 10.
     atol : float, optional
@@ -47,20 +87,96 @@ def check_zero(expr: Expr, n_evaluations: int = 10, atol: float = 1e-8) -> bool:
 
     Returns
     -------
-    bool
-        Returns True if the expression evaluates to zero, and False otherwise.
+    bool | list[bool]
+        Returns True if the expression evaluates to zero, and False otherwise. In case
+        of an iterable of expressions a list with the result of each expression is
+        returned.
 
     """
-    if not isinstance(expr, Basic):
-        return expr == 0
-    free = tuple(expr.free_symbols.union(find_dynamicsymbols(expr)))
-    if any(isinstance(f, Derivative) for f in free):
-        dummy_map = {f: Dummy() for f in free if isinstance(f, Derivative)}
-        free = tuple(dummy_map.get(f, f) for f in free)
-        expr = msubs(expr, dummy_map)
-    f = lambdify(free, expr, cse=True)
-    # The comparison is to zero, so the relative tolerance is not used.
-    rng = np.random.default_rng()
-    return np.allclose(
-        np.fromfunction(lambda _: f(*rng.random(len(free))), (n_evaluations,)),
-        np.zeros(n_evaluations), 0, atol)
+    exprs = list(expr) if iterable(expr) else [expr]
+    results = [e == 0 for e in exprs]
+    symbolic = [i for i, e in enumerate(exprs) if isinstance(e, Basic)]
+    if symbolic:
+        f, n_free = lambdify_random_eval(tuple(exprs[i] for i in symbolic))
+        values = f(*np.random.default_rng().random((n_free, n_evaluations)))
+        for i, value in zip(symbolic, values):
+            # The comparison is to zero, so the relative tolerance is not used.
+            results[i] = bool(np.all(np.abs(value) <= atol))
+    return results if iterable(expr) else results[0]
+
+
+def iter_expressions(expr: Basic | Iterable) -> Iterator[Basic]:
+    """Iterate over the expressions in a possibly nested iterable or matrix."""
+    if iterable(expr):
+        for arg in expr:
+            yield from iter_expressions(arg)
+    elif isinstance(expr, Basic):
+        yield expr
+
+
+def count_node_operations(node: Basic) -> int:
+    """Count the number of operations of a single node, excluding its arguments."""
+    if isinstance(node, (AppliedUndef, Derivative)):
+        return 0
+    if not node.args:
+        return int(isinstance(node, Rational) and not node.is_Integer)
+    if node.is_Add or node.is_Mul:
+        return len(node.args) - 1
+    return 1
+
+
+def count_operations(expr: Basic | Iterable) -> tuple[int, int]:
+    """Count the number of operations in an expression with and without CSE.
+
+    Explanation
+    -----------
+    The expression is treated as a directed acyclic graph, where each node is only
+    visited once. The number of operations of the expression tree is computed by
+    memoizing the count of each node by its identity. The number of operations after
+    common subexpression elimination is estimated as the sum of the operations of all
+    unique nodes, as each repeated subexpression only has to be computed once. This is
+    much faster than counting the operations of the output of :func:`sympy.cse`, but it
+    does not account for the additional optimizations performed by it.
+
+    An addition or multiplication of n arguments counts as n - 1 operations. All
+    other functions, including powers, count as a single operation. Symbols, numbers
+    and dynamic symbols, including their derivatives, do not count as operations,
+    except for non-integer rationals, which count as a division.
+
+    Parameters
+    ----------
+    expr : Basic | Iterable
+        Expression, matrix or (nested) iterable of expressions.
+
+    Returns
+    -------
+    tuple[int, int]
+        Number of operations of the expression tree and the estimated number of
+        operations after common subexpression elimination.
+
+    """
+    tree_counts: dict[int, int] = {}
+    unique_nodes: set[Basic] = set()
+    # The roots are stored to guarantee that their identities remain unique.
+    roots = list(iter_expressions(expr))
+    n_ops_tree, n_ops_csed = 0, 0
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node, args_counted = stack.pop()
+            if id(node) in tree_counts:
+                continue
+            is_leaf = isinstance(node, (AppliedUndef, Derivative)) or not node.args
+            if not args_counted and not is_leaf:
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in node.args
+                             if id(arg) not in tree_counts)
+                continue
+            n_ops = count_node_operations(node)
+            tree_counts[id(node)] = n_ops if is_leaf else n_ops + sum(
+                tree_counts[id(arg)] for arg in node.args)
+            if n_ops and node not in unique_nodes:
+                unique_nodes.add(node)
+                n_ops_csed += n_ops
+        n_ops_tree += tree_counts[id(root)]
+    return n_ops_tree, n_ops_csed
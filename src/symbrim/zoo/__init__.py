@@ -0,0 +1,24 @@
+"""Module containing the model zoo of pre-generated numeric models.
+
+Explanation
+-----------
+The zoo contains the standard configurations listed in :data:`CONFIGURATIONS`. Each
+configuration is derived once and stored as a standalone NumPy module, which can be
+loaded using :func:`load` without paying the symbolic derivation time. The modules
+are (re)generated using :func:`generate` or from the command line using
+``python -m symbrim.zoo [names ...]``.
+"""
+from typing import TYPE_CHECKING
+
+from symbrim.utilities.lazy_loading import attach_lazy_attributes
+
+__all__ = ["CONFIGURATIONS", "ZooConfiguration", "generate", "get_directory", "load"]
+
+if TYPE_CHECKING:
+    from symbrim.zoo.configurations import CONFIGURATIONS, ZooConfiguration
+    from symbrim.zoo.loading import generate, get_directory, load
+
+__getattr__, __dir__ = attach_lazy_attributes(__name__, {
+    "configurations": ("CONFIGURATIONS", "ZooConfiguration"),
+    "loading": ("generate", "get_directory", "load"),
+})
@@ -0,0 +1,34 @@
+"""Command line interface to generate the models of the zoo."""
+from __future__ import annotations
+
+import argparse
+from typing import TYPE_CHECKING
+
+from symbrim.zoo.configurations import CONFIGURATIONS
+from symbrim.zoo.loading import generate
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = ["main"]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Generate the models of the zoo."""
+    parser = argparse.ArgumentParser(
+        prog="python -m symbrim.zoo",
+        description="Generate the NumPy modules of the model zoo.")
+    parser.add_argument("names", nargs="*", help=(
+        f"Configurations to generate, by default all. Options: {list(CONFIGURATIONS)}"))
+    parser.add_argument("--directory", default=None,
+                        help="Directory in which the modules are stored.")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in CONFIGURATIONS]
+    if unknown:
+        parser.error(f"unknown configurations {unknown}")
+    for name in args.names or CONFIGURATIONS:
+        print(f"Generated {generate(name, args.directory)}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
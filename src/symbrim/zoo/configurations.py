@@ -0,0 +1,215 @@
+"""Module containing the standard configurations of the model zoo."""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from importlib import metadata
+from typing import TYPE_CHECKING
+
+import symbrim
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sympy.physics.mechanics import System
+
+    from symbrim.bicycle import FlatGround, WhippleBicycleMoore
+    from symbrim.brim import BicycleRider
+    from symbrim.core import ModelBase
+    from symbrim.other import RollingDisc
+
+__all__ = ["CONFIGURATIONS", "ZooConfiguration"]
+
+
+@dataclass(frozen=True)
+class ZooConfiguration:
+    """Dataclass describing a standard configuration of the model zoo.
+
+    Explanation
+    -----------
+    The partition of the coordinates and speeds is stored by the names of the
+    dependent ones, such that the key of the configuration can be computed without
+    creating the model. The independent ones are ordered like the coordinates and
+    speeds of the system.
+
+    Parameters
+    ----------
+    name : str
+        Name of the configuration, which is also used as the name of the generated
+        module.
+    description : str
+        Short description of the configuration.
+    create_model : Callable[[], ModelBase]
+        Function creating the model without defining it.
+    configure_system : Callable[[ModelBase, System], None]
+        Function applying the gravity to the system of the defined model.
+    q_dep : tuple[str, ...]
+        Names of the dependent generalized coordinates.
+    u_dep : tuple[str, ...]
+        Names of the dependent generalized speeds.
+    constraint_solver : str, optional
+        Method used to solve the velocity constraints, by default "LU".
+    """
+
+    name: str
+    description: str
+    create_model: Callable[[], ModelBase]
+    configure_system: Callable[[ModelBase, System], None]
+    q_dep: tuple[str, ...]
+    u_dep: tuple[str, ...]
+    constraint_solver: str = "LU"
+
+    def get_key(self) -> str:
+        """Get the key describing the configuration.
+
+        Explanation
+        -----------
+        The key is a hash of the name, the partition, the constraint solver and the
+        versions of SymBRiM and SymPy. It is computed without importing SymPy or
+        creating the model, such that a generated module can cheaply be checked.
+        """
+        description = (self.name, self.q_dep, self.u_dep, self.constraint_solver,
+                       symbrim.__version__, metadata.version("sympy"))
+        return hashlib.sha256(repr(description).encode()).hexdigest()
+
+    def create_system(self) -> System:
+        """Create the system of the configuration without forming the equations."""
+        model = self.create_model()
+        model.define_all()
+        system = model.to_system()
+        self.configure_system(model, system)
+        q_dep = [qi for name in self.q_dep for qi in system.q if qi.name == name]
+        u_dep = [ui for name in self.u_dep for ui in system.u if ui.name == name]
+        # The dependent ones are cleared first, as the coordinates and speeds should be
+        # unique at all times.
+        system.q_dep, system.u_dep = [], []
+        system.q_ind = [qi for qi in system.q if qi not in q_dep]
+        system.q_dep = q_dep
+        system.u_ind = [ui for ui in system.u if ui not in u_dep]
+        system.u_dep = u_dep
+        return system
+
+
+def _apply_gravity(ground: FlatGround, system: System) -> None:
+    from sympy import Symbol
+    system.apply_uniform_gravity(-Symbol("g") * ground.get_normal(ground.origin))
+
+
+def _create_rolling_disc() -> RollingDisc:
+    from symbrim.bicycle import FlatGround, KnifeEdgeWheel, NonHolonomicTire
+    from symbrim.other import RollingDisc
+    disc = RollingDisc("disc")
+    disc.wheel = KnifeEdgeWheel("wheel")
+    disc.ground = FlatGround("ground")
+    disc.tire = NonHolonomicTire("tire")
+    return disc
+
+
+def _create_whipple_bicycle_moore(cranks: bool = False) -> WhippleBicycleMoore:
+    from symbrim.bicycle import (
+        FlatGround,
+        KnifeEdgeWheel,
+        MasslessCranks,
+        NonHolonomicTire,
+        RigidFrontFrameMoore,
+        RigidRearFrameMoore,
+        WhippleBicycleMoore,
+    )
+    bike = WhippleBicycleMoore("bicycle")
+    bike.ground = FlatGround("ground")
+    bike.rear_frame = RigidRearFrameMoore("rear_frame")
+    bike.front_frame = RigidFrontFrameMoore("front_frame")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.rear_tire = NonHolonomicTire("rear_tire")
+    bike.front_tire = NonHolonomicTire("front_tire")
+    if cranks:
+        bike.cranks = MasslessCranks("cranks")
+    return bike
+
+
+def _create_bicycle_rider() -> BicycleRider:
+    from symbrim.brim import (
+        BicycleRider,
+        FixedSeat,
+        HolonomicHandGrips,
+        HolonomicPedals,
+    )
+    from symbrim.rider import (
+        FixedSacrum,
+        FlexRotLeftShoulder,
+        FlexRotRightShoulder,
+        PinElbowStickLeftArm,
+        PinElbowStickRightArm,
+        PlanarPelvis,
+        PlanarTorso,
+        Rider,
+        SphericalLeftHip,
+        SphericalRightHip,
+        TwoPinStickLeftLeg,
+        TwoPinStickRightLeg,
+    )
+    rider = Rider("rider")
+    rider.pelvis = PlanarPelvis("pelvis")
+    rider.torso = PlanarTorso("torso")
+    rider.sacrum = FixedSacrum("sacrum")
+    rider.left_arm = PinElbowStickLeftArm("left_arm")
+    rider.right_arm = PinElbowStickRightArm("right_arm")
+    rider.left_shoulder = FlexRotLeftShoulder("left_shoulder")
+    rider.right_shoulder = FlexRotRightShoulder("right_shoulder")
+    rider.left_leg = TwoPinStickLeftLeg("left_leg")
+    rider.right_leg = TwoPinStickRightLeg("right_leg")
+    rider.left_hip = SphericalLeftHip("left_hip")
+    rider.right_hip = SphericalRightHip("right_hip")
+    bicycle_rider = BicycleRider("bicycle_rider")
+    bicycle_rider.bicycle = _create_whipple_bicycle_moore(cranks=True)
+    bicycle_rider.rider = rider
+    bicycle_rider.seat = FixedSeat("seat")
+    bicycle_rider.pedals = HolonomicPedals("pedals")
+    bicycle_rider.hand_grips = HolonomicHandGrips("hand_grips")
+    return bicycle_rider
+
+
+# The partitions are the ones selected by
+# :func:`symbrim.utilities.partitioning.select_partition`, which minimizes the number
+# of operations of the dependent speeds solved using the LU decomposition.
+CONFIGURATIONS: dict[str, ZooConfiguration] = {config.name: config for config in (
+    ZooConfiguration(
+        "rolling_disc",
+        "Rolling disc with a knife-edge wheel and a nonholonomic tire.",
+        _create_rolling_disc,
+        lambda disc, system: _apply_gravity(disc.ground, system),
+        (),
+        ("disc_u1", "disc_u2"),
+    ),
+    ZooConfiguration(
+        "whipple_bicycle_moore",
+        "Whipple bicycle following the convention of Moore with knife-edge wheels "
+        "and nonholonomic tires.",
+        _create_whipple_bicycle_moore,
+        lambda bike, system: _apply_gravity(bike.ground, system),
+        ("bicycle_q4",),
+        ("bicycle_u4", "bicycle_u6", "bicycle_u1", "bicycle_u2", "bicycle_u8"),
+    ),
+    ZooConfiguration(
+        "bicycle_rider",
+        "Whipple bicycle with a rider, which is fixed to the seat and holds the "
+        "handlebars and pedals.",
+        _create_bicycle_rider,
+        lambda bicycle_rider, system: _apply_gravity(
+            bicycle_rider.bicycle.ground, system),
+        ("left_hip_q_flexion", "right_hip_q_flexion", "bicycle_q5",
+         "left_hip_q_rotation", "left_leg_q_ankle_flexion", "right_hip_q_rotation",
+         "right_leg_q_ankle_flexion", "left_shoulder_q_flexion",
+         "left_shoulder_q_rotation", "right_shoulder_q_flexion",
+         "right_shoulder_q_rotation", "left_arm_q_elbow_flexion",
+         "right_arm_q_elbow_flexion"),
+        ("bicycle_u6", "left_hip_u_flexion", "right_hip_u_flexion", "bicycle_u1",
+         "bicycle_u2", "bicycle_u3", "bicycle_u5", "left_hip_u_rotation",
+         "left_leg_u_ankle_flexion", "right_hip_u_rotation",
+         "right_leg_u_ankle_flexion", "left_shoulder_u_flexion",
+         "left_shoulder_u_rotation", "right_shoulder_u_flexion",
+         "right_shoulder_u_rotation", "left_arm_u_elbow_flexion",
+         "right_arm_u_elbow_flexion"),
+    ),
+)}
@@ -0,0 +1,122 @@
+"""Module containing utilities to generate and load the models of the zoo."""
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from symbrim.zoo.configurations import CONFIGURATIONS, ZooConfiguration
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+__all__ = ["generate", "get_directory", "load"]
+
+_DIRECTORY_ENVIRONMENT_VARIABLE = "SYMBRIM_ZOO_DIRECTORY"
+
+
+def get_directory(directory: str | os.PathLike | None = None) -> Path:
+    """Get the directory storing the generated modules of the zoo.
+
+    Explanation
+    -----------
+    If no directory is given, then the directory is taken from the
+    ``SYMBRIM_ZOO_DIRECTORY`` environment variable. If that is not set either, then
+    ``~/.cache/symbrim/zoo`` is used.
+    """
+    if directory is None:
+        directory = os.environ.get(_DIRECTORY_ENVIRONMENT_VARIABLE,
+                                   Path.home() / ".cache" / "symbrim" / "zoo")
+    return Path(directory)
+
+
+def _get_configuration(name: str) -> ZooConfiguration:
+    """Get a configuration by name."""
+    if name not in CONFIGURATIONS:
+        raise ValueError(f"Unknown configuration {name!r}, the available "
+                         f"configurations are {list(CONFIGURATIONS)}.")
+    return CONFIGURATIONS[name]
+
+
+def generate(name: str, directory: str | os.PathLike | None = None) -> Path:
+    """Derive a configuration of the zoo and write it as a NumPy module.
+
+    Explanation
+    -----------
+    The equations of motion are formed and written using
+    :func:`symbrim.utilities.exporting.generate_numpy_module`. The key of the
+    configuration is stored as ``MODEL_KEY`` in the module, such that
+    :func:`load` can detect outdated modules without deriving the model.
+
+    Parameters
+    ----------
+    name : str
+        Name of the configuration, see :data:`CONFIGURATIONS`.
+    directory : str | os.PathLike, optional
+        Directory in which the module is stored, see :func:`get_directory`.
+
+    Returns
+    -------
+    Path
+        Path of the generated module.
+    """
+    from symbrim.utilities.exporting import generate_numpy_module
+    config = _get_configuration(name)
+    system = config.create_system()
+    system.form_eoms(constraint_solver=config.constraint_solver)
+    source = generate_numpy_module(system)
+    path = get_directory(directory) / f"{name}.py"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'{source}\nMODEL_KEY = "{config.get_key()}"\n')
+    return path
+
+
+def load(name: str, directory: str | os.PathLike | None = None,
+         generate_missing: bool = False) -> ModuleType:
+    """Load the generated NumPy module of a configuration of the zoo.
+
+    Parameters
+    ----------
+    name : str
+        Name of the configuration, see :data:`CONFIGURATIONS`.
+    directory : str | os.PathLike, optional
+        Directory in which the module is stored, see :func:`get_directory`.
+    generate_missing : bool, optional
+        Whether to generate the module if it is missing or outdated, by default False.
+
+    Returns
+    -------
+    ModuleType
+        Generated module, see
+        :func:`symbrim.utilities.exporting.generate_numpy_module` for its contents.
+
+    Examples
+    --------
+    The modules are generated once using ``python -m symbrim.zoo``, after which they
+    can be loaded without deriving the equations of motion:
+
+    >>> from symbrim import zoo
+    >>> model = zoo.load("whipple_bicycle_moore")  # doctest: +SKIP
+    >>> x_dot = model.eval_rhs(0.0, x, r, p)  # doctest: +SKIP
+
+    """
+    key = _get_configuration(name).get_key()
+    path = get_directory(directory) / f"{name}.py"
+    if not path.exists():
+        if not generate_missing:
+            raise FileNotFoundError(
+                f"The model {name!r} has not been generated in {path.parent}, run "
+                f"'python -m symbrim.zoo {name}' to generate it.")
+        generate(name, directory)
+    spec = importlib.util.spec_from_file_location(f"symbrim_zoo_{name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if getattr(module, "MODEL_KEY", None) != key:
+        if not generate_missing:
+            raise ValueError(
+                f"The generated model {name!r} in {path.parent} is outdated, run "
+                f"'python -m symbrim.zoo {name}' to regenerate it.")
+        generate(name, directory)
+        return load(name, directory)
+    return module
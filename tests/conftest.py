@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sympy import symbols
+from sympy.physics.mechanics import (
+    Particle,
+    Point,
+    ReferenceFrame,
+    System,
+    dynamicsymbols,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sympy import Expr
+
+
+def _create_pendulum(constraint: str = "holonomic", force: Expr | None = None
+                     ) -> System:
+    # Pendulum described by Cartesian coordinates, which are related by a holonomic
+    # constraint unless another constraint is chosen. By default, the vertical force
+    # is gravity.
+    q1, q2, u1, u2 = dynamicsymbols("q1:3 u1:3")
+    m, g, l = symbols("m g l")  # noqa: E741
+    frame, origin = ReferenceFrame("N"), Point("O")
+    origin.set_vel(frame, 0)
+    particle = Particle("P", origin.locatenew("P", q1 * frame.x + q2 * frame.y), m)
+    particle.point.set_vel(frame, u1 * frame.x + u2 * frame.y)
+    system = System(frame, origin)
+    system.add_bodies(particle)
+    system.add_coordinates(q1, q2)
+    system.add_speeds(u1, u2)
+    system.add_kdes(q1.diff() - u1, q2.diff() - u2)
+    system.add_loads((particle.point, (-m * g if force is None else force) * frame.y))
+    if constraint == "holonomic":
+        system.add_holonomic_constraints(q1 ** 2 + q2 ** 2 - l ** 2)
+        system.q_ind, system.q_dep = [q1], [q2]
+        system.u_ind, system.u_dep = [u1], [u2]
+    elif constraint == "invalid_holonomic":
+        system.add_holonomic_constraints(l - 1)
+    elif constraint == "invalid_nonholonomic":
+        system.add_nonholonomic_constraints(q1 - l)
+    return system
+
+
+@pytest.fixture(scope="session")
+def create_pendulum() -> Callable[..., System]:
+    return _create_pendulum
@@ -285,6 +285,22 @@ class TestAuxiliaryHandler(AuxiliarySetup):
         self.handler.apply_speeds()
         assert self.handler.get_auxiliary_velocity(point) == vel
 
+    @pytest.mark.usefixtures("_setup_handler")
+    def test_get_auxiliary_velocity_multiple_forces(self) -> None:
+        uax, fax = dynamicsymbols("uax fax")
+        self.handler.add_noncontributing_force(
+            self.cart, self.inertial_frame.x, uax, fax)
+        self.handler.add_noncontributing_force(
+            self.inertial_point, self.inertial_frame.z, uaux, faux)
+        self.handler.apply_speeds()
+        cart_aux_vel = (uaux * self.inertial_frame.z + self.uay * self.inertial_frame.y
+                        + uax * self.inertial_frame.x)
+        assert self.handler.get_auxiliary_velocity(self.inertial_point) == (
+            uaux * self.inertial_frame.z)
+        assert self.handler.get_auxiliary_velocity(self.cart) == cart_aux_vel
+        assert self.handler.get_auxiliary_velocity(self.p3) == (
+            cart_aux_vel - self.ual * self.f2.y)
+
     @pytest.mark.usefixtures("_setup_handler")
     def test_get_auxiliary_velocity_not_applied(self) -> None:
         with pytest.raises(ValueError):
@@ -2,9 +2,27 @@ from __future__ import annotations
 
 import pytest
 from sympy import S, Symbol
-from sympy.physics.mechanics import System, Torque, dynamicsymbols
+from sympy.physics.mechanics import (
+    Particle,
+    PinJoint,
+    RigidBody,
+    System,
+    Torque,
+    dynamicsymbols,
+)
 
-from symbrim.bicycle import FlatGround, KnifeEdgeWheel, NonHolonomicTire
+from symbrim.bicycle import (
+    FlatGround,
+    InContactTire,
+    KnifeEdgeWheel,
+    NonHolonomicTire,
+    RigidFrontFrame,
+    RigidRearFrame,
+    TireBase,
+    ToroidalWheel,
+    WheelBase,
+    WhippleBicycleMoore,
+)
 from symbrim.core import (
     LoadGroupBase,
     ModelBase,
@@ -12,7 +30,9 @@ from symbrim.core import (
     Registry,
     set_default_convention,
 )
+from symbrim.core.base_classes import _merge_systems
 from symbrim.other.rolling_disc import RollingDisc
+from symbrim.utilities.utilities import check_zero
 
 
 class MyLoad(LoadGroupBase):
@@ -324,3 +344,273 @@ class TestFromConvention:
             @set_default_convention("my_convention")
             class A:
                 pass
+
+
+class TestRedefinition:
+    @staticmethod
+    def _create_bicycle(front_tire: TireBase, front_wheel: WheelBase
+                        ) -> WhippleBicycleMoore:
+        bike = WhippleBicycleMoore("bike")
+        bike.ground = FlatGround("ground")
+        bike.rear_frame = RigidRearFrame("rear_frame")
+        bike.front_frame = RigidFrontFrame("front_frame")
+        bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+        bike.front_wheel = front_wheel
+        bike.rear_tire = NonHolonomicTire("rear_tire")
+        bike.front_tire = front_tire
+        return bike
+
+    @staticmethod
+    def _create_in_contact_tire() -> InContactTire:
+        tire = InContactTire("front_tire")
+        tire.compute_normal_force = True
+        return tire
+
+    @staticmethod
+    def _assert_same_system(system: System, expected: System) -> None:
+        assert system.q == expected.q
+        assert system.u == expected.u
+        assert system.u_aux == expected.u_aux
+        assert len(system.loads) == len(expected.loads)
+        for attr in ("kdes", "holonomic_constraints", "nonholonomic_constraints",
+                     "velocity_constraints"):
+            exprs, expected_exprs = getattr(system, attr), getattr(expected, attr)
+            assert len(exprs) == len(expected_exprs)
+            for expr, expected_expr in zip(exprs, expected_exprs):
+                assert check_zero(expr - expected_expr)
+        bodies = sorted(system.bodies, key=lambda body: body.name)
+        for body, expected_body in zip(
+                bodies, sorted(expected.bodies, key=lambda body: body.name)):
+            assert body.name == expected_body.name
+            vel = body.masscenter.vel(system.frame).to_matrix(system.frame)
+            expected_vel = expected_body.masscenter.vel(expected.frame).to_matrix(
+                expected.frame)
+            assert check_zero((vel - expected_vel).norm())
+
+    def test_reuse_objects(self) -> None:
+        bike = self._create_bicycle(NonHolonomicTire("front_tire"),
+                                    KnifeEdgeWheel("front_wheel"))
+        bike.define_all()
+        old_tire, old_contact_point = bike.front_tire, bike.front_tire.contact_point
+        rear_frame_body, front_wheel_body = bike.rear_frame.body, bike.front_wheel.body
+        rear_wheel_system = bike.rear_wheel.system
+        bike.front_tire = self._create_in_contact_tire()
+        bike.define_all()
+        assert bike.rear_frame.body is rear_frame_body
+        assert bike.front_wheel.body is front_wheel_body
+        assert bike.rear_wheel.system is rear_wheel_system
+        assert old_tire.system is None
+        assert old_contact_point not in bike.front_wheel.center._pos_dict
+        expected = self._create_bicycle(self._create_in_contact_tire(),
+                                        KnifeEdgeWheel("front_wheel"))
+        expected.define_all()
+        self._assert_same_system(bike.to_system(), expected.to_system())
+
+    def test_replace_wheel_and_back(self) -> None:
+        bike = self._create_bicycle(NonHolonomicTire("front_tire"),
+                                    KnifeEdgeWheel("front_wheel"))
+        bike.define_all()
+        bike.front_wheel = ToroidalWheel("front_wheel")
+        bike.define_all()
+        expected = self._create_bicycle(NonHolonomicTire("front_tire"),
+                                        ToroidalWheel("front_wheel"))
+        expected.define_all()
+        self._assert_same_system(bike.to_system(), expected.to_system())
+        bike.front_wheel = KnifeEdgeWheel("front_wheel")
+        bike.front_tire = self._create_in_contact_tire()
+        bike.define_all()
+        expected = self._create_bicycle(self._create_in_contact_tire(),
+                                        KnifeEdgeWheel("front_wheel"))
+        expected.define_all()
+        self._assert_same_system(bike.to_system(), expected.to_system())
+
+    def test_redefine_without_changes(self, mocker) -> None:
+        disc = RollingDisc("disc")
+        disc.wheel = KnifeEdgeWheel("wheel")
+        disc.ground = FlatGround("ground")
+        disc.tire = NonHolonomicTire("tire")
+        disc.define_all()
+        system = disc.system
+        spy = mocker.spy(disc.tire, "_define_objects")
+        disc.tire = disc.tire
+        disc.define_all()
+        assert disc.system is system
+        spy.assert_not_called()
+
+    def test_add_load_group(self) -> None:
+        disc = RollingDisc("disc")
+        disc.wheel = KnifeEdgeWheel("wheel")
+        disc.ground = FlatGround("ground")
+        disc.tire = NonHolonomicTire("tire")
+        disc.define_all()
+        ground_system = disc.ground.system
+        load_group = MyLoad("load")
+        disc.wheel.add_load_groups(load_group)
+        disc.define_all()
+        assert disc.ground.system is ground_system
+        assert disc.to_system().loads == (
+            Torque(disc.wheel.frame,
+                   load_group.symbols["T"] * disc.wheel.rotation_axis),)
+
+    def test_settings_after_definition(self) -> None:
+        disc = RollingDisc("disc")
+        disc.wheel = KnifeEdgeWheel("wheel")
+        disc.ground = FlatGround("ground")
+        disc.tire = NonHolonomicTire("tire")
+        disc.define_all()
+        disc.tire.my_setting = True
+        del disc.tire._on_ground
+        disc.tire.symbols["my_sym"] = Symbol("my_sym")
+        disc.ground = FlatGround("ground", normal="+z")
+        disc.define_all()
+        assert disc.tire.my_setting
+        assert disc.tire.on_ground
+        assert "my_sym" in disc.tire.symbols
+        assert disc.ground.get_normal(disc.ground.origin) == disc.ground.frame.z
+
+    def test_partially_defined(self) -> None:
+        disc = RollingDisc("disc")
+        disc.wheel = KnifeEdgeWheel("wheel")
+        disc.ground = FlatGround("ground")
+        disc.tire = NonHolonomicTire("tire")
+        disc.define_connections()
+        disc.define_objects()
+        disc.define_kinematics()
+        disc.define_objects()
+        disc.define_kinematics()
+        disc.define_loads()
+        disc.define_constraints()
+        assert len(disc.to_system().nonholonomic_constraints) == 2
+
+    def test_previous_root_as_submodel(self) -> None:
+        wheel = KnifeEdgeWheel("wheel")
+        wheel.define_all()
+        assert wheel.is_root
+        disc = RollingDisc("disc")
+        disc.wheel = wheel
+        disc.ground = FlatGround("ground")
+        disc.tire = NonHolonomicTire("tire")
+        disc.define_all()
+        assert not wheel.is_root
+        assert wheel.auxiliary_handler is disc.auxiliary_handler
+
+
+class TestSnapshot:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.disc = RollingDisc("disc")
+        self.disc.wheel = KnifeEdgeWheel("wheel")
+        self.disc.ground = FlatGround("ground")
+        self.disc.tire = NonHolonomicTire("tire")
+        self.disc.define_all()
+
+    def test_restore(self) -> None:
+        disc = RollingDisc.restore(self.disc.snapshot())
+        assert isinstance(disc, RollingDisc)
+        assert disc.wheel is not self.disc.wheel
+        assert disc.wheel.frame is not self.disc.wheel.frame
+        assert disc.get_all_symbols() == self.disc.get_all_symbols()
+        assert disc.auxiliary_handler is disc.wheel.auxiliary_handler
+        TestRedefinition._assert_same_system(disc.to_system(), self.disc.to_system())
+
+    def test_redefine_restored(self) -> None:
+        disc = RollingDisc.restore(self.disc.snapshot())
+        ground_system = disc.ground.system
+        disc.wheel = ToroidalWheel("wheel")
+        disc.define_all()
+        assert disc.ground.system is ground_system
+        expected = RollingDisc("disc")
+        expected.wheel = ToroidalWheel("wheel")
+        expected.ground = FlatGround("ground")
+        expected.tire = NonHolonomicTire("tire")
+        expected.define_all()
+        TestRedefinition._assert_same_system(disc.to_system(), expected.to_system())
+
+    def test_restore_invalid_type(self) -> None:
+        with pytest.raises(TypeError):
+            KnifeEdgeWheel.restore(self.disc.snapshot())
+
+
+class TestFreezeParameters:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.disc = RollingDisc("disc")
+        self.disc.wheel = KnifeEdgeWheel("wheel")
+        self.disc.ground = FlatGround("ground")
+        self.disc.tire = NonHolonomicTire("tire")
+
+    def _assert_frozen(self, r: Symbol) -> None:
+        assert self.disc.wheel.symbols["r"] == 0.3
+        assert self.disc.wheel.body.mass == 2
+        system = self.disc.to_system()
+        assert r not in self.disc.wheel.center.pos_from(system.fixed_point).to_matrix(
+            system.frame).free_symbols
+
+    def test_freeze_before_kinematics(self) -> None:
+        self.disc.define_connections()
+        self.disc.define_objects()
+        r, mass = self.disc.wheel.symbols["r"], self.disc.wheel.body.mass
+        self.disc.freeze_parameters({r: 0.3, mass: 2})
+        assert not self.disc._is_dirty
+        self.disc.define_all()
+        self._assert_frozen(r)
+
+    def test_freeze_submodel_before_definition(self) -> None:
+        r, mass = Symbol("wheel_r"), Symbol("wheel_mass")
+        self.disc.wheel.freeze_parameters({r: 0.3, mass: 2})
+        self.disc.define_all()
+        self._assert_frozen(r)
+
+    def test_freeze_after_definition(self) -> None:
+        self.disc.define_all()
+        r, mass = self.disc.wheel.symbols["r"], self.disc.wheel.body.mass
+        self.disc.freeze_parameters({r: 0.3, mass: 2})
+        assert self.disc._is_dirty
+        assert self.disc.wheel._is_dirty
+        self.disc.define_all()
+        self._assert_frozen(r)
+
+    def test_freeze_particle_and_model_without_system(self) -> None:
+        class EmptyModel(ModelBase):
+            """Model without a system."""
+
+        class ParticleModel(ModelBase):
+            """Model with a particle."""
+
+            required_models = (ModelRequirement("empty", EmptyModel, "Empty model."),)
+
+            def _define_objects(self) -> None:
+                super()._define_objects()
+                self._system = System()
+                self.system.add_bodies(Particle(
+                    self._add_prefix("particle"), mass=Symbol(self._add_prefix("m"))))
+
+        model = ParticleModel("model")
+        model.empty = EmptyModel("empty")
+        model.freeze_parameters({Symbol("model_m"): 2})
+        model.define_all()
+        assert model.empty.system is None
+        assert model.system.bodies[0].mass == 2
+
+
+def test_merge_systems() -> None:
+    q1, q2, u1, u2 = dynamicsymbols("q1:3 u1:3")
+    ground, body1, body2 = RigidBody("ground"), RigidBody("body1"), RigidBody("body2")
+    system1 = System.from_newtonian(ground)
+    system1.add_joints(PinJoint("joint1", ground, body1, q1, u1))
+    system1.add_holonomic_constraints(q1)
+    system2 = System(ground.frame, ground.masscenter)
+    system2.add_coordinates(q1, q2, independent=[True, False])
+    system2.add_speeds(u1, u2)
+    system2.add_bodies(body1)
+    system2.add_joints(PinJoint("joint2", body1, body2, q2, u2))
+    system2.add_holonomic_constraints(q2)
+    merged = _merge_systems(system1, system2)
+    assert merged.q_ind[:] == [q1]
+    assert merged.q_dep[:] == [q2]
+    assert merged.u[:] == [u1, u2]
+    assert merged.bodies == (ground, body1, body2)
+    assert merged.joints == (*system1.joints, *system2.joints)
+    assert merged.kdes[:] == [u1 - q1.diff(), u2 - q2.diff()]
+    assert merged.holonomic_constraints[:] == [q1, q2]
+    assert merged.velocity_constraints[:] == [q1.diff(), q2.diff()]
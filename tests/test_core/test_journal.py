@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import pickle
+from itertools import count
+from types import SimpleNamespace
+
+import pytest
+from sympy import symbols
+from sympy.physics.mechanics import (
+    Particle,
+    PinJoint,
+    Point,
+    ReferenceFrame,
+    RigidBody,
+    System,
+    dynamicsymbols,
+)
+
+from symbrim.core import Attachment, AuxiliaryDataHandler
+from symbrim.core import journal as journal_module
+from symbrim.core.journal import GraphJournal, remove_cached_relations
+
+
+class TestGraphJournal:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.q, self.u = dynamicsymbols("q u")
+        self.l = symbols("l")
+        self.frame = ReferenceFrame("N")
+        self.origin = Point("O")
+        self.origin.set_vel(self.frame, 0)
+        self.obj = SimpleNamespace(frame=self.frame, origin=self.origin)
+
+    def test_undo_new_relations(self) -> None:
+        child = ReferenceFrame("A")
+        point = Point("P")
+        self.obj.points = [point]
+        self.obj.frames = {"child": child}
+        journal = GraphJournal([self.obj])
+        child.orient_axis(self.frame, self.frame.z, self.q)
+        child.set_ang_vel(self.frame, self.u * self.frame.z)
+        point.set_pos(self.origin, self.l * child.x)
+        point.v2pt_theory(self.origin, self.frame, child)
+        journal.finish([self.obj])
+        journal.undo()
+        for dct in (self.frame._dcm_dict, self.frame._dcm_cache,
+                    self.frame._ang_vel_dict, self.origin._pos_dict,
+                    child._dcm_dict, child._ang_vel_dict, point._pos_dict,
+                    point._vel_dict):
+            assert dct == {}
+        assert self.origin._vel_dict == {self.frame: 0}
+
+    def test_undo_changed_relation(self) -> None:
+        point = self.origin.locatenew("P", self.l * self.frame.x)
+        self.obj.point = point
+        journal = GraphJournal([self.obj])
+        point.set_pos(self.origin, 2 * self.l * self.frame.x)
+        journal.finish([self.obj])
+        journal.undo()
+        assert point.pos_from(self.origin) == self.l * self.frame.x
+        assert self.origin.pos_from(point) == -self.l * self.frame.x
+
+    def test_undo_skips_later_changes(self) -> None:
+        point = Point("P")
+        self.obj.point = point
+        journal = GraphJournal([self.obj])
+        point.set_pos(self.origin, self.l * self.frame.x)
+        journal.finish([self.obj])
+        point.set_pos(self.origin, 2 * self.l * self.frame.x)
+        journal.undo()
+        assert point.pos_from(self.origin) == 2 * self.l * self.frame.x
+
+    def test_undo_reoriented_frame(self) -> None:
+        child, other = ReferenceFrame("A"), ReferenceFrame("B")
+        child.orient_axis(self.frame, self.frame.z, self.q)
+        other.orient_axis(child, child.x, self.q)
+        self.obj.frames = (child, other)
+        journal = GraphJournal([self.obj])
+        # Orienting w.r.t. the same parent replaces the dictionary of the child.
+        child.orient_axis(self.frame, self.frame.x, self.q)
+        journal.finish([self.obj])
+        assert journal.get_recorded_relations()[child, "_dcm_dict"] == {self.frame}
+        journal.undo()
+        expected = ReferenceFrame("C")
+        expected.orient_axis(self.frame, self.frame.z, self.q)
+        assert child.dcm(self.frame) == expected.dcm(self.frame)
+        assert other in child._dcm_dict
+        assert child.ang_vel_in(self.frame) == self.q.diff() * self.frame.z
+
+    def test_scan_objects(self) -> None:
+        a, b = ReferenceFrame("A"), ReferenceFrame("B")
+        pa, pb, pc, pd = symbols("pa:d", cls=Point)
+        self.obj.items = {pa}
+        self.obj.particle = Particle("particle", pb)
+        self.obj.body = RigidBody("body", pc, a)
+        self.obj.attachment = Attachment(b, pd)
+        journal = GraphJournal([self.obj])
+        for point in (pa, pb, pc, pd):
+            point.set_vel(self.frame, self.u * self.frame.x)
+        b.set_ang_vel(self.frame, self.u * self.frame.z)
+        journal.finish([self.obj])
+        assert set(journal.get_recorded_relations()) == {
+            (pa, "_vel_dict"), (pb, "_vel_dict"), (pc, "_vel_dict"),
+            (pd, "_vel_dict"), (b, "_ang_vel_dict"),
+            (self.frame, "_ang_vel_dict")}
+
+    def test_scan_system(self) -> None:
+        parent = RigidBody("parent", self.origin, self.frame)
+        child = RigidBody("child")
+        system = System.from_newtonian(parent)
+        system.add_joints(PinJoint("joint", parent, child, self.q, self.u))
+        obj = SimpleNamespace(system=system)
+        journal = GraphJournal([obj])
+        child.masscenter.set_vel(self.frame, self.u * self.frame.x)
+        journal.finish([obj])
+        assert (child.masscenter, "_vel_dict") in journal.get_recorded_relations()
+
+    def test_auxiliary_data(self) -> None:
+        handler = AuxiliaryDataHandler(self.frame, self.origin)
+        aux1 = handler.add_noncontributing_force(self.origin, self.frame.x, self.u,
+                                                 self.q)
+        journal = GraphJournal([self.obj], handler)
+        handler.add_noncontributing_force(self.origin, self.frame.y, self.u, self.q)
+        journal.finish([self.obj])
+        journal.undo()
+        assert handler.auxiliary_data_list == [aux1]
+
+    def test_index(self) -> None:
+        journal1, journal2 = GraphJournal([self.obj]), GraphJournal([self.obj])
+        assert journal1.index < journal2.index
+
+    @pytest.mark.parametrize("reset_counter", [False, True])
+    def test_pickle(self, monkeypatch, reset_counter) -> None:
+        point = Point("P")
+        self.obj.point = point
+        journal = GraphJournal([self.obj])
+        point.set_pos(self.origin, self.l * self.frame.x)
+        journal.finish([self.obj])
+        if reset_counter:  # Emulate restoring the journal in another process.
+            monkeypatch.setattr(journal_module, "_counter", count())
+        obj, restored = pickle.loads(pickle.dumps((self.obj, journal)))  # noqa: S301
+        assert restored.index == journal.index
+        assert GraphJournal([obj]).index > restored.index
+        restored.undo()
+        assert obj.point._pos_dict == {}
+        assert obj.origin._pos_dict == {}
+
+
+def test_remove_cached_relations() -> None:
+    q = dynamicsymbols("q")
+    frame, child, other = ReferenceFrame("N"), ReferenceFrame("A"), ReferenceFrame("B")
+    origin, point = Point("O"), Point("P")
+    obj = SimpleNamespace(frames=[frame, child, other], points=[origin, point])
+    journal = GraphJournal([obj])
+    child.orient_axis(frame, frame.z, q)
+    other.orient_axis(child, child.x, q)
+    origin.set_vel(frame, 0)
+    point.set_pos(origin, q * child.x)
+    journal.finish([obj])
+    # Cache the relations between other and frame and the velocity of the point.
+    other.dcm(frame)
+    point.vel(frame)
+    assert frame in other._dcm_cache
+    assert frame in point._vel_dict
+    remove_cached_relations([journal])
+    assert frame not in other._dcm_cache
+    assert child in other._dcm_cache
+    assert frame not in point._vel_dict
+    assert origin._vel_dict == {frame: 0}
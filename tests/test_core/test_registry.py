@@ -3,6 +3,8 @@ import pytest
 from symbrim.bicycle import (
     KnifeEdgeWheel,
     NonHolonomicTire,
+    RigidRearFrame,
+    RigidRearFrameMoore,
     TireBase,
     ToroidalWheel,
     WheelBase,
@@ -88,3 +90,12 @@ class TestRegistry:
         options = set(Registry().get_matching_load_groups(*args, **kwargs))
         assert subset.issubset(options)
         assert disjoint.isdisjoint(options)
+
+    @pytest.mark.parametrize(("args", "expected"), [
+        (("moore", RigidRearFrame), {RigidRearFrameMoore}),
+        (("moore", RigidRearFrameMoore), {RigidRearFrameMoore}),
+        (("not_a_convention", RigidRearFrame), set()),
+        (("moore", WheelBase), set()),
+    ])
+    def test_get_from_convention(self, args, expected) -> None:
+        assert set(Registry().get_from_convention(*args)) == expected
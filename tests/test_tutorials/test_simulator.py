@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import importlib.util
+import shutil
+import sysconfig
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from sympy import lambdify, symbols
+from sympy.physics.mechanics import System, dynamicsymbols
+
+from symbrim.zoo import CONFIGURATIONS
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def _import_simulator() -> ModuleType:
+    # The simulator is part of the tutorials, which are not a package.
+    path = Path(__file__).parents[2] / "docs" / "tutorials" / "simulator.py"
+    spec = importlib.util.spec_from_file_location("simulator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    from scipy.integrate import BDF, RK45
+    from scipy.optimize import fsolve
+
+    simulator = _import_simulator()
+except ImportError:
+    pytest.skip("scipy not installed", allow_module_level=True)
+
+has_compiler = shutil.which(
+    (sysconfig.get_config_var("CC") or "cc").split()[0]) is not None
+backends = ["lambdify", pytest.param("c", marks=pytest.mark.skipif(
+    not has_compiler, reason="C compiler not found"))]
+
+
+@pytest.fixture(scope="module")
+def rolling_disc() -> System:
+    system = CONFIGURATIONS["rolling_disc"].create_system()
+    system.form_eoms()
+    return system
+
+
+@pytest.fixture(scope="module")
+def pendulum(create_pendulum) -> System:
+    system = create_pendulum()
+    system.form_eoms()
+    return system
+
+
+def _create_simulator(system: System, backend: str = "lambdify", **kwargs: object
+                      ) -> simulator.Simulator:
+    sim = simulator.Simulator(system)
+    free_symbols = set().union(*(mat.free_symbols for mat in (
+        system.mass_matrix_full, system.forcing_full, system.holonomic_constraints,
+        system.nonholonomic_constraints)))
+    free_symbols.discard(dynamicsymbols._t)
+    sim.constants = {sym: 9.81 if sym.name == "g" else 0.5 for sym in free_symbols}
+    # The dependent coordinates and speeds are solved upon initialization.
+    sim.initial_conditions = {
+        **dict(zip(system.q, np.linspace(0.1, 0.4, len(system.q)))),
+        **dict(zip(system.u, np.linspace(-1.0, 2.0, len(system.u)))),
+    }
+    sim.initialize(backend=backend, **kwargs)
+    return sim
+
+
+def _get_initial_state(sim: simulator.Simulator) -> np.ndarray:
+    return np.array([sim.initial_conditions[xi] for xi in sim.system.q.col_join(
+        sim.system.u)])
+
+
+@pytest.mark.skipif(not has_compiler, reason="C compiler not found")
+@pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+class TestCBackend:
+    def test_eval_rhs(self, request, system_name) -> None:
+        system = request.getfixturevalue(system_name)
+        sim_lambdify = _create_simulator(system)
+        sim_c = _create_simulator(system, "c")
+        x = _get_initial_state(sim_c) + 0.1 * np.random.default_rng(0).standard_normal(
+            len(system.q) + len(system.u))
+        np.testing.assert_allclose(sim_c.eval_rhs(0.0, x),
+                                   sim_lambdify.eval_rhs(0.0, x))
+
+    def test_solve(self, request, system_name) -> None:
+        system = request.getfixturevalue(system_name)
+        sim_lambdify = _create_simulator(system)
+        sim_c = _create_simulator(system, "c")
+        np.testing.assert_allclose(_get_initial_state(sim_c),
+                                   _get_initial_state(sim_lambdify))
+        t_eval = np.linspace(0.0, 0.5, 11)
+        sim_lambdify.solve((0.0, 0.5), t_eval=t_eval)
+        sim_c.solve((0.0, 0.5), t_eval=t_eval)
+        np.testing.assert_allclose(sim_c.t, t_eval)
+        np.testing.assert_allclose(sim_c.x, sim_lambdify.x, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.skipif(not has_compiler, reason="C compiler not found")
+def test_c_invalid_argument(rolling_disc) -> None:
+    sim = _create_simulator(rolling_disc, "c")
+    x = _get_initial_state(sim)
+    sim._eval_eoms_matrices(0.0, x, sim._p_vals, [])
+    with pytest.raises(ValueError):
+        sim._eval_eoms_matrices(0.0, x[1:], sim._p_vals, [])
+    with pytest.raises(TypeError):
+        sim._eval_eoms_matrices(0.0, x, sim._p_vals)
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+def test_eval_rhs_batch(request, system_name, backend) -> None:
+    system = request.getfixturevalue(system_name)
+    sim = _create_simulator(system, backend)
+    rng = np.random.default_rng(0)
+    xs = _get_initial_state(sim) + 0.1 * rng.standard_normal(
+        (5, len(system.q) + len(system.u)))
+    np.testing.assert_allclose(sim.eval_rhs_batch(0.0, xs),
+                               [sim.eval_rhs(0.0, xi) for xi in xs])
+    ps = sim._p_vals * rng.uniform(0.5, 1.5, (5, len(sim._p_vals)))
+    expected = []
+    for xi, pi in zip(xs, ps):
+        sim._p_vals = pi
+        expected.append(sim.eval_rhs(0.0, xi))
+    np.testing.assert_allclose(sim.eval_rhs_batch(np.zeros(5), xs, ps), expected)
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+def test_eval_rhs_full_matrices(request, system_name, backend) -> None:
+    system = request.getfixturevalue(system_name)
+    sim = _create_simulator(system, backend)
+    eval_full_matrices = lambdify(
+        (system.q.col_join(system.u), sim._p),
+        (system.mass_matrix_full, system.forcing_full))
+    rng = np.random.default_rng(0)
+    xs = _get_initial_state(sim) + 0.1 * rng.standard_normal(
+        (5, len(system.q) + len(system.u)))
+    expected = [np.linalg.solve(*eval_full_matrices(xi, sim._p_vals))[:, 0]
+                for xi in xs]
+    np.testing.assert_allclose([sim.eval_rhs(0.0, xi) for xi in xs], expected)
+    np.testing.assert_allclose(sim.eval_rhs_batch(0.0, xs), expected)
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+def test_eval_jac(request, system_name, backend) -> None:
+    system = request.getfixturevalue(system_name)
+    sim = _create_simulator(system, backend, jacobian=True)
+    x = _get_initial_state(sim)
+    h = 1e-6
+    expected = np.array([
+        (sim.eval_rhs(0.0, x + dx) - sim.eval_rhs(0.0, x - dx)) / (2 * h)
+        for dx in h * np.eye(len(x))]).T
+    np.testing.assert_allclose(sim.eval_jac(0.0, x), expected, rtol=1e-6,
+                               atol=1e-6)
+
+
+def test_eval_jac_not_initialized(pendulum) -> None:
+    sim = _create_simulator(pendulum)
+    with pytest.raises(RuntimeError):
+        sim.eval_jac(0.0, _get_initial_state(sim))
+
+
+def test_solve_implicit_with_jacobian(pendulum) -> None:
+    sim_jac = _create_simulator(pendulum, jacobian=True)
+    sim = _create_simulator(pendulum)
+    t_eval = np.linspace(0.0, 0.5, 11)
+    kwargs = {"method": "Radau", "t_eval": t_eval, "rtol": 1e-8, "atol": 1e-10}
+    sim_jac.solve((0.0, 0.5), **kwargs)
+    sim.solve((0.0, 0.5), **kwargs)
+    np.testing.assert_allclose(sim_jac.x, sim.x, rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize(("method", "passes_jac"), [
+    ("Radau", True), (BDF, True), (type("MyBDF", (BDF,), {}), True), ("RK45", False),
+    (RK45, False)])
+def test_solve_passes_jacobian(pendulum, mocker, method, passes_jac) -> None:
+    sim = _create_simulator(pendulum, jacobian=True)
+    solve_ivp = mocker.patch.object(simulator, "solve_ivp", wraps=simulator.solve_ivp)
+    sim.solve((0.0, 0.1), method=method)
+    assert (solve_ivp.call_args.kwargs.get("jac") == sim.eval_jac) is passes_jac
+
+
+class TestSolveInitialConditions:
+    def test_newton(self, pendulum) -> None:
+        sim = _create_simulator(pendulum)
+        q_ind = np.linspace(-0.4, 0.4, 5)[:, np.newaxis]
+        u_ind = np.linspace(-1.0, 1.0, 5)[:, np.newaxis]
+        q, u = sim.solve_initial_conditions_batch(q_ind, u_ind, [-0.3])
+        np.testing.assert_allclose(q[:, :1], q_ind)
+        np.testing.assert_allclose(u[:, :1], u_ind)
+        for qi, ui in zip(q, u):
+            expected = fsolve(sim._eval_configuration_constraints, [-0.3],
+                              args=(qi[:1], sim._p_vals))
+            np.testing.assert_allclose(qi[1:], expected)
+            velocity_constraints = sim._eval_velocity_constraints(
+                ui[1:], qi, ui[:1], sim._p_vals)
+            np.testing.assert_allclose(velocity_constraints, 0, atol=1e-10)
+
+    def test_fsolve_fallback(self, pendulum, monkeypatch) -> None:
+        sim = _create_simulator(pendulum)
+        q_ind, u_ind = [[0.3], [-0.2]], [[1.0], [0.5]]
+        expected = sim.solve_initial_conditions_batch(q_ind, u_ind, [-0.3])
+        monkeypatch.setattr(simulator, "NEWTON_MAX_ITERATIONS", 1)
+        for actual, desired in zip(sim.solve_initial_conditions_batch(
+                q_ind, u_ind, [-0.3]), expected):
+            np.testing.assert_allclose(actual, desired)
+
+    def test_singular_jacobian(self, pendulum) -> None:
+        sim = _create_simulator(pendulum)
+        q, _ = sim.solve_initial_conditions_batch([[0.3]], [[1.0]], [0.0])
+        np.testing.assert_allclose(
+            sim._eval_configuration_constraints(q[0, 1:], q[0, :1], sim._p_vals), 0,
+            atol=1e-10)
+
+    def test_no_dependent_coordinates(self, rolling_disc) -> None:
+        sim = _create_simulator(rolling_disc)
+        x = _get_initial_state(sim)
+        n_q, n_uind = len(rolling_disc.q), len(rolling_disc.u_ind)
+        np.testing.assert_allclose(sim._eval_velocity_constraints(
+            x[n_q + n_uind:], x[:n_q], x[n_q:n_q + n_uind], sim._p_vals), 0,
+            atol=1e-10)
+
+
+class TestProjection:
+    @pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+    def test_project_state(self, request, system_name) -> None:
+        system = request.getfixturevalue(system_name)
+        sim = _create_simulator(system)
+        x0 = _get_initial_state(sim)
+        x = x0 + 0.01 * np.random.default_rng(0).standard_normal(len(x0))
+        assert sim.eval_constraint_drift(x) > 1e-4
+        x_projected = sim.project_state(x)
+        assert sim.eval_constraint_drift(x_projected) < 1e-10
+        n_qind, n_q = len(system.q_ind), len(system.q)
+        np.testing.assert_array_equal(x_projected[:n_qind], x[:n_qind])
+        np.testing.assert_array_equal(x_projected[n_q:n_q + len(system.u_ind)],
+                                      x[n_q:n_q + len(system.u_ind)])
+
+    @pytest.mark.parametrize(("projection_kwargs", "max_drift"), [
+        ({"projection_interval": 1}, 1e-10),
+        ({"projection_tolerance": 1e-8}, 1e-8),
+        ({"projection_interval": 5, "projection_tolerance": 1e-8}, 1e-8),
+    ])
+    @pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+    def test_solve(self, request, system_name, projection_kwargs, max_drift
+                   ) -> None:
+        system = request.getfixturevalue(system_name)
+        sim = _create_simulator(system)
+        t_span, kwargs = (0.0, 2.0), {"rtol": 1e-6, "atol": 1e-8}
+        sim.solve(t_span, **kwargs)
+        drift = max(sim.eval_constraint_drift(xi) for xi in sim.x.T)
+        x_final = sim.x[:, -1]
+        sim.solve(t_span, **projection_kwargs, **kwargs)
+        np.testing.assert_allclose(sim.t[[0, -1]], t_span)
+        projected_drift = max(sim.eval_constraint_drift(xi) for xi in sim.x.T)
+        assert projected_drift < max_drift < drift
+        np.testing.assert_allclose(sim.x[:, -1], x_final, atol=1e-2)
+
+    def test_solve_t_eval(self, pendulum) -> None:
+        sim = _create_simulator(pendulum)
+        t_eval = np.linspace(0.0, 1.0, 21)
+        sim.solve((0.0, 1.0), projection_interval=1, t_eval=t_eval, rtol=1e-8,
+                  atol=1e-10)
+        np.testing.assert_allclose(sim.t, t_eval)
+        x_projected = sim.x
+        sim.solve((0.0, 1.0), t_eval=t_eval, rtol=1e-8, atol=1e-10)
+        np.testing.assert_allclose(x_projected, sim.x, atol=1e-6)
+
+    @pytest.mark.parametrize("option", [
+        {"events": lambda _, x: x[0]}, {"dense_output": True}, {"vectorized": True},
+        {"args": (1.0,)}])
+    def test_solve_unsupported_option(self, pendulum, option) -> None:
+        sim = _create_simulator(pendulum)
+        with pytest.raises(ValueError, match="not supported"):
+            sim.solve((0.0, 1.0), projection_interval=1, **option)
+
+
+@pytest.mark.parametrize("backend", backends)
+@pytest.mark.parametrize("system_name", ["rolling_disc", "pendulum"])
+def test_eval_rhs_out(request, system_name, backend) -> None:
+    system = request.getfixturevalue(system_name)
+    sim = _create_simulator(system, backend)
+    x = _get_initial_state(sim)
+    expected = sim.eval_rhs(0.0, x)
+    out = np.empty_like(x)
+    assert sim.eval_rhs(0.0, x, out) is out
+    np.testing.assert_allclose(out, expected)
+    # The buffers are reused, so the previous result should not be overwritten.
+    sim.eval_rhs(0.0, x + 0.1)
+    np.testing.assert_allclose(out, expected)
+
+
+@pytest.mark.skipif(not has_compiler, reason="C compiler not found")
+def test_c_into_invalid_output(rolling_disc) -> None:
+    sim = _create_simulator(rolling_disc, "c")
+    x = _get_initial_state(sim)
+    n = len(rolling_disc.u)
+    buffers = [np.empty((n, n)), np.empty(n), np.empty(len(rolling_disc.q))]
+    sim._eval_eoms_matrices_into(0.0, x, sim._p_vals, sim._r_vals, *buffers)
+    with pytest.raises(ValueError):
+        sim._eval_eoms_matrices_into(0.0, x, sim._p_vals, sim._r_vals,
+                                     np.empty(n), *buffers[1:])
+    with pytest.raises(TypeError):
+        sim._eval_eoms_matrices_into(0.0, x, sim._p_vals, sim._r_vals,
+                                     np.empty((n, n), dtype=np.float32), *buffers[1:])
+
+
+class TestCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, monkeypatch) -> None:
+        monkeypatch.setattr(simulator, "_COMPILED_FUNCTIONS", OrderedDict())
+
+    @pytest.mark.parametrize("backend", backends)
+    def test_shared_functions(self, rolling_disc, mocker, backend) -> None:
+        sim1 = _create_simulator(rolling_disc, backend)
+        derive_functions = mocker.spy(simulator.Simulator, "_derive_functions")
+        sim2 = _create_simulator(rolling_disc, backend)
+        assert derive_functions.call_count == 0
+        assert sim2._compiled is sim1._compiled
+        assert _create_simulator(rolling_disc, backend, jacobian=True
+                                 )._compiled is not sim1._compiled
+
+    @pytest.mark.parametrize("backend", backends)
+    def test_cache_dir(self, pendulum, tmp_path, mocker, monkeypatch, backend
+                       ) -> None:
+        sim1 = _create_simulator(pendulum, backend, jacobian=True, cache_dir=tmp_path)
+        monkeypatch.setattr(simulator, "_COMPILED_FUNCTIONS", OrderedDict())
+        derive_functions = mocker.spy(simulator.Simulator, "_derive_functions")
+        sim2 = _create_simulator(pendulum, backend, jacobian=True, cache_dir=tmp_path)
+        assert derive_functions.call_count == 0
+        assert sim2._compiled is not sim1._compiled
+        x = _get_initial_state(sim1) + 0.1
+        np.testing.assert_allclose(sim2.eval_rhs(0.0, x), sim1.eval_rhs(0.0, x))
+        np.testing.assert_allclose(sim2.eval_jac(0.0, x), sim1.eval_jac(0.0, x))
+        np.testing.assert_allclose(_get_initial_state(sim2), _get_initial_state(sim1))
+
+    def test_size(self, rolling_disc, pendulum, monkeypatch) -> None:
+        monkeypatch.setattr(simulator, "COMPILED_FUNCTIONS_CACHE_SIZE", 1)
+        _create_simulator(rolling_disc)
+        sim = _create_simulator(pendulum)
+        assert list(simulator._COMPILED_FUNCTIONS.values()) == [sim._compiled]
+
+
+@pytest.mark.skipif(not has_compiler, reason="C compiler not found")
+def test_c_temporary_build_dir(tmp_path, mocker) -> None:
+    build_dir = tmp_path / "build"
+    mocker.patch.object(simulator.tempfile, "mkdtemp", return_value=str(build_dir))
+    x = symbols("x")
+    functions = simulator._c_lambdify({"f": ((x,), ([x ** 2],))})
+    np.testing.assert_allclose(functions["f"](2.0), [4.0])
+    assert not build_dir.exists()
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sympy import ImmutableMatrix, Symbol
+
+from symbrim.bicycle import (
+    FlatGround,
+    KnifeEdgeWheel,
+    MasslessCranks,
+    NonHolonomicTire,
+    ToroidalWheel,
+)
+from symbrim.core import LoadGroupBase, ModelBase
+from symbrim.utilities.caching import CachedEoms, EomCache, get_model_key
+from symbrim.zoo import CONFIGURATIONS
+
+if TYPE_CHECKING:
+    from sympy.physics.mechanics import System
+
+
+class MyLoad(LoadGroupBase):
+    required_parent_type = KnifeEdgeWheel
+
+
+_create_rolling_disc = CONFIGURATIONS["rolling_disc"].create_model
+
+
+def _get_key(model: ModelBase, **options: object) -> str:
+    model.define_connections()
+    model.define_objects()
+    return get_model_key(model, **options)
+
+
+class TestGetModelKey:
+    def test_stable(self) -> None:
+        assert _get_key(_create_rolling_disc()) == _get_key(_create_rolling_disc())
+
+    def test_is_hash(self) -> None:
+        key = _get_key(_create_rolling_disc())
+        assert len(key) == 64
+        int(key, 16)
+
+    def test_different_submodel(self) -> None:
+        disc = _create_rolling_disc()
+        disc.wheel = ToroidalWheel("wheel")
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+
+    def test_different_name(self) -> None:
+        disc = _create_rolling_disc()
+        disc.tire = NonHolonomicTire("other_tire")
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+
+    def test_missing_submodel(self) -> None:
+        bike1 = CONFIGURATIONS["whipple_bicycle_moore"].create_model()
+        bike2 = CONFIGURATIONS["whipple_bicycle_moore"].create_model()
+        bike2.cranks = MasslessCranks("cranks")
+        assert _get_key(bike1) != _get_key(bike2)
+
+    def test_different_setting(self) -> None:
+        disc = _create_rolling_disc()
+        disc.tire.compute_normal_force = True
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+        disc = _create_rolling_disc()
+        disc.ground = FlatGround("ground", normal="z")
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+        disc = _create_rolling_disc()
+        disc.tire.on_ground = True
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+
+    def test_load_group(self) -> None:
+        disc = _create_rolling_disc()
+        disc.wheel.add_load_groups(MyLoad("load"))
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+
+    def test_frozen_parameters(self) -> None:
+        disc = _create_rolling_disc()
+        disc.wheel.freeze_parameters({Symbol("wheel_r"): 0.3})
+        assert _get_key(disc) != _get_key(_create_rolling_disc())
+
+    def test_different_symbol(self) -> None:
+        disc1, disc2 = _create_rolling_disc(), _create_rolling_disc()
+        assert _get_key(disc1) == _get_key(disc2)
+        disc2.wheel.symbols["r"] = Symbol("radius")
+        assert get_model_key(disc1) != get_model_key(disc2)
+
+    def test_non_primitive_setting(self) -> None:
+        disc = _create_rolling_disc()
+        disc.tire.slip_directions = ("lateral", "longitudinal")
+        with pytest.raises(TypeError):
+            _get_key(disc)
+
+    def test_defined_settings(self) -> None:
+        disc1, disc2 = _create_rolling_disc(), _create_rolling_disc()
+        disc2.ground = FlatGround("ground", normal="z")
+        disc1.define_all()
+        disc2.define_all()
+        assert get_model_key(disc1) != get_model_key(disc2)
+
+    @pytest.mark.parametrize("name", CONFIGURATIONS)
+    def test_same_after_definition(self, name) -> None:
+        model = CONFIGURATIONS[name].create_model()
+        model.define_connections()
+        model.define_objects()
+        key = get_model_key(model)
+        model.define_kinematics()
+        model.define_loads()
+        model.define_constraints()
+        assert get_model_key(model) == key
+
+    def test_undefined_model(self) -> None:
+        with pytest.raises(ValueError):
+            get_model_key(_create_rolling_disc())
+
+    @pytest.mark.parametrize("module", ["symbrim", "sympy"])
+    def test_version(self, module, mocker) -> None:
+        key = _get_key(_create_rolling_disc())
+        mocker.patch(f"symbrim.utilities.caching.{module}.__version__", "0.0.0")
+        assert _get_key(_create_rolling_disc()) != key
+
+    def test_options(self) -> None:
+        disc = _create_rolling_disc()
+        assert _get_key(disc, constraint_solver="CRAMER") != _get_key(disc)
+        assert _get_key(disc, a=1, b=2) == _get_key(disc, b=2, a=1)
+
+    def test_invalid_model(self) -> None:
+        with pytest.raises(TypeError):
+            get_model_key(NonHolonomicTire("tire"))
+
+
+@pytest.fixture(scope="module")
+def system() -> System:
+    system = CONFIGURATIONS["rolling_disc"].create_system()
+    system.form_eoms()
+    return system
+
+
+class TestEomCache:
+    def test_cached_eoms_from_system(self, system) -> None:
+        eoms = CachedEoms.from_system(system)
+        assert eoms.mass_matrix_full == system.mass_matrix_full
+        assert eoms.forcing_full == system.forcing_full
+        assert eoms.q == ImmutableMatrix(system.q)
+        assert eoms.u == ImmutableMatrix(system.u)
+        assert eoms.kindiffdict == system.eom_method.kindiffdict()
+
+    def test_cached_eoms_not_formed(self) -> None:
+        disc = _create_rolling_disc()
+        disc.define_all()
+        with pytest.raises(ValueError):
+            CachedEoms.from_system(disc.to_system())
+
+    def test_save_load(self, system, tmp_path) -> None:
+        cache = EomCache(tmp_path / "cache")
+        assert cache.directory == tmp_path / "cache"
+        disc = _create_rolling_disc()
+        disc.define_connections()
+        disc.define_objects()
+        key = cache.get_key(disc)
+        assert key not in cache
+        assert cache.load(key) is None
+        saved = cache.save(key, system)
+        assert key in cache
+        loaded = cache.load(key)
+        assert loaded == saved
+        assert loaded.mass_matrix == system.mass_matrix
+        assert loaded.forcing == system.forcing
+        assert loaded.holonomic_constraints == system.holonomic_constraints
+        assert loaded.nonholonomic_constraints == system.nonholonomic_constraints
+        assert loaded.kdes == system.kdes
+        assert list(tmp_path.joinpath("cache").glob("*.tmp")) == []
+
+    def test_save_cached_eoms(self, system, tmp_path) -> None:
+        cache = EomCache(tmp_path)
+        eoms = CachedEoms.from_system(system)
+        assert cache.save("key", eoms) is eoms
+        assert cache.load("key") == eoms
+
+    def test_remove_clear(self, system, tmp_path) -> None:
+        cache = EomCache(tmp_path)
+        cache.save("key1", system)
+        cache.save("key2", system)
+        cache.remove("key1")
+        assert "key1" not in cache
+        assert "key2" in cache
+        cache.clear()
+        assert "key2" not in cache
+        EomCache(tmp_path / "not_existing").clear()
+
+    def test_save_failure(self, system, tmp_path, mocker) -> None:
+        mocker.patch("symbrim.utilities.caching.pickle.dump",
+                     side_effect=RuntimeError("Failed to write."))
+        cache = EomCache(tmp_path)
+        with pytest.raises(RuntimeError):
+            cache.save("key", system)
+        assert "key" not in cache
+        assert list(tmp_path.iterdir()) == []
+
+    def test_load_invalid_file(self, tmp_path) -> None:
+        cache = EomCache(tmp_path)
+        tmp_path.joinpath("key.pkl").write_bytes(b"\x80\x04K\x05.")
+        with pytest.raises(TypeError):
+            cache.load("key")
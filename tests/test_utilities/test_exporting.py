@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from sympy import Symbol, lambdify, symbols
+from sympy.physics.mechanics import dynamicsymbols
+
+from symbrim.utilities.exporting import generate_numpy_module
+from symbrim.zoo import CONFIGURATIONS
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_create_rolling_disc = CONFIGURATIONS["rolling_disc"].create_system
+
+
+def _import_module(path: Path) -> object:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestGenerateNumpyModule:
+    def test_rolling_disc(self, tmp_path) -> None:
+        system = _create_rolling_disc()
+        system.form_eoms()
+        path = tmp_path / "disc_eoms.py"
+        source = generate_numpy_module(system, path)
+        assert path.read_text() == source
+        assert "sympy" not in source
+        module = _import_module(path)
+        assert tuple(map(str, system.q.col_join(system.u))) == module.STATE
+        assert tuple(map(str, system.u_dep)) == module.U_DEP
+        assert module.INPUTS == ()
+        rng = np.random.default_rng(0)
+        x = rng.random(len(module.STATE))
+        p = rng.random(len(module.CONSTANTS))
+        args = (system.q.col_join(system.u), symbols(module.CONSTANTS))
+        eval_eoms = lambdify(args, (system.mass_matrix_full, system.forcing_full))
+        expected = np.linalg.solve(*eval_eoms(x, p)).ravel()
+        np.testing.assert_allclose(module.eval_rhs(0.0, x, [], p), expected)
+        assert module.eval_holonomic_constraints(x, [], p).shape == (0,)
+        np.testing.assert_allclose(
+            module.eval_velocity_constraints(x, [], p),
+            lambdify(args, system.nonholonomic_constraints.xreplace(
+                system.eom_method.kindiffdict()))(x, p).ravel())
+
+    def test_pendulum(self, create_pendulum, tmp_path) -> None:
+        g, f = Symbol("g"), dynamicsymbols("f")
+        system = create_pendulum(force=f - Symbol("m") * g)
+        system.form_eoms()
+        constants = symbols("l g m")
+        path = tmp_path / "pendulum_eoms.py"
+        path.write_text(generate_numpy_module(system, constants=constants))
+        module = _import_module(path)
+        assert module.INPUTS == ("f(t)",)
+        assert module.CONSTANTS == ("l", "g", "m")
+        x, p = np.array([0.6, 0.8, 0.4, -0.3]), np.array([1.0, 9.81, 2.0])
+        np.testing.assert_allclose(module.eval_holonomic_constraints(x, [1.0], p), [0],
+                                   atol=1e-12)
+        np.testing.assert_allclose(module.eval_velocity_constraints(x, [1.0], p), [0],
+                                   atol=1e-12)
+        np.testing.assert_allclose(module.eval_kinematic_map(x, [1.0], p), x[2:])
+        assert module.eval_mass_matrix(x, [1.0], p).shape == (2, 2)
+
+    def test_not_formed(self) -> None:
+        with pytest.raises(ValueError):
+            generate_numpy_module(_create_rolling_disc())
+
+    def test_missing_constants(self, create_pendulum) -> None:
+        system = create_pendulum()
+        system.form_eoms()
+        with pytest.raises(ValueError):
+            generate_numpy_module(system, constants=symbols("m g"))
+
+    def test_explicit_time(self, create_pendulum) -> None:
+        system = create_pendulum(force=-Symbol("m") * dynamicsymbols._t)
+        system.form_eoms()
+        with pytest.raises(ValueError):
+            generate_numpy_module(system)
+
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import symbrim
+from symbrim.utilities import lazy_loading
+from symbrim.utilities.lazy_loading import (
+    import_convention_modules,
+    import_lazy_modules,
+)
+
+
+class TestLazyLoading:
+    @pytest.fixture(autouse=True)
+    def _setup_package(self, tmp_path, monkeypatch) -> None:
+        package = tmp_path / "lazy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text(
+            "from symbrim.utilities.lazy_loading import attach_lazy_attributes\n"
+            "__getattr__, __dir__ = attach_lazy_attributes(__name__, {\n"
+            "    'first': ('a', 'b'), 'second': ('c',)}, {'conv': ('second',)})\n")
+        (package / "first.py").write_text("a, b = 1, 2\n")
+        (package / "second.py").write_text("c = 3\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(lazy_loading, "_PENDING_MODULES", {})
+        monkeypatch.setattr(lazy_loading, "_CONVENTION_MODULES", {})
+        yield
+        for name in ("lazy_pkg", "lazy_pkg.first", "lazy_pkg.second"):
+            sys.modules.pop(name, None)
+
+    def test_submodules_not_imported(self) -> None:
+        importlib.import_module("lazy_pkg")
+        assert "lazy_pkg.first" not in sys.modules
+        assert "lazy_pkg.second" not in sys.modules
+        assert list(lazy_loading._PENDING_MODULES) == [
+            "lazy_pkg.first", "lazy_pkg.second"]
+
+    def test_get_attribute(self) -> None:
+        package = importlib.import_module("lazy_pkg")
+        assert package.a == 1
+        assert "lazy_pkg.first" in sys.modules
+        assert "lazy_pkg.second" not in sys.modules
+        assert package.__dict__["a"] == 1
+        assert package.c == 3
+
+    def test_get_submodule(self) -> None:
+        package = importlib.import_module("lazy_pkg")
+        assert package.second is sys.modules["lazy_pkg.second"]
+
+    def test_get_non_existing_attribute(self) -> None:
+        package = importlib.import_module("lazy_pkg")
+        with pytest.raises(AttributeError, match="has no attribute 'd'"):
+            package.d  # noqa: B018
+
+    def test_dir(self) -> None:
+        package = importlib.import_module("lazy_pkg")
+        assert {"a", "b", "c", "first", "second"}.issubset(dir(package))
+        assert "lazy_pkg.first" not in sys.modules
+
+    def test_import_lazy_modules(self) -> None:
+        importlib.import_module("lazy_pkg")
+        import_lazy_modules()
+        assert "lazy_pkg.first" in sys.modules
+        assert "lazy_pkg.second" in sys.modules
+        assert not lazy_loading._PENDING_MODULES
+
+    def test_import_convention_modules(self) -> None:
+        importlib.import_module("lazy_pkg")
+        import_convention_modules("conv")
+        assert "lazy_pkg.first" not in sys.modules
+        assert "lazy_pkg.second" in sys.modules
+        assert list(lazy_loading._PENDING_MODULES) == ["lazy_pkg.first"]
+        import_convention_modules("conv")
+        import_convention_modules("other")
+        assert "lazy_pkg.first" not in sys.modules
+
+
+@pytest.mark.parametrize("package", ["symbrim", "symbrim.bicycle", "symbrim.brim",
+                                     "symbrim.rider", "symbrim.other"])
+def test_all_attributes_available(package) -> None:
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+
+
+def test_import_does_not_import_models() -> None:
+    code = ("import sys, symbrim; "
+            "assert 'symbrim.bicycle.whipple_bicycle' not in sys.modules; "
+            "assert 'sympy.physics.mechanics' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_convention_does_not_import_other_models() -> None:
+    code = ("import sys, symbrim; symbrim.WhippleBicycle('bicycle'); "
+            "assert 'symbrim.bicycle.whipple_bicycle' in sys.modules; "
+            "assert 'symbrim.rider' not in sys.modules; "
+            "assert 'symbrim.brim' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_version() -> None:
+    assert isinstance(symbrim.__version__, str)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+from sympy import Symbol, symbols
+from sympy.physics.mechanics import (
+    Particle,
+    Point,
+    ReferenceFrame,
+    System,
+    dynamicsymbols,
+)
+
+from symbrim.bicycle import (
+    FlatGround,
+    InContactTire,
+    KnifeEdgeWheel,
+    NonHolonomicTire,
+    TireBase,
+)
+from symbrim.other import RollingDisc
+from symbrim.utilities.parallel import ParallelKanesMethod
+from symbrim.utilities.utilities import check_zero
+
+
+def create_in_contact_tire() -> InContactTire:
+    tire = InContactTire("tire")
+    tire.no_lateral_slip = True
+    tire.no_longitudinal_slip = True
+    return tire
+
+
+class TestParallelKanesMethod:
+    @staticmethod
+    def _create_rolling_disc(tire: TireBase) -> System:
+        disc = RollingDisc("disc")
+        disc.wheel = KnifeEdgeWheel("wheel")
+        disc.ground = FlatGround("ground")
+        disc.tire = tire
+        disc.define_all()
+        system = disc.to_system()
+        system.apply_uniform_gravity(
+            -Symbol("g") * disc.ground.get_normal(disc.ground.origin))
+        system.u_ind = disc.u[2:]
+        system.u_dep = disc.u[:2]
+        return system
+
+    @staticmethod
+    def _create_particle_system(loads: bool) -> System:
+        q, u = dynamicsymbols("q u")
+        m, k = symbols("m k")
+        frame, origin = ReferenceFrame("N"), Point("O")
+        origin.set_vel(frame, 0)
+        particle = Particle("P", origin.locatenew("P", q * frame.x), m)
+        particle.point.set_vel(frame, u * frame.x)
+        system = System(frame, origin)
+        system.add_bodies(particle)
+        system.add_coordinates(q)
+        system.add_speeds(u)
+        system.add_kdes(q.diff() - u)
+        if loads:
+            system.add_loads((particle.point, -k * q * frame.x))
+        return system
+
+    @staticmethod
+    def _assert_same_eoms(system: System, expected: System) -> None:
+        for attr in ("mass_matrix_full", "forcing_full"):
+            eoms, expected_eoms = getattr(system, attr), getattr(expected, attr)
+            assert eoms.shape == expected_eoms.shape
+            assert all(check_zero(expr - expected_expr)
+                       for expr, expected_expr in zip(eoms, expected_eoms))
+
+    @pytest.mark.parametrize("create_tire", [
+        lambda: NonHolonomicTire("tire"),
+        create_in_contact_tire,
+    ])
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_rolling_disc(self, create_tire, processes) -> None:
+        system = self._create_rolling_disc(create_tire())
+        expected = self._create_rolling_disc(create_tire())
+        system.form_eoms(eom_method=ParallelKanesMethod, processes=processes)
+        expected.form_eoms()
+        assert isinstance(system.eom_method, ParallelKanesMethod)
+        self._assert_same_eoms(system, expected)
+        if expected.u_aux:
+            assert all(check_zero(eq - expected_eq) for eq, expected_eq in zip(
+                system.eom_method.auxiliary_eqs, expected.eom_method.auxiliary_eqs))
+
+    @pytest.mark.parametrize("loads", [True, False])
+    @pytest.mark.parametrize("processes", [None, 3])
+    def test_particle(self, loads, processes) -> None:
+        system = self._create_particle_system(loads)
+        expected = self._create_particle_system(loads)
+        system.form_eoms(eom_method=ParallelKanesMethod, processes=processes)
+        expected.form_eoms()
+        self._assert_same_eoms(system, expected)
+
+    def test_kanes_equations_arguments(self) -> None:
+        system = self._create_particle_system(True)
+        kane = ParallelKanesMethod(system.frame, system.q_ind, system.u_ind,
+                                   kd_eqs=system.kdes, processes=2)
+        fr, frstar = kane.kanes_equations(system.bodies, system.loads)
+        assert kane.bodies == list(system.bodies)
+        assert kane.loads == list(system.loads)
+        assert check_zero((fr + frstar)[0] - (
+            -system.bodies[0].mass * system.u[0].diff() - Symbol("k") * system.q[0]))
+
+    def test_invalid_processes(self) -> None:
+        system = self._create_particle_system(True)
+        with pytest.raises(ValueError):
+            system.form_eoms(eom_method=ParallelKanesMethod, processes=0)
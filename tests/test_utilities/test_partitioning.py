@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import pytest
+
+from symbrim.utilities.partitioning import find_partitions, select_partition
+from symbrim.zoo import CONFIGURATIONS
+
+_create_rolling_disc = CONFIGURATIONS["rolling_disc"].create_system
+
+
+class TestFindPartitions:
+    def test_rolling_disc(self) -> None:
+        system = _create_rolling_disc()
+        partitions = find_partitions(system)
+        assert len(partitions) > 1
+        assert partitions == sorted(
+            partitions, key=lambda p: (p.n_operations, p.n_operations_cse))
+        assert {p.constraint_solver for p in partitions} == {"LU"}
+        for partition in partitions:
+            assert not partition.q_dep
+            assert len(partition.u_dep) == 2
+            assert set(partition.u_ind).union(partition.u_dep) == set(system.u)
+
+    def test_constraint_solvers(self) -> None:
+        partitions = find_partitions(_create_rolling_disc(), ("LU", "CRAMER"))
+        assert {p.constraint_solver for p in partitions} == {"LU", "CRAMER"}
+
+    def test_max_candidates(self) -> None:
+        partitions = find_partitions(_create_rolling_disc(), max_candidates=1)
+        assert len(partitions) == 1
+        assert partitions[0].constraint_solver == "LU"
+
+    def test_holonomic(self, create_pendulum) -> None:
+        system = create_pendulum("holonomic")
+        partitions = find_partitions(system, ("LU",))
+        assert len(partitions) == 2
+        for partition in partitions:
+            assert partition.n_operations > 0
+            # The time derivative of the dependent coordinate is the dependent speed.
+            assert (system.q[:].index(partition.q_dep[0]) ==
+                    system.u[:].index(partition.u_dep[0]))
+
+    def test_unconstrained(self, create_pendulum) -> None:
+        partitions = find_partitions(create_pendulum("none"))
+        assert len(partitions) == 1
+        assert partitions[0].n_operations == 0
+        assert not partitions[0].u_dep
+        assert not partitions[0].q_dep
+
+    @pytest.mark.parametrize("constraint", [
+        "invalid_holonomic", "invalid_nonholonomic"])
+    def test_invalid_constraints(self, create_pendulum, constraint) -> None:
+        with pytest.raises(ValueError):
+            find_partitions(create_pendulum(constraint))
+
+
+def test_select_partition() -> None:
+    system = _create_rolling_disc()
+    partition = select_partition(system)
+    assert partition == find_partitions(_create_rolling_disc())[0]
+    assert system.u_dep[:] == partition.u_dep[:]
+    assert system.u_ind[:] == partition.u_ind[:]
+    system.validate_system()
+    system.form_eoms(constraint_solver=partition.constraint_solver)
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import pytest
+from sympy import Matrix, Mul, Symbol
+from sympy.physics.mechanics import Torque
+
+from symbrim.bicycle import KnifeEdgeWheel, NonHolonomicTire
+from symbrim.core import LoadGroupBase, ModelBase
+from symbrim.utilities.profiling import (
+    STAGES,
+    DefinitionProfiler,
+    OperationsNode,
+    ProfileNode,
+    StageProfile,
+    attribute_operations,
+    profile_definition,
+)
+from symbrim.utilities.utilities import count_operations
+from symbrim.zoo import CONFIGURATIONS
+
+
+class MyLoad(LoadGroupBase):
+    required_parent_type = KnifeEdgeWheel
+
+    def _define_loads(self) -> None:
+        super()._define_loads()
+        self.system.add_loads(
+            Torque(self.parent.frame, Symbol("T") * Symbol("r") * self.parent.frame.y))
+
+
+_create_rolling_disc = CONFIGURATIONS["rolling_disc"].create_model
+
+
+class TestDefinitionProfiler:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.disc = _create_rolling_disc()
+
+    def test_restores_methods(self) -> None:
+        define_kinematics = ModelBase.define_kinematics
+        with DefinitionProfiler(trace_memory=False) as profiler:
+            assert ModelBase.define_kinematics is not define_kinematics
+            with pytest.raises(RuntimeError):
+                profiler.__enter__()
+        assert ModelBase.define_kinematics is define_kinematics
+
+    def test_report(self) -> None:
+        with DefinitionProfiler() as profiler:
+            self.disc.define_all()
+            system = self.disc.to_system()
+        assert not tracemalloc.is_tracing()
+        report = profiler.get_report(self.disc)
+        assert (report.name, report.type_name) == ("disc", "RollingDisc")
+        assert [child.name for child in report.children] == [
+            "ground", "wheel", "tire"]
+        assert set(report.stages) == set(STAGES)
+        assert set(report.children[1].stages) == set(STAGES[:-1])
+        for _, node in report.walk():
+            assert all(profile.n_calls == 1 for profile in node.stages.values())
+            assert all(profile.wall_time >= 0 for profile in node.stages.values())
+        tire = report.children[2]
+        assert tire.stages["kinematics"].n_operations > 0
+        assert tire.stages["constraints"].n_operations > 0
+        assert tire.stages["constraints"].peak_memory > 0
+        assert report.stages["constraints"].n_operations == 0
+        assert report.stages["to_system"].n_operations > 0
+        assert len(system.nonholonomic_constraints) == 2
+
+    def test_load_group(self) -> None:
+        self.disc.wheel.add_load_groups(MyLoad("load"))
+        with DefinitionProfiler(trace_memory=False) as profiler:
+            self.disc.define_all()
+        load = profiler.get_report(self.disc).children[1].children[0]
+        assert load.name == "load"
+        assert load.stages["loads"].n_operations > 0
+        assert load.stages["loads"].peak_memory == 0
+
+    def test_without_counting_operations(self) -> None:
+        tracemalloc.start()
+        try:
+            report = profile_definition(self.disc, count_operations=False)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+        assert report.total.n_operations == 0
+        assert report.total.peak_memory > 0
+
+    def test_error_in_stage(self) -> None:
+        self.disc.ground = None
+        with DefinitionProfiler() as profiler, pytest.raises(AttributeError):
+            self.disc.define_all()
+        assert profiler.get_report(self.disc).stages["objects"].n_calls == 1
+
+    def test_redefinition(self) -> None:
+        profile_definition(self.disc, to_system=False)
+        self.disc.tire = NonHolonomicTire("tire")
+        report = profile_definition(self.disc, to_system=False)
+        ground, _, tire = report.children
+        assert ground.total.n_operations == 0
+        assert tire.stages["kinematics"].n_operations > 0
+
+
+class TestProfileNode:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.leaf = ProfileNode("leaf", "Leaf", {
+            "objects": StageProfile(1.0, 10, 2, 1),
+            "loads": StageProfile(2.0, 30, 3, 1)})
+        self.root = ProfileNode("root", "Root", {
+            "objects": StageProfile(0.5, 20, 1, 1)}, [self.leaf])
+
+    def test_totals(self) -> None:
+        assert self.leaf.own_total == StageProfile(3.0, 30, 5, 2)
+        assert self.root.total == StageProfile(3.5, 30, 6, 3)
+        assert self.root.get_stage_total("objects") == StageProfile(1.5, 20, 3, 2)
+        assert self.root.get_stage_total("to_system") == StageProfile()
+
+    def test_walk(self) -> None:
+        assert list(self.root.walk()) == [(0, self.root), (1, self.leaf)]
+
+    def test_to_string(self) -> None:
+        lines = str(self.root).splitlines()
+        assert lines[0].split() == ["object", *STAGES, "total"]
+        assert lines[1].split() == ["root", "(Root)", "0.5000", "3.5000"]
+        assert lines[2].startswith("  leaf (Leaf)")
+        assert lines[2].split()[-1] == "3.0000"
+        assert self.root.to_string("n_operations").splitlines()[1].split() == [
+            "root", "(Root)", "1", "6"]
+        with pytest.raises(ValueError):
+            self.root.to_string("invalid")
+
+
+class TestAttributeOperations:
+    @pytest.fixture(autouse=True)
+    def _setup(self) -> None:
+        self.disc = _create_rolling_disc()
+        self.disc.define_all()
+
+    def test_system(self) -> None:
+        system = self.disc.to_system()
+        system.apply_uniform_gravity(
+            -Symbol("g") * self.disc.ground.get_normal(self.disc.ground.origin))
+        system.u_ind = self.disc.u[2:]
+        system.u_dep = self.disc.u[:2]
+        system.form_eoms()
+        report = attribute_operations(self.disc, system)
+        assert [child.name for child in report.children] == [
+            "ground", "wheel", "tire"]
+        n_ops = [count_operations(system.mass_matrix),
+                 count_operations(system.forcing)]
+        for cse in (False, True):
+            assert report.get_total(cse) == pytest.approx(sum(
+                n_ops_expr[cse] for n_ops_expr in n_ops))
+        ground, wheel, _ = report.children
+        assert ground.get_total() == 0
+        assert wheel.n_operations["mass_matrix"] > 0
+        assert wheel.n_operations_cse["forcing"] > 0
+
+    def test_expressions(self) -> None:
+        q1, r = self.disc.q[0], self.disc.wheel.symbols["r"]
+        expr = r * q1.diff() + 2 * Symbol("g")
+        report = attribute_operations(self.disc, {"expr": expr,
+                                                  "matrix": Matrix([expr, expr])})
+        wheel = report.children[1]
+        assert report.n_operations == {"expr": 2.0, "matrix": 4.0}
+        assert report.n_operations_cse == {"expr": 2.0, "matrix": 2.0}
+        assert wheel.n_operations == {"expr": 1.0, "matrix": 2.0}
+        assert wheel.n_operations_cse == {"expr": 1.0, "matrix": 1.0}
+
+    def test_equal_nodes(self) -> None:
+        expr = self.disc.wheel.symbols["r"] * self.disc.q[1]
+        report = attribute_operations(self.disc, {"matrix": Matrix([
+            expr, Mul(*expr.args, evaluate=False)])})
+        assert report.children[1].n_operations == {"matrix": 1.0}
+        assert report.children[1].n_operations_cse == {"matrix": 0.5}
+
+    def test_load_group(self) -> None:
+        self.disc.wheel.add_load_groups(MyLoad("load"))
+        self.disc.define_all()
+        self.disc.wheel.load_groups[0].symbols.update({"T": Symbol("T"), "n": 2})
+        report = attribute_operations(self.disc, {"expr": Symbol("T") * Symbol("g")})
+        load = report.children[1].children[0]
+        assert load.name == "load"
+        assert load.n_operations == {"expr": 1.0}
+
+
+def test_operations_node_to_string() -> None:
+    leaf = OperationsNode("leaf", "Leaf", {"mm": 1.0, "f": 2.5}, {"mm": 1.0, "f": 2.0})
+    root = OperationsNode("root", "Root", {"mm": 0.5, "f": 0.0},
+                          {"mm": 0.5, "f": 0.0}, [leaf])
+    lines = str(root).splitlines()
+    assert lines[0].split() == ["object", "mm", "f", "total"]
+    assert lines[1].split() == ["root", "(Root)", "0.5", "0.0", "4.0"]
+    assert lines[2].startswith("  leaf (Leaf)")
+    assert root.to_string(cse=True).splitlines()[1].split()[-1] == "3.5"
+    assert list(root.walk()) == [(0, root), (1, leaf)]
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import pytest
-from sympy import S, acos, cos, sqrt, symbols
+from sympy import Matrix, Rational, S, acos, cos, count_ops, cse, sin, sqrt, symbols
 from sympy.abc import a, b, c
 from sympy.physics.mechanics import dynamicsymbols
 
-from symbrim.utilities.utilities import check_zero, random_eval
+from symbrim.utilities.utilities import (
+    check_zero,
+    count_operations,
+    lambdify_random_eval,
+    random_eval,
+)
 
 
 class TestRandomEval:
@@ -65,3 +70,51 @@ class TestCheckZero:
     def test_non_expression(self) -> None:
         assert check_zero(0.0)
         assert not check_zero(3.3)
+
+    def test_batch(self) -> None:
+        assert check_zero([acos(cos(a)) - a, a, 0.0, S.One, 3.3]) == [
+            True, False, True, False, False]
+
+    def test_matrix(self) -> None:
+        assert check_zero(Matrix([[sqrt(b**2) - b, b], [dynamicsymbols("x"), 0]])
+                          ) == [True, False, False, True]
+
+    def test_empty(self) -> None:
+        assert check_zero([]) == []
+
+    def test_cached(self) -> None:
+        expr = sqrt(dynamicsymbols("x", 1)**2) - dynamicsymbols("x", 1) + c
+        check_zero(expr)
+        hits = lambdify_random_eval.cache_info().hits
+        assert not check_zero(expr)
+        assert lambdify_random_eval.cache_info().hits == hits + 1
+
+
+class TestCountOperations:
+    @pytest.mark.parametrize(("expr", "expected"), [
+        (a + b, (1, 1)),
+        (a * b * c, (2, 2)),
+        (a + a * b, (2, 2)),
+        (b * sin(a) + sin(a), (4, 3)),
+        ((a + b) ** 2 + sin(a + b), (5, 4)),
+        (Rational(1, 2) * a + dynamicsymbols("x") * dynamicsymbols("x", 1), (4, 4)),
+        (Matrix([a + b, c * (a + b)]), (3, 2)),
+        ([a, (a + b, cos(a + b))], (3, 2)),
+        (S.One, (0, 0)),
+        (3, (0, 0)),
+    ])
+    def test_count(self, expr, expected) -> None:
+        assert count_operations(expr) == expected
+
+    def test_compare_to_count_ops(self) -> None:
+        expr = sin(a + b) * cos(a + b) + sqrt(sin(a + b) + c)
+        n_ops, n_ops_csed = count_operations(expr)
+        assert n_ops == count_ops(expr)
+        assert n_ops_csed == count_ops(cse(expr))
+
+    def test_shared_subexpressions(self) -> None:
+        # The expression tree grows exponentially, while the graph grows linearly.
+        expr = a
+        for _ in range(40):
+            expr = sin(expr) + cos(expr)
+        assert count_operations(expr) == (3 * (2 ** 40 - 1), 3 * 40)
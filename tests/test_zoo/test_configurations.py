@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from symbrim.zoo.configurations import CONFIGURATIONS
+
+
+@pytest.mark.parametrize("name", list(CONFIGURATIONS))
+def test_form_eoms(name) -> None:
+    config = CONFIGURATIONS[name]
+    assert config.name == name
+    system = config.create_system()
+    system.validate_system()
+    assert [qi.name for qi in system.q_dep] == list(config.q_dep)
+    assert [ui.name for ui in system.u_dep] == list(config.u_dep)
+    assert len(system.u_dep) == (len(system.holonomic_constraints) +
+                                 len(system.nonholonomic_constraints))
+    eoms = system.form_eoms(constraint_solver=config.constraint_solver)
+    assert eoms.shape == (len(system.u_ind), 1)
+
+
+class TestKey:
+    def test_stable(self) -> None:
+        config = CONFIGURATIONS["rolling_disc"]
+        assert config.get_key() == config.get_key()
+
+    def test_unique(self) -> None:
+        keys = {config.get_key() for config in CONFIGURATIONS.values()}
+        assert len(keys) == len(CONFIGURATIONS)
+
+    @pytest.mark.parametrize("changes", [
+        {"q_dep": ("disc_q1",)},
+        {"u_dep": ("disc_u1", "disc_u3")},
+        {"constraint_solver": "CRAMER"},
+    ])
+    def test_configuration(self, changes) -> None:
+        config = CONFIGURATIONS["rolling_disc"]
+        assert replace(config, **changes).get_key() != config.get_key()
+
+    def test_version(self, mocker) -> None:
+        config = CONFIGURATIONS["rolling_disc"]
+        key = config.get_key()
+        mocker.patch("symbrim.__version__", "0.0.0")
+        assert config.get_key() != key
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from symbrim import zoo
+from symbrim.zoo.__main__ import main
+from symbrim.zoo.loading import generate, get_directory, load
+
+
+def test_get_directory(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SYMBRIM_ZOO_DIRECTORY", raising=False)
+    assert get_directory() == Path.home() / ".cache" / "symbrim" / "zoo"
+    monkeypatch.setenv("SYMBRIM_ZOO_DIRECTORY", str(tmp_path))
+    assert get_directory() == tmp_path
+    assert get_directory(tmp_path / "zoo") == tmp_path / "zoo"
+
+
+class TestLoad:
+    def test_generate_and_load(self, tmp_path) -> None:
+        path = generate("rolling_disc", tmp_path / "zoo")
+        assert path == tmp_path / "zoo" / "rolling_disc.py"
+        module = load("rolling_disc", tmp_path / "zoo")
+        assert zoo.CONFIGURATIONS["rolling_disc"].get_key() == module.MODEL_KEY
+        x = np.linspace(0.1, 1.0, len(module.STATE))
+        p = np.linspace(1.0, 2.0, len(module.CONSTANTS))
+        assert module.eval_rhs(0.0, x, [], p).shape == x.shape
+
+    def test_missing(self, tmp_path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load("rolling_disc", tmp_path)
+        module = load("rolling_disc", tmp_path, generate_missing=True)
+        assert (tmp_path / "rolling_disc.py").exists()
+        assert module.STATE
+
+    def test_outdated(self, tmp_path) -> None:
+        generate("rolling_disc", tmp_path)
+        path = tmp_path / "rolling_disc.py"
+        path.write_text(path.read_text().replace("MODEL_KEY", "OLD_MODEL_KEY"))
+        with pytest.raises(ValueError):
+            load("rolling_disc", tmp_path)
+        module = load("rolling_disc", tmp_path, generate_missing=True)
+        assert zoo.CONFIGURATIONS["rolling_disc"].get_key() == module.MODEL_KEY
+
+    def test_unknown_configuration(self, tmp_path) -> None:
+        with pytest.raises(ValueError):
+            load("unknown", tmp_path)
+
+    def test_does_not_import_sympy(self, tmp_path) -> None:
+        generate("rolling_disc", tmp_path)
+        code = ("import sys; from symbrim.zoo import load; "
+                f"load('rolling_disc', {str(tmp_path)!r}); "
+                "assert 'sympy' not in sys.modules")
+        subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+class TestMain:
+    def test_generate(self, tmp_path, capsys) -> None:
+        main(["rolling_disc", "--directory", str(tmp_path)])
+        assert (tmp_path / "rolling_disc.py").exists()
+        assert "rolling_disc.py" in capsys.readouterr().out
+
+    def test_all(self, tmp_path, monkeypatch) -> None:
+        generated = []
+        monkeypatch.setattr("symbrim.zoo.__main__.generate",
+                            lambda *args: generated.append(args))
+        main(["--directory", str(tmp_path)])
+        assert generated == [(name, str(tmp_path)) for name in zoo.CONFIGURATIONS]
+
+    def test_unknown_configuration(self) -> None:
+        with pytest.raises(SystemExit):
+            main(["unknown"])